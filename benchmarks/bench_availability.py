@@ -0,0 +1,115 @@
+"""Compare the two paths ``calendar.find_free_slots`` takes.
+
+Run with ``python benchmarks/bench_availability.py``. Generates a quarter of
+synthetic busy blocks (several meetings per weekday) and times repeated
+one-week queries with working hours and a buffer: the freebusy path parses
+the window's busy blocks, merges them and computes free gaps and ranked
+slots; the covered single-calendar path answers from ``AvailabilityIndex``.
+Both rank slots with the same ``_rank_slots``, and the freebusy round trip
+the index saves is not timed, so this measures local CPU only: with a
+week's few dozen blocks the two paths cost about the same, since ranking
+and formatting the output dominate.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import datetime, time as clock, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aios_cofounder_mcp.availability import AvailabilityIndex  # noqa: E402
+from aios_cofounder_mcp.google.calendar import (  # noqa: E402
+    _fetched_availability,
+    _indexed_availability,
+    _rank_slots,
+    _working_windows,
+)
+
+QUARTER_DAYS = 91
+MEETINGS_PER_DAY = 8
+QUERIES = 500
+DURATION_MINUTES = 30
+BUFFER = timedelta(minutes=10)
+WORKING_HOURS = (clock(8), clock(18))
+QUARTER_START = datetime(2025, 1, 6, tzinfo=timezone.utc)
+QUARTER_END = QUARTER_START + timedelta(days=QUARTER_DAYS)
+
+
+def _quarter_of_busy(seed: int = 7) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    origin = QUARTER_START
+    busy: list[dict[str, str]] = []
+    for day in range(QUARTER_DAYS):
+        day_start = origin + timedelta(days=day)
+        if day_start.weekday() >= 5:
+            continue
+        for _ in range(MEETINGS_PER_DAY):
+            start = day_start + timedelta(hours=8, minutes=5 * rng.randrange(0, 120))
+            end = start + timedelta(minutes=rng.choice([15, 30, 45, 60, 90]))
+            busy.append({"start": start.isoformat(), "end": end.isoformat()})
+    return busy
+
+
+def _windows(seed: int = 11) -> list[tuple[datetime, datetime]]:
+    rng = random.Random(seed)
+    origin = QUARTER_START
+    windows = []
+    for _ in range(QUERIES):
+        start = origin + timedelta(days=rng.randrange(0, QUARTER_DAYS - 7))
+        windows.append((start, start + timedelta(days=7)))
+    return windows
+
+
+def _in_window(busy: list[dict[str, str]], start: datetime, end: datetime) -> list[dict[str, str]]:
+    # freebusy returns only the blocks overlapping the window, as ISO strings
+    return [item for item in busy if item["start"] < end.isoformat() and item["end"] > start.isoformat()]
+
+
+def _freebusy_query(blocks: list[dict[str, str]], start: datetime, end: datetime) -> list[dict[str, object]]:
+    _, _, gaps = _fetched_availability([blocks], start.isoformat(), end.isoformat(), DURATION_MINUTES, BUFFER)
+    return _rank(gaps, start, end)
+
+
+def _indexed_query(index: AvailabilityIndex, start: datetime, end: datetime) -> list[dict[str, object]]:
+    _, _, gaps = _indexed_availability(index, start, end, DURATION_MINUTES, BUFFER)
+    return _rank(gaps, start, end)
+
+
+def _rank(gaps, start: datetime, end: datetime) -> list[dict[str, object]]:
+    windows = _working_windows(start, end, timezone.utc, WORKING_HOURS, include_weekends=False)
+    return _rank_slots(gaps, windows, duration=timedelta(minutes=DURATION_MINUTES), tz=timezone.utc)
+
+
+def _time(label: str, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed * 1000:9.2f} ms total  {elapsed / QUERIES * 1e6:9.1f} us/query")
+    return elapsed
+
+
+def main() -> None:
+    busy = _quarter_of_busy()
+    windows = _windows()
+    print(f"{len(busy)} busy blocks over {QUARTER_DAYS} days, {QUERIES} one-week queries")
+
+    started = time.perf_counter()
+    index = AvailabilityIndex()
+    index.load_busy(QUARTER_START, QUARTER_END, busy)
+    print(f"{'index build':<32} {(time.perf_counter() - started) * 1000:9.2f} ms")
+
+    # the freebusy responses are prepared up front; their network round trip is not timed
+    responses = [_in_window(busy, start, end) for start, end in windows]
+    queries = list(zip(responses, windows))
+    assert all(_freebusy_query(blocks, *window) == _indexed_query(index, *window) for blocks, window in queries[:20])
+    baseline = _time("freebusy path", lambda: [_freebusy_query(blocks, *window) for blocks, window in queries])
+    indexed = _time("AvailabilityIndex path", lambda: [_indexed_query(index, start, end) for start, end in windows])
+    print(f"speedup: {baseline / indexed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare the streaming ``TextExtractor`` against the previous BeautifulSoup extraction.
+
+Run with ``python benchmarks/bench_web_extract.py [DIR]``. ``DIR`` holds saved
+pages (``*.html``/``*.htm``, e.g. from "Save page as"); without it a corpus of
+synthetic pages from 20 KB to a few MB is generated, with navigation, inline
+scripts and footers around the article text. Each page is extracted once by
+both implementations; the extractor is fed 64 KB chunks, as ``web.fetch`` does.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from aios_cofounder_mcp.web.extract import TextExtractor  # noqa: E402
+
+CHUNK_CHARS = 64 * 1024
+PAGE_PARAGRAPHS = [40, 200, 1000, 5000, 20000]
+WORDS = "revenue pipeline hiring customers quarter launch pricing churn roadmap board investors product".split()
+
+
+def _synthetic_page(rng: random.Random, paragraphs: int) -> str:
+    nav = "".join(f'<li><a href="/{word}">{word.title()}</a></li>' for word in WORDS)
+    parts = [
+        f"<html><head><title>Synthetic {paragraphs}</title><style>body{{margin:0}}</style>",
+        "<script>" + "window.__data = {};" * 200 + "</script></head><body>",
+        f'<header><nav><ul>{nav}</ul></nav></header><div class="sidebar" role="complementary"><ul>{nav}</ul></div><main>',
+    ]
+    for index in range(paragraphs):
+        if index % 25 == 0:
+            parts.append(f"<h2>Section {index // 25}</h2>")
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 80)))
+        parts.append(f'<p class="body">{words} <a href="/x">link</a> &amp; <b>more</b>.</p>')
+    parts.append(f"</main><footer><p>Copyright</p><ul>{nav}</ul></footer></body></html>")
+    return "".join(parts)
+
+
+def _corpus(directory: str | None) -> list[str]:
+    if directory:
+        paths = sorted(path for path in Path(directory).iterdir() if path.suffix.lower() in {".html", ".htm"})
+        return [path.read_text(encoding="utf-8", errors="replace") for path in paths]
+    rng = random.Random(5)
+    return [_synthetic_page(rng, paragraphs) for paragraphs in PAGE_PARAGRAPHS]
+
+
+def _beautifulsoup(html: str) -> tuple[str | None, str]:
+    # the extraction web.fetch used before the streaming parser
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    text = " ".join(p.get_text(strip=True) for p in soup.find_all("p"))
+    return (soup.title.get_text(strip=True) if soup.title else None), text
+
+
+def _streaming(html: str) -> tuple[str | None, str]:
+    parser = TextExtractor()
+    for start in range(0, len(html), CHUNK_CHARS):
+        parser.feed(html[start : start + CHUNK_CHARS])
+    parser.close()
+    return parser.result()
+
+
+def _measure(fn, html: str) -> tuple[float, int]:
+    # timed and memory-traced separately; tracemalloc slows allocation-heavy code
+    started = time.perf_counter()
+    fn(html)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    fn(html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    pages = _corpus(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"{len(pages)} pages, {sum(len(page) for page in pages) / 1e6:.1f} M chars")
+    print(f"{'page KB':>9} {'bs4 ms':>10} {'stream ms':>10} {'bs4 peak MB':>12} {'stream peak MB':>15}")
+    totals = [0.0, 0.0]
+    for html in pages:
+        (baseline, baseline_peak), (streamed, streamed_peak) = _measure(_beautifulsoup, html), _measure(_streaming, html)
+        totals[0] += baseline
+        totals[1] += streamed
+        print(
+            f"{len(html) / 1024:9.0f} {baseline * 1000:10.1f} {streamed * 1000:10.1f} "
+            f"{baseline_peak / 1e6:12.1f} {streamed_peak / 1e6:15.1f}"
+        )
+    print(f"speedup: {totals[0] / totals[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
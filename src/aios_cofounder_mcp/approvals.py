@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import json
+import logging
+import threading
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
-from .storage.repo import Repository
+from .settings import Settings, settings
+from .storage.repo import Repository, canonical_payload_hash
+
+_logger = logging.getLogger("aios_cofounder_mcp.approvals")
 
 
 @dataclass
@@ -13,6 +20,13 @@ class ApprovalCheck:
     approval_id: int | None
 
 
+def _is_stale(created_at: str | None, ttl_seconds: int) -> bool:
+    if ttl_seconds <= 0 or not created_at:
+        return False
+    created = datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - created).total_seconds() > ttl_seconds
+
+
 def ensure_approval(
     repo: Repository,
     action: str,
@@ -20,12 +34,54 @@ def ensure_approval(
     approval_id: int | None,
 ) -> ApprovalCheck:
     if approval_id is None:
-        created_id = repo.create_approval(action, payload)
+        created_id = repo.create_approval(action, payload, ttl_seconds=settings.approval_ttl_seconds)
         return ApprovalCheck(ok=False, status="approval_required", approval_id=created_id)
 
     approval = repo.get_approval(approval_id)
     if not approval:
         return ApprovalCheck(ok=False, status="approval_not_found", approval_id=approval_id)
+    # an approval only covers the exact action and arguments it was created for
+    if approval["action"] != action:
+        return ApprovalCheck(ok=False, status="approval_action_mismatch", approval_id=approval_id)
+    approved_hash = approval.get("payload_hash") or canonical_payload_hash(json.loads(approval["payload"]))
+    if approved_hash != canonical_payload_hash(payload):
+        return ApprovalCheck(ok=False, status="approval_payload_mismatch", approval_id=approval_id)
+    if approval["status"] == "pending" and _is_stale(approval["created_at"], settings.approval_ttl_seconds):
+        # the sweeper only runs every APPROVAL_SWEEP_INTERVAL_SECONDS
+        return ApprovalCheck(ok=False, status="approval_expired", approval_id=approval_id)
     if approval["status"] != "approved":
         return ApprovalCheck(ok=False, status=f"approval_{approval['status']}", approval_id=approval_id)
     return ApprovalCheck(ok=True, status="approved", approval_id=approval_id)
+
+
+def sweep_expired_approvals(repo: Repository, ttl_seconds: int, batch_size: int = 500) -> int:
+    """Expire stale pending approvals in batches; returns how many were expired."""
+    total = 0
+    while True:
+        expired = repo.expire_approvals(ttl_seconds, batch_size)
+        total += len(expired)
+        if len(expired) < batch_size:
+            return total
+
+
+def start_expiry_sweeper(repo: Repository, settings: Settings) -> threading.Event | None:
+    """Run :func:`sweep_expired_approvals` every sweep interval on a daemon thread.
+
+    Returns an event that stops the sweeper when set, or ``None`` if expiry is disabled.
+    """
+    if settings.approval_ttl_seconds <= 0 or settings.approval_sweep_interval_seconds <= 0:
+        return None
+    stop = threading.Event()
+
+    def _run() -> None:
+        while not stop.wait(settings.approval_sweep_interval_seconds):
+            try:
+                expired = sweep_expired_approvals(repo, settings.approval_ttl_seconds, settings.approval_sweep_batch_size)
+            except Exception:
+                _logger.exception("approval expiry sweep failed")
+                continue
+            if expired:
+                _logger.info("expired %s pending approvals", expired)
+
+    threading.Thread(target=_run, name="approval-sweeper", daemon=True).start()
+    return stop
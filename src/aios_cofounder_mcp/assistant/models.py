@@ -5,14 +5,6 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
-class ToolResponse(BaseModel):
-    ok: bool = Field(..., description="Whether the tool completed successfully")
-    data: dict[str, Any] | None = Field(default=None, description="Tool output payload")
-    error: str | None = Field(default=None, description="Machine-readable error")
-    status: str | None = Field(default=None, description="Status hint for next action")
-    approval_id: int | None = Field(default=None, description="Approval id if required")
-
-
 class EmailSummary(BaseModel):
     message_id: str
     summary: str
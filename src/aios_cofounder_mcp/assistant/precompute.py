@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from ..google import calendar as calendar_client
+from ..settings import Settings
+from ..storage.repo import Repository
+from . import service
+
+_logger = logging.getLogger("aios_cofounder_mcp.assistant.precompute")
+
+
+def precompute_meeting_briefs(settings: Settings, repo: Repository, hours: int) -> int:
+    """Build briefs for meetings with attendees starting within ``hours``; returns how many were built or refreshed."""
+    now = datetime.now(timezone.utc)
+    events = calendar_client.list_events(
+        settings,
+        repo,
+        now.isoformat().replace("+00:00", "Z"),
+        (now + timedelta(hours=hours)).isoformat().replace("+00:00", "Z"),
+    )
+    built = 0
+    for event in events:
+        if not event.get("id") or not event.get("attendees") or event.get("status") == "cancelled":
+            continue
+        service.meeting_brief(settings, repo, event["id"], event=event)
+        built += 1
+    return built
+
+
+def start_brief_precompute(repo: Repository, settings: Settings) -> threading.Event | None:
+    """Keep briefs for upcoming meetings warm on a daemon thread; returns a stop event."""
+    if settings.brief_precompute_hours <= 0 or settings.brief_precompute_interval_seconds <= 0:
+        return None
+    stop = threading.Event()
+
+    def _run() -> None:
+        while True:
+            try:
+                built = precompute_meeting_briefs(settings, repo, settings.brief_precompute_hours)
+                _logger.debug("precomputed %s meeting briefs", built)
+            except RuntimeError as exc:
+                # typically calendar_not_connected; try again next round
+                _logger.debug("meeting brief precompute skipped: %s", exc)
+            except Exception:
+                _logger.exception("meeting brief precompute failed")
+            if stop.wait(settings.brief_precompute_interval_seconds):
+                return
+
+    threading.Thread(target=_run, name="brief-precompute", daemon=True).start()
+    return stop
@@ -1,33 +1,146 @@
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
 
 from ..google import gmail as gmail_client
 from ..google import calendar as calendar_client
+from ..dispatch import check_cancelled, report_progress
 from ..storage.repo import Repository
 from ..settings import Settings
+from .. import search_index
+from . import summarizer
 
 
-def _trim(text: str | None, limit: int = 400) -> str:
-    if not text:
-        return ""
-    cleaned = " ".join(text.split())
-    return cleaned[:limit]
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(f"{summarizer.SUMMARIZER_VERSION}\0{text}".encode("utf-8")).hexdigest()
 
 
-def summarize_email(settings: Settings, repo: Repository, message_id: str) -> dict[str, Any]:
-    message = gmail_client.get_message(settings, repo, message_id)
-    summary = _trim(message.get("text") or message.get("snippet") or "", 400)
-    note = repo.add_note(source=f"gmail:{message_id}", summary=summary)
+def _note_result(message_id: str, note: dict[str, Any]) -> dict[str, Any]:
     return {
         "message_id": message_id,
-        "summary": summary,
+        "summary": note.get("summary", ""),
         "note_id": int(note.get("id", 0)),
     }
 
 
-def meeting_brief(settings: Settings, repo: Repository, event_id: str) -> dict[str, Any]:
-    event = calendar_client.get_event(settings, repo, event_id)
+def summarize_email(settings: Settings, repo: Repository, message_id: str) -> dict[str, Any]:
+    """Summarize a message once; later calls return the stored note without touching Gmail."""
+    source = f"gmail:{message_id}"
+    note = repo.get_note(source, summarizer.SUMMARIZER_VERSION)
+    if note:
+        return _note_result(message_id, note)
+    message = gmail_client.get_message(settings, repo, message_id)
+    text = message.get("text") or message.get("snippet") or ""
+    content_hash = _content_hash(text)
+    # identical bodies (resends, the same mail under another id) reuse the earlier summary
+    existing = repo.get_note_by_hash(content_hash)
+    summary = existing["summary"] if existing else summarizer.summarize(text)
+    note = repo.add_note(source, summary, content_hash=content_hash, version=summarizer.SUMMARIZER_VERSION)
+    return _note_result(message_id, note)
+
+
+def _parse_raw(detail: dict[str, Any]) -> dict[str, Any]:
+    # runs in a worker process: MIME parsing is CPU-bound
+    message = gmail_client.parse_raw_message(detail)
+    text = message.get("text") or message.get("snippet") or ""
+    return {"text": text, "content_hash": _content_hash(text), "document": search_index.message_document(message)}
+
+
+_summary_pool: ProcessPoolExecutor | None = None
+_summary_pool_lock = threading.Lock()
+
+
+def _pool_map(settings: Settings, fn: Callable[[Any], Any], items: list[Any]) -> Iterator[Any]:
+    global _summary_pool
+    if settings.summarize_workers <= 0 or len(items) <= 1:
+        return map(fn, items)
+    with _summary_pool_lock:
+        if _summary_pool is None:
+            # spawn: forking a process that is running tool threads is unsafe
+            _summary_pool = ProcessPoolExecutor(
+                max_workers=settings.summarize_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        pool = _summary_pool
+    chunksize = max(1, len(items) // (settings.summarize_workers * 4))
+    return pool.map(fn, items, chunksize=chunksize)
+
+
+def summarize_emails(settings: Settings, repo: Repository, message_ids: Iterable[str]) -> dict[str, Any]:
+    """Summarize many messages: stored notes are reused, the rest are fetched
+    concurrently, parsed and summarized on a process pool and written in one
+    transaction. As in ``summarize_email``, a body summarized before (under
+    any id) reuses that summary, and identical bodies are summarized once.
+
+    Each finished or failed message is reported as MCP progress so clients
+    that asked for it can show summaries as they arrive.
+    """
+    message_ids = list(dict.fromkeys(message_ids))
+    total = len(message_ids)
+    results: dict[str, dict[str, Any]] = {}
+    stored = repo.get_notes([f"gmail:{message_id}" for message_id in message_ids], summarizer.SUMMARIZER_VERSION)
+    for message_id in message_ids:
+        note = stored.get(f"gmail:{message_id}")
+        if note:
+            results[message_id] = {**_note_result(message_id, note), "cached": True}
+    done = len(results)
+    if done:
+        report_progress(done, total, f"{done} already summarized")
+
+    pending = [message_id for message_id in message_ids if message_id not in results]
+    fetched = gmail_client.get_raw_messages(settings, repo, pending) if pending else []
+    details: list[tuple[str, dict[str, Any]]] = []
+    for message_id, detail in zip(pending, fetched):
+        if "error" in detail:
+            results[message_id] = {"message_id": message_id, "error": detail["error"]}
+            done += 1
+            report_progress(done, total, f"{message_id}: {detail['error']}")
+        else:
+            details.append((message_id, detail))
+
+    parsed = list(_pool_map(settings, _parse_raw, [detail for _, detail in details]))
+    check_cancelled()
+    known = {
+        content_hash: note["summary"]
+        for content_hash, note in repo.get_notes_by_hash([page["content_hash"] for page in parsed]).items()
+    }
+    texts: dict[str, str] = {}
+    for page in parsed:
+        if page["content_hash"] not in known:
+            texts.setdefault(page["content_hash"], page["text"])
+    # summaries arrive in first-appearance order, so each message needs at most the next one
+    computed = zip(texts, _pool_map(settings, summarizer.summarize, list(texts.values())))
+
+    summaries: list[tuple[str, dict[str, Any]]] = []
+    for (message_id, _), page in zip(details, parsed):
+        check_cancelled()
+        if page["content_hash"] not in known:
+            content_hash, summary = next(computed)
+            known[content_hash] = summary
+        summary = {**page, "summary": known[page["content_hash"]]}
+        summaries.append((message_id, summary))
+        done += 1
+        report_progress(done, total, f"{message_id}: {summary['summary'][:120]}")
+
+    notes = repo.add_notes(
+        ((f"gmail:{message_id}", summary["summary"], summary["content_hash"]) for message_id, summary in summaries),
+        version=summarizer.SUMMARIZER_VERSION,
+    )
+    search_index.add_documents(repo, [summary["document"] for _, summary in summaries])
+    for (message_id, _), note in zip(summaries, notes):
+        results[message_id] = {**_note_result(message_id, note), "cached": False}
+    return {
+        "results": [results[message_id] for message_id in message_ids],
+        "summarized": len(summaries),
+        "cached": len(stored),
+        "failed": total - len(summaries) - len(stored),
+    }
+
+
+def _build_meeting_brief(settings: Settings, repo: Repository, event: dict[str, Any]) -> dict[str, Any]:
     attendees = [att.get("email") for att in event.get("attendees", []) if att.get("email")]
     purpose = event.get("summary")
     recent_emails: list[dict[str, Any]] = []
@@ -43,7 +156,7 @@ def meeting_brief(settings: Settings, repo: Repository, event_id: str) -> dict[s
     if attendees:
         talking_points.append("Align on next steps and ownership")
     return {
-        "event_id": event_id,
+        "event_id": event.get("id"),
         "attendees": attendees,
         "purpose": purpose,
         "recent_emails": recent_emails,
@@ -51,6 +164,28 @@ def meeting_brief(settings: Settings, repo: Repository, event_id: str) -> dict[s
     }
 
 
+def meeting_brief(
+    settings: Settings,
+    repo: Repository,
+    event_id: str,
+    event: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Brief for ``event_id``, reused while the event's ``updated`` stamp is unchanged.
+
+    ``event`` may be passed when the caller already holds it (the precompute
+    loop), saving the ``events.get`` round trip.
+    """
+    if event is None:
+        event = calendar_client.get_event(settings, repo, event_id)
+    updated = event.get("updated") or ""
+    cached = repo.get_meeting_brief(event_id, updated, settings.meeting_brief_max_age_seconds)
+    if cached is not None:
+        return cached
+    brief = {**_build_meeting_brief(settings, repo, event), "event_id": event_id}
+    repo.save_meeting_brief(event_id, updated, brief)
+    return brief
+
+
 def compose_email_reply(context: str, tone: str | None) -> dict[str, Any]:
     tone_hint = tone or "professional"
     body = (
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+try:  # optional: vectorized scoring when numpy is available
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+# part of the note content hash and lookup key: bump when cleaning, splitting or scoring changes
+# so bodies are re-summarized
+SUMMARIZER_VERSION = "2"
+
+_QUOTE_HEADERS = (
+    re.compile(r"^\s*On .{0,200}wrote:\s*$", re.IGNORECASE),
+    re.compile(r"^\s*-{2,}\s*(Original|Forwarded) Message\s*-{2,}\s*$", re.IGNORECASE),
+    re.compile(r"^\s*_{10,}\s*$"),
+    re.compile(r"^\s*From:\s.+$"),
+)
+_SIGNATURE_MARKERS = (
+    re.compile(r"^--\s*$"),
+    re.compile(r"^\s*Sent from my \w+", re.IGNORECASE),
+    re.compile(r"^\s*Get Outlook for \w+", re.IGNORECASE),
+)
+_SIGN_OFF = re.compile(
+    r"^\s*(best|best regards|regards|kind regards|warm regards|cheers|thanks|thank you|many thanks|sincerely)[,!.]?\s*$",
+    re.IGNORECASE,
+)
+# break after terminal punctuation and up to two closing quotes/brackets, which stay with the sentence
+# (lookbehinds are fixed-width, hence one per length)
+_SENTENCE_BREAK = re.compile(
+    r"(?:(?<=[.!?])|(?<=[.!?][\"')\]])|(?<=[.!?][\"')\]]{2}))\s+(?=[\"'(\[]?[A-Z0-9])"
+)
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9'_-]*")
+_STOPWORDS = frozenset(
+    """a about above after again all also am an and any are as at be because been before being below between both
+    but by can could did do does doing down during each few for from further had has have having he her here hers
+    him his how i if in into is it its itself just let me more most my no nor not now of off on once only or other
+    our ours out over own please same she should so some such than that the their theirs them then there these they
+    this those through to too under until up very was we were what when where which while who whom why will with
+    would you your yours""".split()
+)
+
+_DAMPING = 0.85
+_ITERATIONS = 50
+_TOLERANCE = 1e-6
+_MAX_SENTENCES = 200
+
+
+def clean_body(text: str) -> str:
+    """Drop quoted replies, forwarded history and the trailing signature."""
+    kept: list[str] = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        if any(pattern.match(line) for pattern in _QUOTE_HEADERS) and kept:
+            break
+        if any(pattern.match(line) for pattern in _SIGNATURE_MARKERS):
+            break
+        if line.lstrip().startswith(">"):
+            continue
+        kept.append(line)
+    # a short sign-off near the end ("Thanks,\nAlex") starts the signature block
+    for index in range(len(kept) - 1, max(len(kept) - 6, -1), -1):
+        if _SIGN_OFF.match(kept[index]):
+            kept = kept[:index]
+            break
+    return "\n".join(kept).strip()
+
+
+def split_sentences(text: str) -> list[str]:
+    sentences: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        flattened = " ".join(paragraph.split())
+        if not flattened:
+            continue
+        for sentence in _SENTENCE_BREAK.split(flattened):
+            sentence = sentence.strip()
+            if sentence:
+                sentences.append(sentence)
+    return sentences[:_MAX_SENTENCES]
+
+
+def _tokens(sentence: str) -> list[str]:
+    return [token for token in _TOKEN.findall(sentence.lower()) if token not in _STOPWORDS and len(token) > 1]
+
+
+def _rank_numpy(counts: list[Counter[str]]) -> list[float]:
+    vocabulary = {term: index for index, term in enumerate(sorted({term for count in counts for term in count}))}
+    tf = np.zeros((len(counts), len(vocabulary)))
+    for row, count in enumerate(counts):
+        for term, value in count.items():
+            tf[row, vocabulary[term]] = value
+    idf = np.log((1 + len(counts)) / (1 + np.count_nonzero(tf, axis=0))) + 1.0
+    weights = tf * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    weights = np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+    similarity = weights @ weights.T
+    np.fill_diagonal(similarity, 0.0)
+    totals = similarity.sum(axis=1, keepdims=True)
+    transition = np.divide(similarity, totals, out=np.zeros_like(similarity), where=totals > 0)
+    size = len(counts)
+    scores = np.full(size, 1.0 / size)
+    for _ in range(_ITERATIONS):
+        updated = (1 - _DAMPING) / size + _DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < _TOLERANCE:
+            scores = updated
+            break
+        scores = updated
+    return scores.tolist()
+
+
+def _rank_python(counts: list[Counter[str]]) -> list[float]:
+    size = len(counts)
+    document_frequency: Counter[str] = Counter()
+    for count in counts:
+        document_frequency.update(count.keys())
+    vectors: list[dict[str, float]] = []
+    for count in counts:
+        vector = {term: value * (math.log((1 + size) / (1 + document_frequency[term])) + 1.0) for term, value in count.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        vectors.append({term: weight / norm for term, weight in vector.items()} if norm else {})
+    similarity = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1, size):
+            small, large = (vectors[i], vectors[j]) if len(vectors[i]) <= len(vectors[j]) else (vectors[j], vectors[i])
+            value = sum(weight * large.get(term, 0.0) for term, weight in small.items())
+            similarity[i][j] = similarity[j][i] = value
+    totals = [sum(row) for row in similarity]
+    scores = [1.0 / size] * size
+    for _ in range(_ITERATIONS):
+        updated = [
+            (1 - _DAMPING) / size
+            + _DAMPING * sum(similarity[j][i] / totals[j] * scores[j] for j in range(size) if totals[j])
+            for i in range(size)
+        ]
+        delta = sum(abs(a - b) for a, b in zip(updated, scores))
+        scores = updated
+        if delta < _TOLERANCE:
+            break
+    return scores
+
+
+def rank_sentences(sentences: list[str]) -> list[float]:
+    """TextRank over TF-IDF cosine similarity; one score per sentence."""
+    if not sentences:
+        return []
+    counts = [Counter(_tokens(sentence)) for sentence in sentences]
+    if len(sentences) == 1:
+        return [1.0]
+    return _rank_numpy(counts) if np is not None else _rank_python(counts)
+
+
+def summarize(text: str | None, max_sentences: int = 3, max_chars: int = 400) -> str:
+    """Extractive summary: the top ``max_sentences`` sentences in their original order."""
+    if not text:
+        return ""
+    sentences = split_sentences(clean_body(text)) or split_sentences(text)
+    if not sentences:
+        return ""
+    scores = rank_sentences(sentences)
+    # ties (e.g. unrelated sentences) fall back to position, which favours the opening
+    ranked = sorted(range(len(sentences)), key=lambda index: (-round(scores[index], 9), index))
+    chosen = sorted(ranked[:max_sentences])
+    summary = " ".join(sentences[index] for index in chosen)
+    return summary[:max_chars]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+from .. import search_index
+from ..google import gmail as gmail_client
+from ..settings import Settings
+from ..storage.repo import Repository
+from . import summarizer
+
+_RECENT_DIGESTS = 10
+# fingerprints of paragraphs already folded in; old ones matter less as a thread moves on
+_MAX_SEEN_PARAGRAPHS = 2000
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _fingerprint(paragraph: str) -> str:
+    return hashlib.sha1(" ".join(paragraph.lower().split()).encode("utf-8")).hexdigest()[:16]
+
+
+def _new_content(text: str, seen: dict[str, None]) -> str:
+    """Drop quoted history, then any paragraph an earlier message in the thread already contained."""
+    kept = []
+    for paragraph in _PARAGRAPH_BREAK.split(summarizer.clean_body(text)):
+        if not paragraph.strip():
+            continue
+        key = _fingerprint(paragraph)
+        if key in seen:
+            continue
+        seen[key] = None
+        kept.append(paragraph)
+    return "\n\n".join(kept)
+
+
+def _digest(detail: dict[str, Any], seen: dict[str, None]) -> tuple[dict[str, Any], dict[str, Any]]:
+    message = gmail_client.parse_raw_message(detail)
+    content = _new_content(message.get("text") or message.get("snippet") or "", seen)
+    received = detail.get("internalDate")
+    return message, {
+        "id": message.get("id"),
+        "from": message.get("from"),
+        "date": datetime.fromtimestamp(int(received) / 1000, timezone.utc).isoformat() if received else None,
+        "summary": summarizer.summarize(content, max_sentences=2, max_chars=240),
+    }
+
+
+def _result(state: dict[str, Any], new_messages: int, incomplete: bool = False) -> dict[str, Any]:
+    digests = state["digests"]
+    return {
+        "thread_id": state["thread_id"],
+        "overview": state["summary"],
+        "latest": digests[-1] if digests else None,
+        "message_count": state["message_count"],
+        "new_messages": new_messages,
+        "incomplete": incomplete,
+        "recent": digests[-_RECENT_DIGESTS:],
+    }
+
+
+def summarize_thread(settings: Settings, repo: Repository, thread_id: str, rebuild: bool = False) -> dict[str, Any]:
+    """Rolling thread summary that only fetches messages added since the last refresh.
+
+    A ``format=minimal`` listing gives the message ids and ``historyId``; an
+    unchanged ``historyId`` returns the stored summary, otherwise only the
+    messages after ``last_message_id`` are fetched. Quoted replies and
+    paragraphs already seen earlier in the thread are dropped before each
+    new message is summarized into a per-message digest.
+    """
+    index = gmail_client.get_thread_index(settings, repo, thread_id)
+    message_ids = [message["id"] for message in index.get("messages", [])]
+    history_id = index.get("historyId")
+    state = None if rebuild else repo.get_thread_summary(thread_id)
+    if state and state["history_id"] == history_id and state["last_message_id"] == (message_ids[-1] if message_ids else None):
+        return _result(state, new_messages=0)
+
+    if state and state["last_message_id"] in message_ids:
+        pending = message_ids[message_ids.index(state["last_message_id"]) + 1 :]
+        present = set(message_ids)
+        # messages deleted from the thread drop out of the digest list
+        digests = [digest for digest in state["digests"] if digest["id"] in present]
+        seen = dict.fromkeys(state["seen_paragraphs"])
+        last_message_id = state["last_message_id"]
+    else:
+        pending = message_ids
+        digests, seen, last_message_id = [], {}, None
+
+    incomplete = False
+    parsed = []
+    for message_id, detail in zip(pending, gmail_client.get_raw_messages(settings, repo, pending)):
+        if "error" in detail:
+            # keep what was folded so far; the next refresh resumes at this message
+            incomplete = True
+            break
+        message, digest = _digest(detail, seen)
+        parsed.append(message)
+        digests.append(digest)
+        last_message_id = message_id
+    search_index.index_messages(repo, parsed)
+
+    summary = summarizer.summarize(
+        "\n\n".join(digest["summary"] for digest in digests if digest["summary"]), max_sentences=4, max_chars=800
+    )
+    state = {
+        "thread_id": thread_id,
+        "history_id": None if incomplete else history_id,
+        "last_message_id": last_message_id,
+        "message_count": len(digests),
+        "summary": summary,
+        "digests": digests,
+        "seen_paragraphs": list(seen)[-_MAX_SEEN_PARAGRAPHS:],
+    }
+    repo.save_thread_summary(**state)
+    return _result(state, new_messages=len(parsed), incomplete=incomplete)
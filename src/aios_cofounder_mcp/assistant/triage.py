@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from email.utils import parseaddr
+from typing import Any, Iterator
+
+from ..google import gmail as gmail_client
+from ..settings import Settings
+from ..storage.repo import Repository
+
+# feature -> weight; a message's score is the weighted sum of its features
+WEIGHTS: dict[str, float] = {
+    "known_sender": 3.0,
+    "sender_frequency": 1.0,
+    "recency": 2.0,
+    "important": 2.0,
+    "starred": 1.5,
+    "unread": 1.0,
+    "keywords": 1.5,
+    "bulk": -5.0,
+}
+_HALF_LIFE_HOURS = 24.0
+_BULK_LABELS = frozenset({"CATEGORY_PROMOTIONS", "CATEGORY_SOCIAL", "CATEGORY_UPDATES", "CATEGORY_FORUMS", "SPAM"})
+_SHOWN_LABELS = ("IMPORTANT", "STARRED", "UNREAD")
+_AUTOMATED_SENDER = re.compile(r"no-?reply|do-?not-?reply|notifications?@|mailer-daemon", re.IGNORECASE)
+_HEADERS = ("From", "Subject", "Date", "List-Unsubscribe")
+
+
+def _keywords(raw: str) -> list[str]:
+    return [keyword.strip().lower() for keyword in raw.split(",") if keyword.strip()]
+
+
+def _pages(
+    settings: Settings, repo: Repository, query: str, cursor: str | None, scan: int
+) -> Iterator[tuple[list[str], str | None]]:
+    page_size = max(1, min(scan, settings.triage_batch_size))
+    scanned = 0
+    for message_ids, next_token in gmail_client.message_id_pages(settings, repo, query, page_size, cursor):
+        scanned += len(message_ids)
+        yield message_ids, next_token
+        if scanned >= scan:
+            return
+
+
+def _with_metadata(
+    settings: Settings, repo: Repository, pages: Iterator[tuple[list[str], str | None]]
+) -> Iterator[tuple[list[dict[str, Any]], str | None]]:
+    for message_ids, next_token in pages:
+        yield (gmail_client.get_metadata(settings, repo, message_ids, _HEADERS) if message_ids else []), next_token
+
+
+def _featurize(
+    repo: Repository,
+    batches: Iterator[tuple[list[dict[str, Any]], str | None]],
+    keywords: list[str],
+    now: float,
+) -> Iterator[tuple[list[dict[str, Any]], str | None]]:
+    for batch, next_token in batches:
+        senders = [parseaddr(message["headers"].get("From") or "")[1].lower() for message in batch]
+        # one contacts lookup per batch rather than per message
+        known = repo.known_contact_emails(senders)
+        rows = []
+        for message, sender in zip(batch, senders):
+            labels = set(message.get("label_ids") or [])
+            subject = message["headers"].get("Subject") or ""
+            text = f"{subject} {message.get('snippet') or ''}".lower()
+            received = int(message.get("internal_date") or 0) / 1000
+            age_hours = max(0.0, (now - received) / 3600) if received else None
+            automated = bool(message["headers"].get("List-Unsubscribe")) or bool(_AUTOMATED_SENDER.search(sender))
+            features = {
+                "known_sender": 1.0 if sender in known else 0.0,
+                "recency": 0.5 ** (age_hours / _HALF_LIFE_HOURS) if age_hours is not None else 0.0,
+                "important": 1.0 if "IMPORTANT" in labels else 0.0,
+                "starred": 1.0 if "STARRED" in labels else 0.0,
+                "unread": 1.0 if "UNREAD" in labels else 0.0,
+                "keywords": float(min(3, sum(1 for keyword in keywords if keyword in text))),
+                "bulk": 1.0 if automated or labels & _BULK_LABELS else 0.0,
+            }
+            rows.append({"message": message, "sender": sender, "labels": labels, "features": features})
+        yield rows, next_token
+
+
+def _compact(row: dict[str, Any], score: float, features: dict[str, float]) -> dict[str, Any]:
+    message = row["message"]
+    snippet = message.get("snippet") or ""
+    return {
+        "id": message.get("id"),
+        "thread_id": message.get("thread_id"),
+        "from": message["headers"].get("From"),
+        "subject": message["headers"].get("Subject"),
+        "date": message["headers"].get("Date"),
+        "snippet": snippet[:140],
+        "labels": [label for label in _SHOWN_LABELS if label in row["labels"]],
+        "score": round(score, 3),
+        "reasons": [name for name, value in features.items() if value and WEIGHTS[name] > 0],
+    }
+
+
+def triage(
+    settings: Settings,
+    repo: Repository,
+    query: str,
+    limit: int,
+    scan: int,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """Rank up to ``scan`` messages matching ``query`` and return the top ``limit``.
+
+    Message ids are paged lazily from Gmail, metadata is fetched
+    concurrently per page and features are computed a page at a time (one
+    contacts query per page). ``next_cursor`` resumes with the
+    following (older) window for the same query.
+    """
+    pipeline = _featurize(
+        repo,
+        _with_metadata(settings, repo, _pages(settings, repo, query, cursor, scan)),
+        _keywords(settings.triage_keywords),
+        time.time(),
+    )
+    rows: list[dict[str, Any]] = []
+    next_cursor = None
+    for batch, next_cursor in pipeline:
+        rows.extend(batch)
+    # sender frequency needs the whole window, so it is the one feature added after streaming
+    sender_counts = Counter(row["sender"] for row in rows)
+    scored = []
+    for index, row in enumerate(rows):
+        features = dict(row["features"])
+        features["sender_frequency"] = math.log1p(sender_counts[row["sender"]]) if features["known_sender"] else 0.0
+        score = sum(WEIGHTS[name] * value for name, value in features.items())
+        scored.append((score, -index, row, features))
+    top = heapq.nlargest(limit, scored, key=lambda item: (item[0], item[1]))
+    return {
+        "items": [_compact(row, score, features) for score, _, row, features in top],
+        "scanned": len(rows),
+        "next_cursor": next_cursor,
+    }
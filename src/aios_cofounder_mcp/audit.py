@@ -5,5 +5,11 @@ from typing import Any
 from .storage.repo import Repository
 
 
-def log_action(repo: Repository, action: str, payload: dict[str, Any], result: dict[str, Any]) -> None:
-    repo.add_audit(action=action, payload=payload, result=result)
+def log_action(
+    repo: Repository,
+    action: str,
+    payload: dict[str, Any],
+    result: dict[str, Any],
+    approval_id: int | None = None,
+) -> None:
+    repo.add_audit(action=action, payload=payload, result=result, approval_id=approval_id)
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import re
+import threading
+from array import array
+import time as time_module
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable
+
+# maps busy counters to a 0/1 mask: any overlapping booking makes the slot busy
+_BUSY_MASK = bytes([0] + [1] * 255)
+# add or remove one booking from every counter of a slice; 255 is widened before incrementing
+_STEP = {1: bytes([*range(1, 256), 255]), -1: bytes([0, *range(255)])}
+_MAX_LOADED_RANGES = 256
+_BUSY_RUN = re.compile(b"\x01+")
+_FREE_RUN = re.compile(b"\x00+")
+
+
+def _to_utc(value: str | datetime) -> datetime:
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _event_bounds(event: dict[str, Any]) -> tuple[datetime, datetime] | None:
+    # all-day and transparent events do not block time in freebusy either
+    if event.get("status") == "cancelled" or event.get("transparency") == "transparent":
+        return None
+    start = event.get("start", {}).get("dateTime")
+    end = event.get("end", {}).get("dateTime")
+    if not start or not end:
+        return None
+    return _to_utc(start), _to_utc(end)
+
+
+class AvailabilityIndex:
+    """Per-day busy bitmaps at a fixed minute resolution.
+
+    Each UTC day is a ``bytearray`` of booking counters, one byte per slot, so
+    overlapping bookings can be added and removed independently. Updates and
+    free-slot queries run in C: counters change through ``bytes.translate``
+    tables, and queries translate them to a 0/1 mask scanned for runs of free
+    slots with a compiled regex instead of walking Python tuples. A day that
+    would need more than 255 overlapping bookings in a slot switches to
+    16-bit counters.
+    """
+
+    def __init__(self, resolution_minutes: int = 5) -> None:
+        if resolution_minutes <= 0 or (24 * 60) % resolution_minutes:
+            raise ValueError("resolution_minutes must divide a day")
+        self.resolution = timedelta(minutes=resolution_minutes)
+        self.slots_per_day = (24 * 60) // resolution_minutes
+        self._days: dict[date, bytearray | array[int]] = {}
+        # (start, end, loaded_at, from an event listing); freebusy loads carry no event ids
+        self._loaded: list[tuple[datetime, datetime, float, bool]] = []
+        # busy segments per tracked event; an event cut by a reloaded window keeps its outside parts
+        self._events: dict[str, list[tuple[datetime, datetime]]] = {}
+        self._lock = threading.RLock()
+
+    def _slot(self, value: datetime, *, round_up: bool) -> int:
+        offset = value - datetime.combine(value.date(), datetime.min.time(), tzinfo=timezone.utc)
+        slot, remainder = divmod(offset, self.resolution)
+        day_ordinal = value.date().toordinal()
+        return day_ordinal * self.slots_per_day + slot + (1 if round_up and remainder else 0)
+
+    def _slot_start(self, slot: int) -> datetime:
+        day_ordinal, offset = divmod(slot, self.slots_per_day)
+        day_start = datetime.combine(date.fromordinal(day_ordinal), datetime.min.time(), tzinfo=timezone.utc)
+        return day_start + offset * self.resolution
+
+    def _spans(self, first: int, last: int) -> Iterable[tuple[date, int, int]]:
+        while first < last:
+            day_ordinal, offset = divmod(first, self.slots_per_day)
+            stop = min(self.slots_per_day, offset + (last - first))
+            yield date.fromordinal(day_ordinal), offset, stop
+            first += stop - offset
+
+    def _apply(self, start: datetime, end: datetime, delta: int) -> None:
+        # busy time is widened to whole slots so the index never reports a partly busy slot as free
+        for day, offset, stop in self._spans(self._slot(start, round_up=False), self._slot(end, round_up=True)):
+            counters = self._days.get(day)
+            if counters is None:
+                counters = self._days[day] = bytearray(self.slots_per_day)
+            if isinstance(counters, bytearray):
+                if delta < 0 or counters.find(255, offset, stop) < 0:
+                    counters[offset:stop] = counters[offset:stop].translate(_STEP[delta])
+                    continue
+                counters = self._days[day] = array("H", list(counters))
+            # only days with 255+ overlapping bookings get here; array("H") raises past 65535
+            counters[offset:stop] = array("H", [max(0, value + delta) for value in counters[offset:stop]])
+
+    def add_busy(self, start: str | datetime, end: str | datetime) -> None:
+        with self._lock:
+            start_dt, end_dt = _to_utc(start), _to_utc(end)
+            if end_dt > start_dt:
+                self._apply(start_dt, end_dt, 1)
+
+    def remove_busy(self, start: str | datetime, end: str | datetime) -> None:
+        with self._lock:
+            start_dt, end_dt = _to_utc(start), _to_utc(end)
+            if end_dt > start_dt:
+                self._apply(start_dt, end_dt, -1)
+
+    def upsert_event(self, event: dict[str, Any], created: bool = False) -> None:
+        """Apply a created or changed event.
+
+        An untracked event that was not just ``created`` may already be counted
+        in a freebusy-loaded range at its old time, which cannot be located, so
+        those ranges stop counting as loaded and are refetched on next use.
+        """
+        with self._lock:
+            event_id = event.get("id")
+            if not event_id:
+                return
+            if not self._untrack(event_id) and not created:
+                self._drop_freebusy_ranges()
+            bounds = _event_bounds(event)
+            if bounds and bounds[1] > bounds[0]:
+                self._apply(bounds[0], bounds[1], 1)
+                self._events[event_id] = [bounds]
+
+    def remove_event(self, event_id: str) -> None:
+        with self._lock:
+            if not self._untrack(event_id):
+                self._drop_freebusy_ranges()
+
+    def _untrack(self, event_id: str) -> bool:
+        segments = self._events.pop(event_id, None)
+        for start, end in segments or ():
+            self._apply(start, end, -1)
+        return segments is not None
+
+    def _drop_freebusy_ranges(self) -> None:
+        self._loaded = [loaded for loaded in self._loaded if loaded[3]]
+
+    def _reset(self, start: datetime, end: datetime) -> None:
+        clipped: list[tuple[str, list[tuple[datetime, datetime]]]] = []
+        for event_id, segments in list(self._events.items()):
+            if not any(segment_start < end and segment_end > start for segment_start, segment_end in segments):
+                continue
+            self._untrack(event_id)
+            # busy time outside the reloaded window is still valid
+            outside = [
+                part
+                for segment_start, segment_end in segments
+                for part in ((segment_start, min(segment_end, start)), (max(segment_start, end), segment_end))
+                if part[1] > part[0]
+            ]
+            if outside:
+                clipped.append((event_id, outside))
+        for day, offset, stop in self._spans(self._slot(start, round_up=False), self._slot(end, round_up=True)):
+            counters = self._days.get(day)
+            if isinstance(counters, bytearray):
+                counters[offset:stop] = bytes(stop - offset)
+            elif counters is not None:
+                counters[offset:stop] = array("H", [0]) * (stop - offset)
+        for event_id, outside in clipped:
+            for segment_start, segment_end in outside:
+                self._apply(segment_start, segment_end, 1)
+            self._events[event_id] = outside
+
+    def load_busy(self, window_start: str | datetime, window_end: str | datetime, busy: Iterable[dict[str, str]]) -> None:
+        """Replace everything known about ``[window_start, window_end)`` with freebusy blocks."""
+        with self._lock:
+            start_dt, end_dt = _to_utc(window_start), _to_utc(window_end)
+            self._reset(start_dt, end_dt)
+            for item in busy:
+                self.add_busy(item["start"], item["end"])
+            self._mark_loaded(start_dt, end_dt, from_events=False)
+
+    def load_events(self, window_start: str | datetime, window_end: str | datetime, events: Iterable[dict[str, Any]]) -> None:
+        """Replace everything known about the window with a complete event listing."""
+        with self._lock:
+            start_dt, end_dt = _to_utc(window_start), _to_utc(window_end)
+            self._reset(start_dt, end_dt)
+            for event in events:
+                self.upsert_event(event, created=True)
+            self._mark_loaded(start_dt, end_dt, from_events=True)
+
+    def _mark_loaded(self, start: datetime, end: datetime, from_events: bool) -> None:
+        self._loaded.append((start, end, time_module.monotonic(), from_events))
+        del self._loaded[:-_MAX_LOADED_RANGES]
+
+    def covers(self, window_start: str | datetime, window_end: str | datetime, max_age_seconds: float | None = None) -> bool:
+        """Whether every instant of the window was loaded (within ``max_age_seconds``)."""
+        with self._lock:
+            cursor, end_dt = _to_utc(window_start), _to_utc(window_end)
+            oldest = time_module.monotonic() - max_age_seconds if max_age_seconds is not None else None
+            fresh = sorted(
+                (start, end) for start, end, loaded_at, _ in self._loaded if oldest is None or loaded_at >= oldest
+            )
+            for start, end in fresh:
+                if start > cursor:
+                    break
+                cursor = max(cursor, end)
+            return cursor >= end_dt
+
+    def _mask(self, first: int, last: int) -> bytes:
+        chunks: list[bytes] = []
+        for day, offset, stop in self._spans(first, last):
+            counters = self._days.get(day)
+            if counters is None:
+                chunks.append(bytes(stop - offset))
+            elif isinstance(counters, bytearray):
+                chunks.append(bytes(counters[offset:stop]))
+            else:
+                chunks.append(bytes(min(value, 1) for value in counters[offset:stop]))
+        return b"".join(chunks).translate(_BUSY_MASK)
+
+    def _span(self, window_start: datetime, window_end: datetime) -> tuple[int, int]:
+        return self._slot(window_start, round_up=False), self._slot(window_end, round_up=True)
+
+    def _intervals(self, pattern: re.Pattern[bytes], mask: bytes, base: datetime) -> list[tuple[datetime, datetime]]:
+        step = self.resolution
+        return [(base + match.start() * step, base + match.end() * step) for match in pattern.finditer(mask)]
+
+    def scan(
+        self, window_start: str | datetime, window_end: str | datetime
+    ) -> tuple[list[tuple[datetime, datetime]], list[tuple[datetime, datetime]]]:
+        """Busy and free runs of the window, read from one mask.
+
+        Busy runs cover whole slots; free runs that reach the window's edges
+        end exactly there.
+        """
+        start_dt, end_dt = _to_utc(window_start), _to_utc(window_end)
+        first, last = self._span(start_dt, end_dt)
+        if last <= first:
+            return [], []
+        with self._lock:
+            mask = self._mask(first, last)
+        base = self._slot_start(first)
+        busy, free = self._intervals(_BUSY_RUN, mask, base), self._intervals(_FREE_RUN, mask, base)
+        # only the outermost runs can reach past the window's unaligned edges
+        if free and free[0][0] < start_dt:
+            free[0] = (start_dt, free[0][1])
+        if free and free[-1][1] > end_dt:
+            free[-1] = (free[-1][0], end_dt)
+        return busy, [(start, end) for start, end in free if end > start]
+
+    def free_intervals(
+        self, window_start: str | datetime, window_end: str | datetime, duration_minutes: int = 0
+    ) -> list[tuple[datetime, datetime]]:
+        """Free gaps of at least ``duration_minutes`` within the window."""
+        duration = timedelta(minutes=duration_minutes)
+        return [(start, end) for start, end in self.scan(window_start, window_end)[1] if end - start >= duration]
+
+    def find_free(
+        self,
+        window_start: str | datetime,
+        window_end: str | datetime,
+        duration_minutes: int,
+    ) -> list[dict[str, str]]:
+        """Return free gaps of at least ``duration_minutes``, like ``calendar._compute_free_slots``."""
+        return [
+            {"start": start.isoformat(), "end": end.isoformat()}
+            for start, end in self.free_intervals(window_start, window_end, duration_minutes)
+        ]
+
+    def busy_blocks(self, window_start: str | datetime, window_end: str | datetime) -> list[dict[str, str]]:
+        busy, _ = self.scan(window_start, window_end)
+        return [{"start": start.isoformat(), "end": end.isoformat()} for start, end in busy]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import contextvars
+import copy
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, TypeVar
+
+from .settings import Settings, settings
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+TagFn = Callable[[dict[str, Any], Any], Iterable[str]]
+SpanFn = Callable[[dict[str, Any]], "tuple[str, str] | None"]
+
+
+def _parse_ttls(raw: str | None) -> dict[str, int]:
+    ttls: dict[str, int] = {}
+    for item in (raw or "").replace(" ", ",").split(","):
+        name, _, value = item.rpartition("=")
+        if name.strip() and value.strip():
+            ttls[name.strip()] = int(value)
+    return ttls
+
+
+def _instant(value: str) -> datetime:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _cacheable(result: Any) -> bool:
+    # tool envelopes carry ``ok``; resources report failures as ``{"error": ...}``
+    return isinstance(result, dict) and result.get("ok", "error" not in result) is True
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    tags: frozenset[str]
+    span: tuple[datetime, datetime] | None
+    refreshing: bool = False
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class ResultCache:
+    """In-memory LRU of read results keyed by name plus normalized arguments.
+
+    Entries are fresh for their TTL, then served stale for up to
+    ``stale_seconds`` while a single background refresh recomputes them.
+    Each entry carries tags (``event:<id>``, ``message:<id>``...) and an
+    optional time span so mutating tools can evict exactly what they touched.
+    Results are copied in and out, so callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int, stale_seconds: int, ttls: dict[str, int] | None = None) -> None:
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self.ttls = dict(ttls or {})
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = _Stats()
+        self._refresher: ThreadPoolExecutor | None = None
+
+    def cached(self, name: str, ttl: int, tags: TagFn | None = None, span: SpanFn | None = None) -> Callable[[_F], _F]:
+        """Cache successful results of ``fn`` under ``name`` (``RESULT_CACHE_TTLS`` may override ``ttl``)."""
+
+        def decorator(fn: _F) -> _F:
+            signature = inspect.signature(fn)
+
+            @functools.wraps(fn)
+            def _cached(*args: Any, **kwargs: Any) -> Any:
+                effective_ttl = self.ttls.get(name, ttl)
+                if self.max_entries <= 0 or effective_ttl <= 0:
+                    return fn(*args, **kwargs)
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = dict(bound.arguments)
+                key = (name, json.dumps(arguments, sort_keys=True, default=str))
+                now = time.monotonic()
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None and now < entry.stale_until:
+                        self._entries.move_to_end(key)
+                        if now < entry.fresh_until:
+                            self._stats.hits += 1
+                            return copy.deepcopy(entry.value)
+                        self._stats.stale_hits += 1
+                        refresh = not entry.refreshing
+                        entry.refreshing = True
+                        value = entry.value
+                    else:
+                        refresh = False
+                        entry = None
+                        self._stats.misses += 1
+                if entry is not None:
+                    if refresh:
+                        context = contextvars.copy_context()
+                        self._refresh_pool().submit(
+                            context.run, self._compute, key, fn, args, kwargs, arguments, effective_ttl, tags, span
+                        )
+                    return copy.deepcopy(value)
+                return self._compute(key, fn, args, kwargs, arguments, effective_ttl, tags, span)
+
+            _cached.cache_name = name  # type: ignore[attr-defined]
+            return _cached  # type: ignore[return-value]
+
+        return decorator
+
+    def _compute(
+        self,
+        key: tuple[str, str],
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        arguments: dict[str, Any],
+        ttl: int,
+        tags: TagFn | None,
+        span: SpanFn | None,
+    ) -> Any:
+        with self._lock:
+            generation = self._stats.invalidations
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            raise
+        if not _cacheable(result):
+            with self._lock:
+                self._entries.pop(key, None)
+            return result
+        entry_tags = frozenset(tags(arguments, result)) if tags else frozenset()
+        entry_span: tuple[datetime, datetime] | None = None
+        if span:
+            bounds = span(arguments)
+            if bounds:
+                entry_span = (_instant(bounds[0]), _instant(bounds[1]))
+        now = time.monotonic()
+        with self._lock:
+            # a mutation that landed while we were fetching may have made this result outdated
+            if self._stats.invalidations != generation:
+                self._entries.pop(key, None)
+                return result
+            # callers own the returned dict; the entry keeps its own copy
+            self._entries[key] = _Entry(copy.deepcopy(result), now + ttl, now + ttl + self.stale_seconds, entry_tags, entry_span)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+        return result
+
+    def _refresh_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+            return self._refresher
+
+    def invalidate(self, tags: Iterable[str] = (), start: str | None = None, end: str | None = None) -> int:
+        """Evict entries carrying any of ``tags`` or whose span overlaps ``[start, end)``."""
+        wanted = set(tags)
+        window = (_instant(start), _instant(end)) if start and end else None
+        with self._lock:
+            doomed = [
+                key
+                for key, entry in self._entries.items()
+                if entry.tags & wanted
+                or (window and entry.span and entry.span[0] < window[1] and entry.span[1] > window[0])
+            ]
+            for key in doomed:
+                del self._entries[key]
+            self._stats.invalidations += 1
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            by_name: dict[str, int] = {}
+            for name, _ in self._entries:
+                by_name[name] = by_name.get(name, 0) + 1
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._stats.hits,
+                "stale_hits": self._stats.stale_hits,
+                "misses": self._stats.misses,
+                "evictions": self._stats.evictions,
+                "by_name": by_name,
+            }
+
+
+def build_result_cache(settings: Settings) -> ResultCache:
+    return ResultCache(
+        max_entries=settings.result_cache_max_entries,
+        stale_seconds=settings.result_cache_stale_seconds,
+        ttls=_parse_ttls(settings.result_cache_ttls),
+    )
+
+
+result_cache = build_result_cache(settings)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from .settings import Settings, settings
+
+_cancel_event: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar(
+    "aios_tool_cancel_event", default=None
+)
+_caller_loop: contextvars.ContextVar[asyncio.AbstractEventLoop | None] = contextvars.ContextVar(
+    "aios_tool_caller_loop", default=None
+)
+
+
+def check_cancelled() -> None:
+    """Raise if the client that issued the current tool call has gone away.
+
+    Tool bodies run on worker threads that cannot be interrupted, so long
+    loops call this between network requests to stop early.
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise RuntimeError("cancelled")
+
+
+def report_progress(progress: float, total: float | None = None, message: str | None = None) -> None:
+    """Send an MCP progress notification for the current tool call from its worker thread.
+
+    A no-op outside a dispatched tool call, without fastmcp, or when the
+    client did not ask for progress (no ``progressToken``).
+    """
+    loop = _caller_loop.get()
+    if loop is None:
+        return
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        context = get_context()
+    except (ModuleNotFoundError, RuntimeError):
+        return
+    asyncio.run_coroutine_threadsafe(context.report_progress(progress, total, message), loop)
+
+
+def _parse_limits(raw: str | None) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in (raw or "").replace(" ", ",").split(","):
+        group, _, value = item.partition("=")
+        if group.strip() and value.strip():
+            limits[group.strip()] = int(value)
+    return limits
+
+
+@dataclass
+class GroupStats:
+    limit: int
+    running: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+
+
+class _Slots:
+    """A group's concurrency slots, shared by every event loop that dispatches to it.
+
+    ``asyncio.Semaphore`` binds to the first loop that waits on it, so
+    waiters here are plain futures of their own loop, woken thread-safely.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.held = 0
+        self.waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+
+
+def _grant(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Dispatcher:
+    """Runs synchronous tool bodies on a shared thread pool.
+
+    Each tool belongs to a group (``gmail``, ``calendar``...) with its own
+    concurrency limit, so a burst of slow Gmail calls queues behind the Gmail
+    limit instead of starving every other tool or the event loop.
+    """
+
+    def __init__(self, max_workers: int, group_limits: dict[str, int], default_limit: int | None = None) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool")
+        self._default_limit = default_limit or max_workers
+        self._limits = dict(group_limits)
+        self._slots: dict[str, _Slots] = {}
+        self._stats: dict[str, GroupStats] = {}
+        self._lock = threading.Lock()
+
+    def _group(self, group: str) -> tuple[_Slots, GroupStats]:
+        with self._lock:
+            if group not in self._slots:
+                limit = self._limits.get(group, self._default_limit)
+                self._slots[group] = _Slots(limit)
+                self._stats[group] = GroupStats(limit=limit)
+            return self._slots[group], self._stats[group]
+
+    async def _acquire(self, slots: _Slots, stats: GroupStats) -> None:
+        with self._lock:
+            if slots.held < slots.limit and not slots.waiters:
+                slots.held += 1
+                stats.running += 1
+                return
+            # only calls that actually block count as waiting
+            loop = asyncio.get_running_loop()
+            waiter: asyncio.Future[None] = loop.create_future()
+            slots.waiters.append((loop, waiter))
+            stats.waiting += 1
+            stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                stats.cancelled += 1
+                try:
+                    slots.waiters.remove((loop, waiter))
+                    stats.waiting -= 1
+                    handed_over = False
+                except ValueError:
+                    handed_over = True
+            if handed_over:
+                # the slot was passed to this call just as it was cancelled
+                self._release(slots, stats)
+            raise
+
+    def _release(self, slots: _Slots, stats: GroupStats) -> None:
+        """Free a slot, handing it straight to the oldest waiter if there is one."""
+        with self._lock:
+            stats.running -= 1
+            while slots.waiters:
+                loop, waiter = slots.waiters.popleft()
+                stats.waiting -= 1
+                try:
+                    loop.call_soon_threadsafe(_grant, waiter)
+                except RuntimeError:
+                    # the waiter's loop has closed; try the next one
+                    continue
+                stats.running += 1
+                return
+            slots.held -= 1
+
+    async def run(self, group: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        slots, stats = self._group(group)
+        await self._acquire(slots, stats)
+
+        cancel_event = threading.Event()
+        context = contextvars.copy_context()
+        context.run(_cancel_event.set, cancel_event)
+        loop = asyncio.get_running_loop()
+        context.run(_caller_loop.set, loop)
+        future = loop.run_in_executor(self._executor, functools.partial(context.run, fn, *args, **kwargs))
+
+        def _finished(done: asyncio.Future[Any]) -> None:
+            # the slot is held until the worker thread actually stops, even after a cancel
+            with self._lock:
+                if cancel_event.is_set():
+                    stats.cancelled += 1
+                elif done.exception() is not None:
+                    stats.failed += 1
+                else:
+                    stats.completed += 1
+            self._release(slots, stats)
+
+        future.add_done_callback(_finished)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+
+    def wrap(self, fn: Callable[..., Any], group: str) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def _dispatched(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(group, fn, *args, **kwargs)
+
+        return _dispatched
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {group: asdict(stats) for group, stats in self._stats.items()}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_dispatcher(settings: Settings) -> Dispatcher:
+    return Dispatcher(
+        max_workers=settings.tool_workers,
+        group_limits=_parse_limits(settings.tool_concurrency_limits),
+    )
+
+
+dispatcher = build_dispatcher(settings)
@@ -1,41 +1,189 @@
 from __future__ import annotations
 
-from typing import Any
+import heapq
+from datetime import datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Callable, Iterable, Iterator, Mapping
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from .. import rollups, search_index
+from ..availability import AvailabilityIndex
 from ..settings import Settings
 from ..storage.repo import Repository
+from . import recurrence
+from .client import build_service, map_concurrently
 from .oauth import load_credentials
 
 
+# freebusy.query rejects requests with more than 50 calendars/groups
+FREEBUSY_MAX_ITEMS = 50
+SLOT_STEP = timedelta(minutes=15)
+SLACK_CAP = timedelta(minutes=60)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# process-wide busy bitmap for the primary calendar, kept current by the calls below
+primary_availability = AvailabilityIndex()
+
+
 def _get_service(settings: Settings, repo: Repository):
     try:
-        from googleapiclient.discovery import build
+        import googleapiclient.discovery  # noqa: F401
     except ModuleNotFoundError as exc:
         raise RuntimeError("google_api_client_not_installed") from exc
     creds = load_credentials(settings, repo)
     if not creds:
         # avoid leaking auth details in error responses
         raise RuntimeError("calendar_not_connected")
-    # TODO: consider caching the discovery client when running as a service.
-    return build("calendar", "v3", credentials=creds)
+    return build_service("calendar", "v3", creds)
+
+
+def _all_pages(method: Callable[..., Any], **params: Any) -> list[dict[str, Any]]:
+    """Every item of a paged Calendar list call (``events.list``, ``events.instances``)."""
+    items: list[dict[str, Any]] = []
+    page_token: str | None = None
+    while True:
+        page = method(pageToken=page_token, **params).execute()
+        items.extend(page.get("items", []))
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            return items
 
 
-def list_events(settings: Settings, repo: Repository, start: str, end: str) -> list[dict[str, Any]]:
+def list_calendars(settings: Settings, repo: Repository) -> list[dict[str, Any]]:
     service = _get_service(settings, repo)
-    events = (
-        service.events()
-        .list(
-            calendarId="primary",
+    calendars: list[dict[str, Any]] = []
+    page_token: str | None = None
+    while True:
+        page = service.calendarList().list(pageToken=page_token).execute()
+        calendars.extend(page.get("items", []))
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            return calendars
+
+
+def resolve_calendar_ids(
+    settings: Settings,
+    repo: Repository,
+    calendar_ids: list[str] | str | None,
+) -> list[str]:
+    """Normalize a tool argument into calendar IDs; ``"all"`` expands via calendarList."""
+    if not calendar_ids:
+        return ["primary"]
+    if isinstance(calendar_ids, str):
+        calendar_ids = [calendar_ids]
+    if "all" in calendar_ids:
+        listed = [item["id"] for item in list_calendars(settings, repo) if item.get("id")]
+        calendar_ids = [item for item in calendar_ids if item != "all"] + listed
+    return _dedupe(calendar_ids)
+
+
+def list_events(
+    settings: Settings,
+    repo: Repository,
+    start: str,
+    end: str,
+    local_recurrence: bool = False,
+    calendar_id: str = "primary",
+) -> list[dict[str, Any]]:
+    if local_recurrence:
+        # shallow copies at the response boundary; nested master fields stay shared
+        items = [dict(event) for event in iter_events(settings, repo, start, end, calendar_id)]
+    else:
+        service = _get_service(settings, repo)
+        # every page is needed: the availability index and rollups treat this as the complete window
+        items = _all_pages(
+            service.events().list,
+            calendarId=calendar_id,
             timeMin=start,
             timeMax=end,
             singleEvents=True,
             orderBy="startTime",
+            maxResults=2500,
         )
-        .execute()
+        # previous implementation (kept for reference)
+        # events = service.events().list(calendarId="primary", timeMin=start, timeMax=end).execute()
+    if calendar_id == "primary":
+        primary_availability.load_events(start, end, items)
+    rollups.record_events(repo, calendar_id, items, (start, end))
+    search_index.index_events(repo, calendar_id, items)
+    return items
+
+
+def list_events_across(
+    settings: Settings,
+    repo: Repository,
+    start: str,
+    end: str,
+    calendar_ids: list[str] | str | None,
+    local_recurrence: bool = False,
+) -> dict[str, Any]:
+    """Fetch several calendars concurrently and merge them into one time-ordered list.
+
+    A calendar that fails is reported under ``errors``; the others still return.
+    """
+    # fail fast on a missing connection instead of reporting it once per calendar
+    _get_service(settings, repo)
+    ids = resolve_calendar_ids(settings, repo, calendar_ids)
+
+    def _fetch(calendar_id: str) -> tuple[list[dict[str, Any]], dict[str, str] | None]:
+        # workers use their own thread's service; googleapiclient objects are not thread-safe
+        try:
+            items = list_events(settings, repo, start, end, local_recurrence=local_recurrence, calendar_id=calendar_id)
+        except Exception as exc:
+            return [], {"calendar_id": calendar_id, "error": str(exc)}
+        for item in items:
+            item["calendarId"] = calendar_id
+        return items, None
+
+    fetched = map_concurrently(_fetch, ids, settings.calendar_fanout_workers)
+    errors = [error for _, error in fetched if error]
+    events = list(heapq.merge(*(items for items, _ in fetched), key=recurrence.start_key))
+    return {"calendar_ids": ids, "events": events, "errors": errors}
+
+
+def iter_events(
+    settings: Settings,
+    repo: Repository,
+    start: str,
+    end: str,
+    calendar_id: str = "primary",
+) -> Iterator[Mapping[str, Any]]:
+    """Yield events in the window, expanding recurring series locally.
+
+    Only recurring masters and their exceptions cross the wire; instances are
+    generated lazily as views over the master. Series whose RRULE the local
+    expander does not handle are fetched with ``events.instances`` instead.
+    Exceptions share their master's iCalUID, so listing it without a time
+    bound finds those moved out of the window, whose original slot must
+    stay empty.
+    """
+    service = _get_service(settings, repo)
+    items = _all_pages(
+        service.events().list, calendarId=calendar_id, timeMin=start, timeMax=end, singleEvents=False, maxResults=2500
     )
-    # previous implementation (kept for reference)
-    # events = service.events().list(calendarId="primary", timeMin=start, timeMax=end).execute()
-    return events.get("items", [])
+    unsupported = {item["id"] for item in items if item.get("recurrence") and not recurrence.is_supported(item)}
+    local = [
+        item
+        for item in items
+        if item.get("id") not in unsupported and item.get("recurringEventId") not in unsupported
+    ]
+    for event_id in unsupported:
+        local.extend(
+            _all_pages(service.events().instances, calendarId=calendar_id, eventId=event_id, timeMin=start, timeMax=end)
+        )
+    series_exceptions = [
+        item
+        for master in local
+        if master.get("recurrence") and master.get("iCalUID")
+        for item in _all_pages(
+            service.events().list,
+            calendarId=calendar_id,
+            iCalUID=master["iCalUID"],
+            singleEvents=False,
+            showDeleted=True,
+        )
+        if item.get("recurringEventId") == master.get("id")
+    ]
+    return recurrence.expand_events(local, start, end, series_exceptions)
 
 
 def find_free_slots(
@@ -44,23 +192,69 @@ def find_free_slots(
     duration_minutes: int,
     window_start: str,
     window_end: str,
+    calendar_ids: list[str] | str | None = None,
+    attendees: list[str] | None = None,
+    working_hours_start: str | None = None,
+    working_hours_end: str | None = None,
+    time_zone: str | None = None,
+    buffer_minutes: int = 0,
+    include_weekends: bool = False,
+    max_slots: int = 10,
 ) -> dict[str, Any]:
-    service = _get_service(settings, repo)
-    body = {
-        "timeMin": window_start,
-        "timeMax": window_end,
-        "items": [{"id": "primary"}],
-    }
-    # FIXME: assumes primary calendar only
-    response = service.freebusy().query(body=body).execute()
-    busy = response.get("calendars", {}).get("primary", {}).get("busy", [])
-    free = _compute_free_slots(busy, window_start, window_end, duration_minutes)
+    if duration_minutes <= 0:
+        raise RuntimeError("invalid_duration")
+    tz = _resolve_timezone(time_zone)
+    start_dt, end_dt = _parse_datetime(window_start, tz), _parse_datetime(window_end, tz)
+    working_hours = _parse_working_hours(working_hours_start, working_hours_end)
+    buffer = timedelta(minutes=max(buffer_minutes, 0))
+    participants = _dedupe([*resolve_calendar_ids(settings, repo, calendar_ids), *(attendees or [])])
+    busy_by_participant: dict[str, list[dict[str, str]]] = {}
+    errors: list[dict[str, Any]] = []
+    ttl = settings.availability_index_ttl_seconds
+    if participants == ["primary"] and ttl > 0 and primary_availability.covers(start_dt, end_dt, ttl):
+        # repeated single-calendar queries are answered from the local bitmap, with no busy blocks to parse
+        busy, free, gaps = _indexed_availability(primary_availability, start_dt, end_dt, duration_minutes, buffer)
+        busy_by_participant["primary"] = busy
+    else:
+        service = _get_service(settings, repo)
+        # freebusy caps the number of items per query; one query per chunk
+        for offset in range(0, len(participants), FREEBUSY_MAX_ITEMS):
+            chunk = participants[offset : offset + FREEBUSY_MAX_ITEMS]
+            body = {
+                "timeMin": window_start,
+                "timeMax": window_end,
+                "timeZone": tz.key,
+                "items": [{"id": item} for item in chunk],
+            }
+            response = service.freebusy().query(body=body).execute()
+            calendars = response.get("calendars", {})
+            for item in chunk:
+                entry = calendars.get(item, {})
+                if entry.get("errors"):
+                    errors.append({"id": item, "errors": entry["errors"]})
+                busy_by_participant[item] = entry.get("busy", [])
+                if item == "primary" and not entry.get("errors"):
+                    primary_availability.load_busy(start_dt, end_dt, busy_by_participant[item])
+        busy, free, gaps = _fetched_availability(
+            busy_by_participant.values(), window_start, window_end, duration_minutes, buffer
+        )
+    slots = _rank_slots(
+        gaps,
+        _working_windows(start_dt, end_dt, tz, working_hours, include_weekends),
+        duration=timedelta(minutes=duration_minutes),
+        tz=tz,
+        limit=max_slots,
+    )
     return {
         "window_start": window_start,
         "window_end": window_end,
         "duration_minutes": duration_minutes,
+        "time_zone": tz.key,
+        "participants": list(busy_by_participant),
         "busy": busy,
         "free": free,
+        "slots": slots,
+        "errors": errors,
     }
 
 
@@ -96,6 +290,214 @@ def _compute_free_slots(
     return free
 
 
+def _dedupe(values: Iterable[str]) -> list[str]:
+    seen: dict[str, None] = {}
+    for value in values:
+        if value:
+            seen.setdefault(value, None)
+    return list(seen)
+
+
+def _resolve_timezone(name: str | None) -> ZoneInfo:
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise RuntimeError("invalid_time_zone") from exc
+
+
+def _parse_datetime(value: str, tz: tzinfo = timezone.utc) -> datetime:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    # naive values are interpreted in the requested scheduling timezone
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=tz)
+
+
+def _parse_working_hours(start: str | None, end: str | None) -> tuple[time, time] | None:
+    if not start and not end:
+        return None
+    try:
+        parsed_start = time.fromisoformat(start or "00:00")
+        parsed_end = time.fromisoformat(end or "23:59")
+    except ValueError as exc:
+        raise RuntimeError("invalid_working_hours") from exc
+    if parsed_end <= parsed_start:
+        raise RuntimeError("invalid_working_hours")
+    return parsed_start, parsed_end
+
+
+def _merge_busy(busy_lists: Iterable[list[dict[str, str]]]) -> list[tuple[datetime, datetime]]:
+    """Merge busy intervals of all participants with a single sweep-line pass."""
+    edges: list[tuple[datetime, int]] = []
+    for busy in busy_lists:
+        for item in busy:
+            start, end = _parse_datetime(item["start"]), _parse_datetime(item["end"])
+            if end > start:
+                edges.append((start, 1))
+                edges.append((end, -1))
+    # starts sort before ends at the same instant so touching blocks merge
+    edges.sort(key=lambda edge: (edge[0], -edge[1]))
+    merged: list[tuple[datetime, datetime]] = []
+    depth = 0
+    opened: datetime | None = None
+    for instant, delta in edges:
+        if depth == 0 and delta > 0:
+            opened = instant
+        depth += delta
+        if depth == 0 and opened is not None:
+            merged.append((opened, instant))
+            opened = None
+    return merged
+
+
+def _working_windows(
+    window_start: datetime,
+    window_end: datetime,
+    tz: tzinfo,
+    working_hours: tuple[time, time] | None,
+    include_weekends: bool,
+) -> list[tuple[datetime, datetime]]:
+    if working_hours is None:
+        return [(window_start, window_end)]
+    windows: list[tuple[datetime, datetime]] = []
+    day = window_start.astimezone(tz).date()
+    last_day = window_end.astimezone(tz).date()
+    while day <= last_day:
+        if include_weekends or day.weekday() < 5:
+            start = max(datetime.combine(day, working_hours[0], tzinfo=tz), window_start)
+            end = min(datetime.combine(day, working_hours[1], tzinfo=tz), window_end)
+            if end > start:
+                windows.append((start, end))
+        day += timedelta(days=1)
+    return windows
+
+
+# a free gap between blocked time: (blocked until, blocked from); ``None`` where nothing blocks that side
+_Gap = tuple["datetime | None", "datetime | None"]
+
+
+def _busy_gaps(busy: list[tuple[datetime, datetime]], buffer: timedelta) -> list[_Gap]:
+    """Free gaps around merged, sorted busy blocks widened by ``buffer``."""
+    gaps: list[_Gap] = []
+    blocked_until: datetime | None = None
+    for start, end in busy:
+        if blocked_until is None or start - buffer > blocked_until:
+            gaps.append((blocked_until, start - buffer))
+        blocked_until = end + buffer if blocked_until is None else max(blocked_until, end + buffer)
+    gaps.append((blocked_until, None))
+    return gaps
+
+
+def _fetched_availability(
+    busy_lists: Iterable[list[dict[str, str]]],
+    window_start: str,
+    window_end: str,
+    duration_minutes: int,
+    buffer: timedelta,
+) -> tuple[list[dict[str, str]], list[dict[str, str]], list[_Gap]]:
+    """Busy blocks, free gaps and slot gaps from freebusy responses."""
+    merged = _merge_busy(busy_lists)
+    busy = [{"start": start.isoformat(), "end": end.isoformat()} for start, end in merged]
+    return busy, _compute_free_slots(busy, window_start, window_end, duration_minutes), _busy_gaps(merged, buffer)
+
+
+def _indexed_availability(
+    index: AvailabilityIndex,
+    window_start: datetime,
+    window_end: datetime,
+    duration_minutes: int,
+    buffer: timedelta,
+) -> tuple[list[dict[str, str]], list[dict[str, str]], list[_Gap]]:
+    """Busy blocks, free gaps and slot gaps from one scan of the bitmap, with no parsing or merging."""
+    busy, free = index.scan(window_start, window_end)
+    duration = timedelta(minutes=duration_minutes)
+    # a run reaching the window edge is not bounded by a booking on that side
+    gaps: list[_Gap] = [
+        (start + buffer if start > window_start else None, end - buffer if end < window_end else None)
+        for start, end in free
+    ]
+    return (
+        [{"start": start.isoformat(), "end": end.isoformat()} for start, end in busy],
+        [{"start": start.isoformat(), "end": end.isoformat()} for start, end in free if end - start >= duration],
+        gaps,
+    )
+
+
+def _rank_candidate_slots(
+    busy: list[tuple[datetime, datetime]],
+    window_start: datetime,
+    window_end: datetime,
+    *,
+    duration: timedelta,
+    tz: tzinfo,
+    working_hours: tuple[time, time] | None = None,
+    buffer: timedelta = timedelta(0),
+    include_weekends: bool = False,
+    step: timedelta = SLOT_STEP,
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Return slots of exactly ``duration``, preferring ones with room around them."""
+    return _rank_slots(
+        _busy_gaps(busy, buffer),
+        _working_windows(window_start, window_end, tz, working_hours, include_weekends),
+        duration=duration,
+        tz=tz,
+        step=step,
+        limit=limit,
+    )
+
+
+def _rank_slots(
+    gaps: list[_Gap],
+    windows: list[tuple[datetime, datetime]],
+    *,
+    duration: timedelta,
+    tz: tzinfo,
+    step: timedelta = SLOT_STEP,
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """Rank step-aligned slots inside both a free gap and a working window.
+
+    Both lists are sorted, so they are walked together once.
+    """
+    candidates: list[tuple[timedelta, datetime]] = []
+    index = 0
+    for work_start, work_end in windows:
+        # gaps that were blocked off before this window started cannot hold a slot in it
+        while index < len(gaps) and gaps[index][1] is not None and gaps[index][1] <= work_start:
+            index += 1
+        for blocked_until, blocked_from in gaps[index:]:
+            if blocked_until is not None and blocked_until >= work_end:
+                break
+            lower = work_start if blocked_until is None else max(work_start, blocked_until)
+            upper = work_end if blocked_from is None else min(work_end, blocked_from)
+            cursor = _align(lower, step)
+            while cursor + duration <= upper:
+                slot_end = cursor + duration
+                before = cursor - blocked_until if blocked_until is not None else SLACK_CAP
+                after = blocked_from - slot_end if blocked_from is not None else SLACK_CAP
+                candidates.append((min(before, after, SLACK_CAP), cursor))
+                cursor += step
+    # back-to-back slots rank below slots with breathing room; ties go to the earliest
+    candidates.sort(key=lambda item: (-item[0], item[1]))
+    ranked: list[dict[str, Any]] = []
+    for rank, (slack, start) in enumerate(candidates[: max(limit, 0)], start=1):
+        ranked.append(
+            {
+                "rank": rank,
+                "start": start.astimezone(tz).isoformat(),
+                "end": (start + duration).astimezone(tz).isoformat(),
+                "slack_minutes": int(slack.total_seconds() // 60),
+            }
+        )
+    return ranked
+
+
+def _align(value: datetime, step: timedelta) -> datetime:
+    remainder = (value - _EPOCH) % step
+    return value if not remainder else value + (step - remainder)
+
+
 def create_event(
     settings: Settings,
     repo: Repository,
@@ -103,6 +505,7 @@ def create_event(
     start: str,
     end: str,
     attendees: list[str],
+    calendar_id: str = "primary",
 ) -> dict[str, Any]:
     service = _get_service(settings, repo)
     event_body = {
@@ -114,11 +517,15 @@ def create_event(
     # sendUpdates=none avoids unexpected attendee emails
     event = (
         service.events()
-        .insert(calendarId="primary", body=event_body, sendUpdates="none")
+        .insert(calendarId=calendar_id, body=event_body, sendUpdates="none")
         .execute()
     )
     # previous implementation (kept for reference)
     # event = service.events().insert(calendarId="primary", body=event_body, sendUpdates="all").execute()
+    if calendar_id == "primary":
+        primary_availability.upsert_event(event, created=True)
+    rollups.record_events(repo, calendar_id, [event])
+    search_index.index_events(repo, calendar_id, [event])
     return event
 
 
@@ -127,18 +534,30 @@ def update_event(
     repo: Repository,
     event_id: str,
     changes: dict[str, Any],
+    calendar_id: str = "primary",
 ) -> dict[str, Any]:
     service = _get_service(settings, repo)
-    event = service.events().patch(calendarId="primary", eventId=event_id, body=changes).execute()
+    event = service.events().patch(calendarId=calendar_id, eventId=event_id, body=changes).execute()
+    if calendar_id == "primary":
+        primary_availability.upsert_event(event)
+    rollups.record_events(repo, calendar_id, [event])
+    search_index.index_events(repo, calendar_id, [event])
     return event
 
 
-def cancel_event(settings: Settings, repo: Repository, event_id: str) -> dict[str, Any]:
+def cancel_event(settings: Settings, repo: Repository, event_id: str, calendar_id: str = "primary") -> dict[str, Any]:
     service = _get_service(settings, repo)
-    service.events().delete(calendarId="primary", eventId=event_id, sendUpdates="none").execute()
+    service.events().delete(calendarId=calendar_id, eventId=event_id, sendUpdates="none").execute()
+    if calendar_id == "primary":
+        primary_availability.remove_event(event_id)
+    rollups.forget_event(repo, calendar_id, event_id)
+    search_index.forget_events(repo, calendar_id, [event_id])
     return {"cancelled": True, "event_id": event_id}
 
 
-def get_event(settings: Settings, repo: Repository, event_id: str) -> dict[str, Any]:
+def get_event(settings: Settings, repo: Repository, event_id: str, calendar_id: str = "primary") -> dict[str, Any]:
     service = _get_service(settings, repo)
-    return service.events().get(calendarId="primary", eventId=event_id).execute()
+    event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+    rollups.record_events(repo, calendar_id, [event])
+    search_index.index_events(repo, calendar_id, [event])
+    return event
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TypeVar
+
+from ..settings import settings
+from .instrumentation import request_builder
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_local = threading.local()
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def build_service(api: str, version: str, credentials: Any) -> Any:
+    """Return a Google API client for this thread, building it only when needed.
+
+    ``discovery.build`` parses the API description on every call, and the
+    resulting objects (and their ``httplib2`` transport) are not thread-safe,
+    so clients are cached per thread and rebuilt when the access token
+    changes (refresh or reconnect).
+    """
+    from googleapiclient.discovery import build
+
+    services: dict[tuple[str, str], tuple[tuple[Any, Any], Any]] = getattr(_local, "services", None) or {}
+    _local.services = services
+    fingerprint = (getattr(credentials, "token", None), getattr(credentials, "refresh_token", None))
+    cached = services.get((api, version))
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    service = build(api, version, credentials=credentials, requestBuilder=request_builder())
+    services[(api, version)] = (fingerprint, service)
+    return service
+
+
+def _mark_worker() -> None:
+    _local.fetch_worker = True
+
+
+def _fetch_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for Google fan-out, so workers (and their cached services) outlive each call."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=max(2, settings.gmail_fetch_workers + settings.calendar_fanout_workers),
+                thread_name_prefix="google-fetch",
+                initializer=_mark_worker,
+            )
+        return _pool
+
+
+def map_concurrently(fn: Callable[[_T], _R], items: Iterable[_T], max_workers: int) -> list[_R]:
+    """``[fn(item) for item in items]`` on up to ``max_workers`` pool threads, in input order.
+
+    Each call runs in a copy of the caller's context, so tracing spans and
+    tool cancellation carry over; the shared pool's threads keep their cached
+    service between calls. Calls made from a pool thread run inline rather
+    than waiting on the pool they occupy.
+    """
+    items = list(items)
+    workers = min(max_workers, len(items))
+    if workers <= 1 or getattr(_local, "fetch_worker", False):
+        return [fn(item) for item in items]
+    results: list[Any] = [None] * len(items)
+
+    def _run(offset: int) -> None:
+        # worker ``offset`` takes every ``workers``-th item, capping this call's share of the pool
+        for index in range(offset, len(items), workers):
+            results[index] = fn(items[index])
+
+    pool = _fetch_pool()
+    futures = [pool.submit(contextvars.copy_context().run, _run, offset) for offset in range(workers)]
+    for future in futures:
+        future.result()
+    return results
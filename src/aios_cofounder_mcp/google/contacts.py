@@ -2,31 +2,37 @@ from __future__ import annotations
 
 from typing import Any
 
+from .. import search_index
 from ..settings import Settings
 from ..storage.repo import Repository
+from .client import build_service
 from .oauth import load_credentials
 
 
 def _get_service(settings: Settings, repo: Repository):
     try:
-        from googleapiclient.discovery import build
+        import googleapiclient.discovery  # noqa: F401
     except ModuleNotFoundError as exc:
         raise RuntimeError("google_api_client_not_installed") from exc
     creds = load_credentials(settings, repo)
     if not creds:
         raise RuntimeError("contacts_not_connected")
-    return build("people", "v1", credentials=creds)
+    return build_service("people", "v1", creds)
 
 
 def search_contacts(settings: Settings, repo: Repository, query: str) -> list[dict[str, Any]]:
     service = _get_service(settings, repo)
     response = service.people().searchContacts(query=query, pageSize=10, readMask="names,emailAddresses,organizations").execute()
-    return response.get("results", [])
+    results = response.get("results", [])
+    search_index.index_people(repo, [result.get("person", {}) for result in results])
+    return results
 
 
 def get_contact(settings: Settings, repo: Repository, contact_id: str) -> dict[str, Any]:
     service = _get_service(settings, repo)
-    return service.people().get(resourceName=contact_id, personFields="names,emailAddresses,organizations").execute()
+    person = service.people().get(resourceName=contact_id, personFields="names,emailAddresses,organizations").execute()
+    search_index.index_people(repo, [person])
+    return person
 
 
 def create_or_update_contact(
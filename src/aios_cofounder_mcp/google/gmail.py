@@ -3,22 +3,29 @@ from __future__ import annotations
 import base64
 import email
 from email.message import EmailMessage
-from typing import Any
+from typing import Any, Iterator
 
+from .. import rollups, search_index
+from ..dispatch import check_cancelled
 from ..settings import Settings
 from ..storage.repo import Repository
+from .client import build_service, map_concurrently
 from .oauth import load_credentials
 
 
-def _get_service(settings: Settings, repo: Repository):
+def _credentials(settings: Settings, repo: Repository):
     try:
-        from googleapiclient.discovery import build
+        import googleapiclient.discovery  # noqa: F401
     except ModuleNotFoundError as exc:
         raise RuntimeError("google_api_client_not_installed") from exc
     creds = load_credentials(settings, repo)
     if not creds:
         raise RuntimeError("gmail_not_connected")
-    return build("gmail", "v1", credentials=creds)
+    return creds
+
+
+def _get_service(settings: Settings, repo: Repository):
+    return build_service("gmail", "v1", _credentials(settings, repo))
 
 
 def _header_value(headers: list[dict[str, str]], name: str) -> str | None:
@@ -31,6 +38,8 @@ def _header_value(headers: list[dict[str, str]], name: str) -> str | None:
 def _extract_text_from_raw(raw: str) -> dict[str, str | None]:
     decoded = base64.urlsafe_b64decode(raw.encode("utf-8"))
     msg = email.message_from_bytes(decoded)
+    subject = str(msg["Subject"]) if msg["Subject"] is not None else None
+    sender = str(msg["From"]) if msg["From"] is not None else None
     text_body = None
     html_body = None
     if msg.is_multipart():
@@ -44,55 +53,168 @@ def _extract_text_from_raw(raw: str) -> dict[str, str | None]:
         payload = msg.get_payload(decode=True)
         if payload:
             text_body = payload.decode(msg.get_content_charset() or "utf-8", errors="replace")
-    return {"text": text_body, "html": html_body}
+    return {"subject": subject, "from": sender, "text": text_body, "html": html_body}
+
+
+def get_metadata(
+    settings: Settings,
+    repo: Repository,
+    message_ids: list[str],
+    headers: tuple[str, ...] = ("From", "Subject", "Date"),
+) -> list[dict[str, Any]]:
+    """``format="metadata"`` details for ``message_ids``, fetched concurrently, in input order."""
+    creds = _credentials(settings, repo)
+    requested = list(dict.fromkeys((*headers, *rollups.EMAIL_HEADERS)))
+
+    def _metadata(message_id: str) -> dict[str, Any]:
+        check_cancelled()
+        detail = (
+            build_service("gmail", "v1", creds)
+            .users()
+            .messages()
+            .get(userId="me", id=message_id, format="metadata", metadataHeaders=requested)
+            .execute()
+        )
+        found = detail.get("payload", {}).get("headers", [])
+        return {
+            "id": detail.get("id"),
+            "thread_id": detail.get("threadId"),
+            "label_ids": detail.get("labelIds", []),
+            "internal_date": detail.get("internalDate"),
+            "snippet": detail.get("snippet"),
+            "headers": {name: _header_value(found, name) for name in requested},
+        }
+
+    # the per-message gets are independent, so they run side by side instead of N round trips in a row
+    details = map_concurrently(_metadata, message_ids, settings.gmail_fetch_workers)
+    rollups.record_messages(repo, details)
+    search_index.index_messages(repo, details)
+    return details
 
 
 def search(settings: Settings, repo: Repository, query: str, limit: int) -> list[dict[str, Any]]:
     service = _get_service(settings, repo)
     results = service.users().messages().list(userId="me", q=query, maxResults=limit).execute()
     messages = results.get("messages", [])
-    output: list[dict[str, Any]] = []
-    for msg in messages:
-        detail = (
+    return [
+        {
+            "id": detail["id"],
+            "thread_id": detail["thread_id"],
+            "from": detail["headers"]["From"],
+            "subject": detail["headers"]["Subject"],
+            "date": detail["headers"]["Date"],
+            "snippet": detail["snippet"],
+        }
+        for detail in get_metadata(settings, repo, [msg["id"] for msg in messages])
+    ]
+
+
+def message_id_pages(
+    settings: Settings,
+    repo: Repository,
+    query: str,
+    page_size: int,
+    page_token: str | None = None,
+) -> Iterator[tuple[list[str], str | None]]:
+    """Lazily page through ``messages.list``: yields ``(ids, next_page_token)`` per page."""
+    service = _get_service(settings, repo)
+    while True:
+        check_cancelled()
+        page = (
             service.users()
             .messages()
-            .get(userId="me", id=msg["id"], format="metadata", metadataHeaders=["From", "Subject", "Date"])
+            .list(userId="me", q=query, maxResults=page_size, pageToken=page_token)
             .execute()
         )
-        headers = detail.get("payload", {}).get("headers", [])
-        output.append(
-            {
-                "id": detail.get("id"),
-                "thread_id": detail.get("threadId"),
-                "from": _header_value(headers, "From"),
-                "subject": _header_value(headers, "Subject"),
-                "date": _header_value(headers, "Date"),
-                "snippet": detail.get("snippet"),
-            }
-        )
-    return output
+        page_token = page.get("nextPageToken")
+        yield [msg["id"] for msg in page.get("messages", [])], page_token
+        if not page_token:
+            return
 
 
-def get_message(settings: Settings, repo: Repository, message_id: str) -> dict[str, Any]:
-    service = _get_service(settings, repo)
-    detail = service.users().messages().get(userId="me", id=message_id, format="raw").execute()
+def parse_raw_message(detail: dict[str, Any]) -> dict[str, Any]:
     raw = detail.get("raw", "")
-    parsed = _extract_text_from_raw(raw) if raw else {"text": None, "html": None}
+    parsed = _extract_text_from_raw(raw) if raw else {}
     return {
         "id": detail.get("id"),
         "thread_id": detail.get("threadId"),
+        "subject": parsed.get("subject"),
+        "from": parsed.get("from"),
         "snippet": detail.get("snippet"),
         "text": parsed.get("text"),
         "html": parsed.get("html"),
     }
 
 
+def get_message(settings: Settings, repo: Repository, message_id: str) -> dict[str, Any]:
+    service = _get_service(settings, repo)
+    detail = service.users().messages().get(userId="me", id=message_id, format="raw").execute()
+    message = parse_raw_message(detail)
+    search_index.index_messages(repo, [message])
+    return message
+
+
+def list_message_ids(settings: Settings, repo: Repository, query: str, limit: int) -> list[str]:
+    service = _get_service(settings, repo)
+    message_ids: list[str] = []
+    page_token = None
+    while len(message_ids) < limit:
+        page = (
+            service.users()
+            .messages()
+            .list(userId="me", q=query, maxResults=min(limit - len(message_ids), 500), pageToken=page_token)
+            .execute()
+        )
+        message_ids.extend(msg["id"] for msg in page.get("messages", []))
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            break
+    return message_ids[:limit]
+
+
+def get_raw_messages(settings: Settings, repo: Repository, message_ids: list[str]) -> list[dict[str, Any]]:
+    """Unparsed ``format="raw"`` messages, fetched concurrently, in input order.
+
+    A message that cannot be fetched comes back as ``{"id": ..., "error": ...}``
+    so one bad id does not fail the whole batch; parsing is left to the caller.
+    """
+    creds = _credentials(settings, repo)
+
+    def _raw(message_id: str) -> dict[str, Any]:
+        check_cancelled()
+        try:
+            return (
+                build_service("gmail", "v1", creds)
+                .users()
+                .messages()
+                .get(userId="me", id=message_id, format="raw")
+                .execute()
+            )
+        except RuntimeError:
+            raise
+        except Exception as exc:
+            return {"id": message_id, "error": str(exc) or type(exc).__name__}
+
+    return map_concurrently(_raw, message_ids, settings.gmail_fetch_workers)
+
+
 def get_thread(settings: Settings, repo: Repository, thread_id: str) -> dict[str, Any]:
     service = _get_service(settings, repo)
     detail = service.users().threads().get(userId="me", id=thread_id, format="full").execute()
     return detail
 
 
+def get_thread_index(settings: Settings, repo: Repository, thread_id: str) -> dict[str, Any]:
+    """Message ids and the thread's ``historyId`` only; a few hundred bytes however long the thread is."""
+    service = _get_service(settings, repo)
+    return (
+        service.users()
+        .threads()
+        .get(userId="me", id=thread_id, format="minimal", fields="id,historyId,messages(id,internalDate)")
+        .execute()
+    )
+
+
 def create_draft(
     settings: Settings,
     repo: Repository,
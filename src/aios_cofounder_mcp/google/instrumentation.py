@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..metrics import metrics
+from ..tracing import tracer
+
+_request_class: type | None = None
+
+
+def request_builder() -> type:
+    """``HttpRequest`` subclass that records every ``.execute()`` in metrics and traces.
+
+    Pass as ``requestBuilder`` to ``googleapiclient.discovery.build`` so each
+    API call is timed by its method id (``gmail.users.messages.get``...). The
+    class is created on first use because ``googleapiclient`` is optional.
+    """
+    global _request_class
+    if _request_class is None:
+        from googleapiclient.http import HttpRequest
+
+        class InstrumentedHttpRequest(HttpRequest):
+            def __init__(self, http: Any, postproc: Any, uri: str, *args: Any, **kwargs: Any) -> None:
+                received = [0]
+
+                def _measured_postproc(resp: Any, content: bytes | None) -> Any:
+                    received[0] = len(content or b"")
+                    return postproc(resp, content)
+
+                super().__init__(http, _measured_postproc, uri, *args, **kwargs)
+                self._received = received
+
+            def execute(self, *args: Any, **kwargs: Any) -> Any:
+                name = self.methodId or self.method
+                with tracer.span(name, "google", method=self.method), metrics.timed("google", name) as observation:
+                    body = self.body or b""
+                    observation.bytes_in = len(body.encode("utf-8") if isinstance(body, str) else body)
+                    try:
+                        return super().execute(*args, **kwargs)
+                    finally:
+                        observation.bytes_out = self._received[0]
+
+        _request_class = InstrumentedHttpRequest
+    return _request_class
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import calendar as calendar_math
+import heapq
+from collections import ChainMap
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Iterable, Iterator, Mapping
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_COMMON_PARTS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "WKST"}
+# BY* parts that _period_days applies for each FREQ; anything else goes to events.instances
+_FREQ_PARTS = {
+    "DAILY": {"BYDAY"},
+    "WEEKLY": {"BYDAY"},
+    "MONTHLY": {"BYDAY", "BYMONTHDAY", "BYSETPOS"},
+    "YEARLY": {"BYMONTH", "BYDAY", "BYMONTHDAY", "BYSETPOS"},
+}
+# hard stop for rules without COUNT/UNTIL whose window is far from DTSTART
+_MAX_PERIODS = 100_000
+
+
+def _zone(name: str | None, fallback: tzinfo) -> tzinfo:
+    if not name:
+        return fallback
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return fallback
+
+
+def _parse_instant(value: str) -> datetime:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def start_key(event: Mapping[str, Any]) -> datetime:
+    start = event.get("start", {})
+    if start.get("dateTime"):
+        return _parse_instant(start["dateTime"])
+    return datetime.combine(date.fromisoformat(start["date"]), datetime.min.time(), tzinfo=timezone.utc)
+
+
+def _original_key(event: Mapping[str, Any]) -> datetime | date | None:
+    original = event.get("originalStartTime", {})
+    if original.get("dateTime"):
+        return _parse_instant(original["dateTime"])
+    if original.get("date"):
+        return date.fromisoformat(original["date"])
+    return None
+
+
+def _parse_ical_values(line: str, tz: tzinfo) -> list[datetime | date]:
+    params, _, raw = line.partition(":")
+    options = dict(part.split("=", 1) for part in params.split(";")[1:] if "=" in part)
+    value_tz = _zone(options.get("TZID"), tz)
+    values: list[datetime | date] = []
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if options.get("VALUE") == "DATE" or "T" not in item:
+            values.append(datetime.strptime(item[:8], "%Y%m%d").date())
+        elif item.endswith("Z"):
+            values.append(datetime.strptime(item, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc))
+        else:
+            values.append(datetime.strptime(item, "%Y%m%dT%H%M%S").replace(tzinfo=value_tz))
+    return values
+
+
+def _parse_rrule(line: str) -> dict[str, str]:
+    _, _, raw = line.partition(":")
+    parts = dict(part.split("=", 1) for part in raw.split(";") if "=" in part)
+    freq = parts.get("FREQ")
+    if freq not in _FREQ_PARTS or not set(parts) <= _COMMON_PARTS | _FREQ_PARTS[freq] or not _expandable(freq, parts):
+        raise ValueError(f"unsupported_rrule:{raw}")
+    return parts
+
+
+def _expandable(freq: str, parts: dict[str, str]) -> bool:
+    """Combinations the period expansion gets right, beyond the per-FREQ part lists."""
+    # weeks are counted from Monday, which only matters when skipping weeks
+    if parts.get("WKST", "MO") != "MO" and freq == "WEEKLY" and parts.get("INTERVAL", "1") != "1":
+        return False
+    byday = parts.get("BYDAY")
+    if byday and freq in {"DAILY", "WEEKLY"} and any(len(item.strip()) > 2 for item in byday.split(",")):
+        return False
+    # _month_days uses BYDAY or BYMONTHDAY, not their intersection
+    if byday and parts.get("BYMONTHDAY"):
+        return False
+    if freq == "YEARLY" and not parts.get("BYMONTH") and {"BYDAY", "BYMONTHDAY", "BYSETPOS"} & set(parts):
+        # these span the whole year; only the anchor month would be expanded
+        return False
+    # BYSETPOS is applied per month, which matches the yearly set only for a single month
+    return not (freq == "YEARLY" and parts.get("BYSETPOS") and "," in parts.get("BYMONTH", ""))
+
+
+def is_supported(master: Mapping[str, Any]) -> bool:
+    """Whether every RRULE of ``master`` can be expanded locally."""
+    try:
+        for line in master.get("recurrence", []):
+            if line.upper().startswith("RRULE"):
+                _parse_rrule(line)
+    except ValueError:
+        return False
+    return True
+
+
+def _byday(value: str | None) -> list[tuple[int, int]]:
+    """Parse ``BYDAY`` into ``(ordinal, weekday)`` pairs; ordinal 0 means every such weekday."""
+    if not value:
+        return []
+    parsed = []
+    for item in value.split(","):
+        item = item.strip()
+        ordinal = int(item[:-2]) if len(item) > 2 else 0
+        parsed.append((ordinal, _WEEKDAYS[item[-2:]]))
+    return parsed
+
+
+def _month_days(year: int, month: int, rule: dict[str, str], anchor: date) -> list[date]:
+    last_day = calendar_math.monthrange(year, month)[1]
+    byday = _byday(rule.get("BYDAY"))
+    days: list[date] = []
+    if byday:
+        for ordinal, weekday in byday:
+            matches = [
+                date(year, month, day)
+                for day in range(1, last_day + 1)
+                if date(year, month, day).weekday() == weekday
+            ]
+            if ordinal == 0:
+                days.extend(matches)
+            elif -len(matches) <= ordinal <= len(matches) and ordinal:
+                days.append(matches[ordinal - 1 if ordinal > 0 else ordinal])
+    else:
+        for raw in (rule.get("BYMONTHDAY") or str(anchor.day)).split(","):
+            day = int(raw)
+            day = day if day > 0 else last_day + day + 1
+            # e.g. the 31st simply does not occur in shorter months
+            if 1 <= day <= last_day:
+                days.append(date(year, month, day))
+    days = sorted(set(days))
+    if rule.get("BYSETPOS"):
+        positions = [int(pos) for pos in rule["BYSETPOS"].split(",")]
+        days = sorted({days[pos - 1 if pos > 0 else pos] for pos in positions if -len(days) <= pos <= len(days) and pos})
+    return days
+
+
+def _period_days(rule: dict[str, str], anchor: date, period: int) -> list[date]:
+    """Candidate dates for the ``period``-th interval step after ``anchor``."""
+    freq = rule["FREQ"]
+    interval = int(rule.get("INTERVAL", "1"))
+    if freq == "DAILY":
+        day = anchor + timedelta(days=period * interval)
+        byday = {weekday for _, weekday in _byday(rule.get("BYDAY"))}
+        return [day] if not byday or day.weekday() in byday else []
+    if freq == "WEEKLY":
+        week_start = anchor - timedelta(days=anchor.weekday()) + timedelta(weeks=period * interval)
+        weekdays = sorted({weekday for _, weekday in _byday(rule.get("BYDAY"))} or {anchor.weekday()})
+        return [week_start + timedelta(days=weekday) for weekday in weekdays]
+    if freq == "MONTHLY":
+        month_index = anchor.month - 1 + period * interval
+        return _month_days(anchor.year + month_index // 12, month_index % 12 + 1, rule, anchor)
+    year = anchor.year + period * interval
+    months = [int(month) for month in (rule.get("BYMONTH") or str(anchor.month)).split(",")]
+    days: list[date] = []
+    for month in months:
+        days.extend(_month_days(year, month, rule, anchor))
+    return days
+
+
+def _occurrences(
+    rule: dict[str, str] | None,
+    first: datetime | date,
+    rdates: list[datetime | date],
+    window_end: datetime,
+) -> Iterator[datetime | date]:
+    """Yield recurrence start values in order, from DTSTART up to ``window_end``."""
+    all_day = not isinstance(first, datetime)
+    anchor = first if all_day else first.date()
+    until: datetime | date | None = None
+    if rule and rule.get("UNTIL"):
+        until = _parse_ical_values(f"UNTIL:{rule['UNTIL']}", first.tzinfo if not all_day else timezone.utc)[0]
+        if all_day and isinstance(until, datetime):
+            until = until.date()
+        elif not all_day and not isinstance(until, datetime):
+            until = datetime.combine(until, datetime.max.time(), tzinfo=first.tzinfo)
+    remaining = int(rule["COUNT"]) if rule and rule.get("COUNT") else None
+
+    def _instant(value: datetime | date) -> datetime:
+        if isinstance(value, datetime):
+            return value
+        return datetime.combine(value, datetime.min.time(), tzinfo=timezone.utc)
+
+    def _generate() -> Iterator[datetime | date]:
+        nonlocal remaining
+        if rule is None:
+            yield first
+            return
+        for period in range(_MAX_PERIODS):
+            for day in _period_days(rule, anchor, period):
+                value: datetime | date = day if all_day else datetime.combine(day, first.time(), tzinfo=first.tzinfo)
+                if _instant(value) < _instant(first):
+                    continue
+                if until is not None and value > until:
+                    return
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield value
+                if _instant(value) >= window_end:
+                    return
+
+    previous: datetime | date | None = None
+    for value in heapq.merge(_generate(), sorted(rdates, key=_instant), key=_instant):
+        if _instant(value) >= window_end:
+            return
+        # an RDATE may repeat a generated occurrence; duplicates are adjacent once merged
+        if value != previous:
+            yield value
+        previous = value
+
+
+def expand_master(
+    master: Mapping[str, Any],
+    window_start: datetime,
+    window_end: datetime,
+    exceptions: Mapping[datetime | date, Mapping[str, Any]] | None = None,
+) -> Iterator[Mapping[str, Any]]:
+    """Lazily yield instances of a recurring master that overlap the window.
+
+    Instances are ``ChainMap`` views whose first map only holds the
+    per-instance fields (id, start/end, originalStartTime); everything else
+    is read straight from the master without copying. Instances replaced or
+    cancelled by an exception are skipped; the exceptions themselves are
+    emitted by :func:`expand_events`.
+    """
+    exceptions = exceptions or {}
+    start = master.get("start", {})
+    end = master.get("end", {})
+    all_day = "dateTime" not in start
+    tz_name = start.get("timeZone")
+    if all_day:
+        first: datetime | date = date.fromisoformat(start["date"])
+        duration = date.fromisoformat(end["date"]) - first
+    else:
+        first_utc = _parse_instant(start["dateTime"])
+        tz = _zone(tz_name, first_utc.tzinfo or timezone.utc)
+        first = first_utc.astimezone(tz)
+        duration = _parse_instant(end["dateTime"]) - first_utc
+
+    rule: dict[str, str] | None = None
+    rdates: list[datetime | date] = []
+    exdates: set[datetime | date] = set()
+    local_tz = first.tzinfo if isinstance(first, datetime) else timezone.utc
+    for line in master.get("recurrence", []):
+        upper = line.upper()
+        if upper.startswith("RRULE"):
+            rule = _parse_rrule(line)
+        elif upper.startswith("EXDATE"):
+            exdates.update(_parse_ical_values(line, local_tz))
+        elif upper.startswith("RDATE"):
+            rdates.extend(_parse_ical_values(line, local_tz))
+
+    master_id = master.get("id", "")
+    for value in _occurrences(rule, first, rdates, window_end):
+        if value in exdates or value in exceptions:
+            continue
+        if isinstance(value, datetime):
+            instance_end = (value.astimezone(timezone.utc) + duration).astimezone(value.tzinfo)
+            if instance_end <= window_start:
+                continue
+            suffix = value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            start_field = {"dateTime": value.isoformat(), **({"timeZone": tz_name} if tz_name else {})}
+            end_field = {"dateTime": instance_end.isoformat(), **({"timeZone": tz_name} if tz_name else {})}
+        else:
+            instance_end_day = value + duration
+            if datetime.combine(instance_end_day, datetime.min.time(), tzinfo=timezone.utc) <= window_start:
+                continue
+            suffix = value.strftime("%Y%m%d")
+            start_field = {"date": value.isoformat()}
+            end_field = {"date": instance_end_day.isoformat()}
+        yield ChainMap(
+            {
+                "id": f"{master_id}_{suffix}",
+                "recurringEventId": master_id,
+                "originalStartTime": start_field,
+                "start": start_field,
+                "end": end_field,
+            },
+            master,  # type: ignore[arg-type]
+        )
+
+
+def expand_events(
+    items: Iterable[Mapping[str, Any]],
+    window_start: str | datetime,
+    window_end: str | datetime,
+    series_exceptions: Iterable[Mapping[str, Any]] = (),
+) -> Iterator[Mapping[str, Any]]:
+    """Expand an ``events.list(singleEvents=False)`` listing into time-ordered instances.
+
+    Masters must pass :func:`is_supported`; callers fetch the others with
+    ``events.instances`` and pass the results in as plain items. A time-bounded
+    listing misses exceptions moved out of the window, so
+    ``series_exceptions`` takes every exception of the listed masters: they
+    only suppress the occurrence they replace and are never emitted.
+    """
+    start_dt = window_start if isinstance(window_start, datetime) else _parse_instant(window_start)
+    end_dt = window_end if isinstance(window_end, datetime) else _parse_instant(window_end)
+    masters: list[Mapping[str, Any]] = []
+    singles: list[Mapping[str, Any]] = []
+    exceptions: dict[str, dict[datetime | date, Mapping[str, Any]]] = {}
+    for item in series_exceptions:
+        key = _original_key(item)
+        if item.get("recurringEventId") and key is not None:
+            exceptions.setdefault(item["recurringEventId"], {})[key] = item
+    for item in items:
+        if item.get("recurrence"):
+            masters.append(item)
+        elif item.get("recurringEventId"):
+            key = _original_key(item)
+            if key is not None:
+                exceptions.setdefault(item["recurringEventId"], {})[key] = item
+            if item.get("status") != "cancelled":
+                singles.append(item)
+        elif item.get("status") != "cancelled":
+            singles.append(item)
+    streams = [sorted(singles, key=start_key)]
+    streams.extend(
+        expand_master(master, start_dt, end_dt, exceptions.get(master.get("id", ""))) for master in masters
+    )
+    return heapq.merge(*streams, key=start_key)
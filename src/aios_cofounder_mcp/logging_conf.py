@@ -1,8 +1,89 @@
+import atexit
+import copy
+import json
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable
 
+_TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+# attributes every LogRecord has; anything else was passed via ``extra=``
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+_listener: QueueListener | None = None
 
-def configure_logging(level: str) -> None:
-    logging.basicConfig(
-        level=level.upper(),
-        format="%(asctime)s %(levelname)s %(name)s %(message)s",
-    )
+
+class Lazy:
+    """Defers an expensive log argument until a handler actually formats it."""
+
+    __slots__ = ("_fn", "_args", "_value", "_done")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        self._fn = fn
+        self._args = args
+        self._done = False
+        self._value: Any = None
+
+    def value(self) -> Any:
+        if not self._done:
+            self._value = self._fn(*self._args)
+            self._done = True
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value())
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Lazy):
+        return value.value()
+    return str(value)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=_json_default)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # unlike QueueHandler.prepare, leave msg % args (and any Lazy values)
+        # for the listener thread to format
+        return copy.copy(record)
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(level: str, log_format: str = "text", use_queue: bool = False) -> None:
+    global _listener
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter() if log_format.lower() == "json" else logging.Formatter(_TEXT_FORMAT))
+    # reconfiguring replaces the listener; the old one drains its queue first
+    _stop_listener()
+    if not use_queue:
+        logging.basicConfig(level=level.upper(), handlers=[handler], force=True)
+        return
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logging.basicConfig(level=level.upper(), handlers=[_DeferredQueueHandler(records)], force=True)
+    _listener = QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+
+
+# one shutdown hook for whichever listener is current at exit
+atexit.register(_stop_listener)
@@ -5,9 +5,12 @@ from urllib.parse import urlparse
 
 import uvicorn
 
+from .approvals import start_expiry_sweeper
+from .assistant.precompute import start_brief_precompute
 from .logging_conf import configure_logging
 from .settings import settings
 from .storage.db import init_db
+from .storage.repo import Repository
 from .server import mcp
 from .oauth_routes import build_oauth_callback_app
 
@@ -29,8 +32,11 @@ def _start_oauth_callback_server() -> None:
 
 
 def main() -> None:
-    configure_logging(settings.log_level)
+    configure_logging(settings.log_level, settings.log_format, settings.log_queue)
     init_db(settings.db_url)
+    repo = Repository(settings.db_url)
+    start_expiry_sweeper(repo, settings)
+    start_brief_precompute(repo, settings)
     # intentionally started in a background thread to avoid blocking stdio transport
     _start_oauth_callback_server()
     if hasattr(mcp, "run"):
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+# seconds; spans a cached SQLite read up to a slow Gmail thread fetch
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class Observation:
+    """Mutable record handed out by :meth:`Metrics.timed` so callers can attach sizes."""
+
+    error: bool = False
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+@dataclass
+class _Series:
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = LATENCY_BUCKETS[index - 1] if index > 0 else 0.0
+                upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else LATENCY_BUCKETS[-1]
+                # linear interpolation inside the bucket, as Prometheus' histogram_quantile does
+                return lower + (upper - lower) * ((rank - seen) / bucket_count)
+            seen += bucket_count
+        return LATENCY_BUCKETS[-1]
+
+
+class Metrics:
+    """Call counts, errors, latency histograms and byte counters by ``(kind, name)``.
+
+    ``kind`` is the layer (``tool``, ``google``, ``repository``) and ``name``
+    the operation, so a slow composite tool can be broken down by layer.
+    """
+
+    def __init__(self) -> None:
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        kind: str,
+        name: str,
+        seconds: float,
+        *,
+        error: bool = False,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+    ) -> None:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = self._series[(kind, name)] = _Series()
+            series.count += 1
+            series.errors += int(error)
+            series.total_seconds += seconds
+            series.bytes_in += bytes_in
+            series.bytes_out += bytes_out
+            series.buckets[bucket] += 1
+
+    @contextmanager
+    def timed(self, kind: str, name: str) -> Iterator[Observation]:
+        observation = Observation()
+        started = time.perf_counter()
+        try:
+            yield observation
+        except BaseException:
+            observation.error = True
+            raise
+        finally:
+            self.observe(
+                kind,
+                name,
+                time.perf_counter() - started,
+                error=observation.error,
+                bytes_in=observation.bytes_in,
+                bytes_out=observation.bytes_out,
+            )
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        with self._lock:
+            items = [(key, _Series(**{**vars(series), "buckets": list(series.buckets)})) for key, series in self._series.items()]
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (kind, name), series in sorted(items):
+            result.setdefault(kind, {})[name] = {
+                "count": series.count,
+                "errors": series.errors,
+                "mean_ms": round(series.total_seconds / series.count * 1000, 3) if series.count else None,
+                "p50_ms": _ms(series.quantile(0.5)),
+                "p95_ms": _ms(series.quantile(0.95)),
+                "p99_ms": _ms(series.quantile(0.99)),
+                "bytes_in": series.bytes_in,
+                "bytes_out": series.bytes_out,
+            }
+        return result
+
+    def prometheus(self) -> str:
+        with self._lock:
+            items = sorted((key, _Series(**{**vars(series), "buckets": list(series.buckets)})) for key, series in self._series.items())
+        lines = [
+            "# TYPE aios_calls_total counter",
+            "# TYPE aios_errors_total counter",
+            "# TYPE aios_bytes_in_total counter",
+            "# TYPE aios_bytes_out_total counter",
+            "# TYPE aios_latency_seconds histogram",
+        ]
+        for (kind, name), series in items:
+            labels = f'kind="{_escape(kind)}",name="{_escape(name)}"'
+            lines.append(f"aios_calls_total{{{labels}}} {series.count}")
+            lines.append(f"aios_errors_total{{{labels}}} {series.errors}")
+            lines.append(f"aios_bytes_in_total{{{labels}}} {series.bytes_in}")
+            lines.append(f"aios_bytes_out_total{{{labels}}} {series.bytes_out}")
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, series.buckets):
+                cumulative += bucket_count
+                lines.append(f'aios_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'aios_latency_seconds_bucket{{{labels},le="+Inf"}} {series.count}')
+            lines.append(f"aios_latency_seconds_sum{{{labels}}} {series.total_seconds:.6f}")
+            lines.append(f"aios_latency_seconds_count{{{labels}}} {series.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def instrument_methods(kind: str) -> Callable[[type[_T]], type[_T]]:
+    """Class decorator timing every public method under ``kind``."""
+
+    def decorator(cls: type[_T]) -> type[_T]:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value):
+                continue
+            setattr(cls, attr, _timed_method(kind, value))
+        return cls
+
+    return decorator
+
+
+def _timed_method(kind: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        with metrics.timed(kind, method.__name__):
+            return method(*args, **kwargs)
+
+    return _wrapper
+
+
+metrics = Metrics()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+_logger = logging.getLogger("aios_cofounder_mcp.notifications")
+
+Listener = Callable[[int, str], None]
+
+
+class ApprovalNotifier:
+    """In-process fan-out of approval status changes.
+
+    ``Repository`` publishes after it commits a resolution; waiters (the
+    ``approval_wait`` tool, resource-update subscriptions) register
+    listeners instead of polling the database.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: dict[int, list[Listener]] = {}
+        self._global: list[Listener] = []
+        self._lock = threading.Lock()
+
+    def listen(self, listener: Listener, approval_id: int | None = None) -> Callable[[], None]:
+        """Call ``listener(approval_id, status)`` on changes; returns an unsubscribe function."""
+        with self._lock:
+            bucket = self._global if approval_id is None else self._listeners.setdefault(approval_id, [])
+            bucket.append(listener)
+
+        def _remove() -> None:
+            with self._lock:
+                if listener in bucket:
+                    bucket.remove(listener)
+                if approval_id is not None and not bucket:
+                    self._listeners.pop(approval_id, None)
+
+        return _remove
+
+    def publish(self, approval_id: int, status: str) -> None:
+        with self._lock:
+            listeners = list(self._listeners.get(approval_id, ())) + list(self._global)
+        for listener in listeners:
+            try:
+                listener(approval_id, status)
+            except Exception:  # a broken listener must not fail the resolving call
+                _logger.exception("approval listener failed for %s", approval_id)
+
+
+approval_events = ApprovalNotifier()
@@ -5,6 +5,7 @@ from starlette.requests import Request
 from starlette.responses import HTMLResponse, PlainTextResponse
 from starlette.routing import Route
 
+from .metrics import metrics
 from .server import mcp
 from .settings import settings
 from .storage.repo import Repository
@@ -37,6 +38,11 @@ async def google_oauth_callback(request: Request):
     )
 
 
+@mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    return PlainTextResponse(metrics.prometheus(), media_type="text/plain; version=0.0.4")
+
+
 def build_oauth_callback_app() -> Starlette:
     return Starlette(
         routes=[
@@ -44,6 +50,7 @@ def build_oauth_callback_app() -> Starlette:
                 "/oauth/google/callback",
                 endpoint=google_oauth_callback,
                 methods=["GET"],
-            )
+            ),
+            Route("/metrics", endpoint=prometheus_metrics, methods=["GET"]),
         ]
     )
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .settings import Settings, settings
+
+# rough average for English/JSON text; only used to report an estimate to clients
+BYTES_PER_TOKEN = 4
+# continuation chunks never go below this, so tiny budgets still make progress
+MIN_CHUNK_BYTES = 1024
+# first guess at the chunk fields around ``partial_json``; chunks are measured and trimmed after
+_CHUNK_FIELDS_BYTES = 256
+# truncation levels: lists keep 2**level items, strings 32 * 2**level characters
+_MAX_LEVEL = 20
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _shrink(value: Any, max_items: int, max_chars: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= max_chars else value[:max_chars] + "\u2026"
+    if isinstance(value, dict):
+        return {key: _shrink(item, max_items, max_chars) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_shrink(item, max_items, max_chars) for item in value[:max_items]]
+    return value
+
+
+def _parse_budgets(raw: str | None) -> dict[str, int]:
+    budgets: dict[str, int] = {}
+    for item in (raw or "").replace(" ", ",").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value.strip():
+            budgets[name.strip()] = int(value)
+    return budgets
+
+
+def _char_boundary(payload: bytes, offset: int, end: int) -> int:
+    """``end`` moved back to the start of a UTF-8 sequence, but past at least one character."""
+    end = min(len(payload), end)
+    while offset < end < len(payload) and payload[end] & 0xC0 == 0x80:
+        end -= 1
+    if end <= offset:
+        end = offset + 1
+        while end < len(payload) and payload[end] & 0xC0 == 0x80:
+            end += 1
+    return end
+
+
+@dataclass
+class _Pending:
+    tool: str
+    payload: bytes
+    chunk_bytes: int
+    # bytes of the response envelope around ``data`` (``ok``, ``error``...)
+    envelope_bytes: int
+    created: float
+
+
+class OutputBudget:
+    """Caps serialized tool output and keeps the full result for continuation calls.
+
+    Oversized ``data`` is replaced by a structurally truncated copy that is
+    itself valid JSON within the budget: every list is cut to its first
+    ``max_items`` entries and every string to ``max_chars`` characters, at
+    the largest level that fits, so the same input always yields the same
+    page. The complete result stays available as compact JSON; clients
+    concatenate ``partial_json`` from ``tool_output_continue`` calls
+    (starting at offset 0) and parse it. Budgets cover the whole response,
+    envelope included, and chunk sizes count the escaping ``partial_json``
+    needs as a JSON string. A handle stays valid until it expires or is
+    evicted, so any chunk (the last one too) can be fetched again.
+    """
+
+    def __init__(self, default_bytes: int, per_tool: dict[str, int], max_pending: int = 64, ttl_seconds: int = 900) -> None:
+        self.default_bytes = default_bytes
+        self.per_tool = dict(per_tool)
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self._pending: OrderedDict[str, _Pending] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def limit_for(self, tool_name: str) -> int:
+        return self.per_tool.get(tool_name, self.default_bytes)
+
+    def apply(self, tool_name: str, response: dict[str, Any], encoded: bytes | None = None) -> dict[str, Any]:
+        """Return ``response`` or, if its ``data`` is over budget, a truncated first page.
+
+        ``encoded`` may carry ``data`` already serialized as compact UTF-8 JSON.
+        """
+        limit = self.limit_for(tool_name)
+        data = response.get("data")
+        if limit <= 0 or not response.get("ok") or data is None:
+            return response
+        if encoded is None:
+            encoded = _dumps(data)
+        envelope = len(_dumps({**response, "data": None})) - len(b"null")
+        if envelope + len(encoded) <= limit:
+            return response
+        handle = uuid.uuid4().hex
+        with self._lock:
+            self._expire()
+            self._pending[handle] = _Pending(
+                tool_name, encoded, max(limit, MIN_CHUNK_BYTES), envelope, time.monotonic()
+            )
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+        return {**response, "data": self._first_page(handle, data, encoded, limit - envelope)}
+
+    @staticmethod
+    def _first_page(handle: str, data: Any, encoded: bytes, limit: int) -> dict[str, Any]:
+        def _page(level: int | None) -> dict[str, Any]:
+            return {
+                "truncated": True,
+                "result": None if level is None else _shrink(data, 2**level, 32 * 2**level),
+                "max_items": None if level is None else 2**level,
+                "max_chars": None if level is None else 32 * 2**level,
+                "continuation": handle,
+                "next_offset": 0,
+                "total_bytes": len(encoded),
+                "approx_total_tokens": len(encoded) // BYTES_PER_TOKEN,
+            }
+
+        # binary search for the largest level whose page fits; size grows with the level
+        best: dict[str, Any] | None = None
+        low, high = 0, _MAX_LEVEL
+        while low <= high:
+            level = (low + high) // 2
+            page = _page(level)
+            if len(_dumps(page)) <= limit:
+                best, low = page, level + 1
+            else:
+                high = level - 1
+        return best if best is not None else _page(None)
+
+    def continue_from(self, handle: str, offset: int) -> dict[str, Any] | None:
+        """The chunk at ``offset``, sized so that it fits the budget inside the ``response_ok`` envelope."""
+        with self._lock:
+            self._expire()
+            pending = self._pending.get(handle)
+            if pending is None:
+                return None
+            self._pending.move_to_end(handle)
+        return self._chunk(handle, pending.payload, offset, pending.chunk_bytes - pending.envelope_bytes)
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for handle in [key for key, item in self._pending.items() if item.created < cutoff]:
+            del self._pending[handle]
+
+    @staticmethod
+    def _chunk(handle: str, payload: bytes, offset: int, size: int) -> dict[str, Any]:
+        offset = max(0, min(offset, len(payload)))
+        end = _char_boundary(payload, offset, offset + size - _CHUNK_FIELDS_BYTES)
+        while True:
+            chunk = {
+                "truncated": True,
+                "continuation": handle,
+                "partial_json": payload[offset:end].decode("utf-8"),
+                "offset": offset,
+                "next_offset": end if end < len(payload) else None,
+                "total_bytes": len(payload),
+                "approx_total_tokens": len(payload) // BYTES_PER_TOKEN,
+            }
+            # quotes and backslashes in the JSON text are escaped again inside the string
+            excess = len(_dumps(chunk)) - size
+            shorter = _char_boundary(payload, offset, end - excess) if excess > 0 else end
+            # a chunk always carries at least one character, even over a tiny budget
+            if shorter >= end:
+                return chunk
+            end = shorter
+
+
+def build_output_budget(settings: Settings) -> OutputBudget:
+    return OutputBudget(
+        default_bytes=settings.tool_output_max_bytes,
+        per_tool=_parse_budgets(settings.tool_output_budgets),
+    )
+
+
+output_budget = build_output_budget(settings)
@@ -7,7 +7,7 @@ from ..server import mcp
 def email_followup_prompt() -> str:
     return (
         "You are drafting polite, concise follow-ups.\n"
-        "Tools to use: gmail_search, gmail_get_thread, compose_email_reply, gmail_create_draft.\n"
+        "Tools to use: context_search (local mail, events, contacts and notes in one query), gmail_search, summarize_thread, gmail_get_thread, compose_email_reply, gmail_create_draft.\n"
         "Process: identify stalled threads, draft a follow-up, create a Gmail draft only.\n"
         "Output JSON schema: {\"thread_id\": \"...\", \"draft\": {\"subject\": \"...\", \"body\": \"...\"}}\n"
         "Never send email; only create drafts."
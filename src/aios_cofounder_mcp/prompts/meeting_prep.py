@@ -10,7 +10,7 @@ def meeting_prep_prompt() -> str:
     # return "Prepare a meeting brief with key context and action items."
     return (
         "You are preparing a concise meeting brief.\n"
-        "Tools to use: calendar_list_events, calendar://event/{id}, meeting_brief, gmail_search.\n"
+        "Tools to use: context_search (local mail, events, contacts and notes in one query), calendar_list_events, calendar://event/{id}, meeting_brief, gmail_search.\n"
         "Process: fetch event details, summarize attendees and purpose, pull recent related emails, suggest talking points.\n"
         "Output JSON schema: {\"event\": {..}, \"brief\": {..}, \"talking_points\": [..]}\n"
         "Do not create, update, or cancel events without approval."
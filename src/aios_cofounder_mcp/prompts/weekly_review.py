@@ -7,7 +7,9 @@ from ..server import mcp
 def weekly_review_prompt() -> str:
     return (
         "You are preparing a weekly review summary.\n"
-        "Tools to use: gmail_search, calendar_list_events, assistant://notes, assistant://audit.\n"
+        "Tools to use: weekly_review_data first (meetings, hours, email volume per contact, approvals, notes and "
+        "audited actions for the week in one call), then gmail_search, calendar_list_events and assistant://notes "
+        "only for the details behind the numbers; use audit_query with filters only if specific entries are needed.\n"
         "Process: summarize key email threads, upcoming meetings, and notable actions.\n"
         "Output JSON schema: {\"summary\": \"...\", \"highlights\": [..], \"risks\": [..], \"next_actions\": [..]}\n"
         "Do not perform any external actions."
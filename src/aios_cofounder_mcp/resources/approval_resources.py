@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from ..notifications import approval_events
+from ..server import mcp
+from ..settings import settings
+from ..storage.repo import Repository
+
+
+_repo = Repository(settings.db_url)
+_logger = logging.getLogger("aios_cofounder_mcp.resources.approvals")
+# uri -> sessions that sent resources/subscribe, with the loop serving each
+_subscribers: dict[str, dict[Any, asyncio.AbstractEventLoop]] = {}
+
+
+@mcp.resource("approvals://{approval_id}")
+def approval_record(approval_id: int) -> dict:
+    record = _repo.get_approval(int(approval_id))
+    return record if record else {"error": "approval_not_found"}
+
+
+def _send_update(uri: str, session: Any, loop: asyncio.AbstractEventLoop) -> None:
+    def _done(future: Any) -> None:
+        if future.exception() is not None:
+            # the client went away; stop notifying it
+            _subscribers.get(uri, {}).pop(session, None)
+            _logger.debug("resource update for %s failed: %s", uri, future.exception())
+
+    asyncio.run_coroutine_threadsafe(session.send_resource_updated(uri), loop).add_done_callback(_done)
+
+
+def _notify_subscribers(approval_id: int, status: str) -> None:
+    uri = f"approvals://{approval_id}"
+    for session, loop in list(_subscribers.get(uri, {}).items()):
+        _send_update(uri, session, loop)
+
+
+def _subscription_server(app: Any) -> Any | None:
+    """The low-level MCP server behind ``app``, if it can take subscription handlers.
+
+    FastMCP has no public hook for ``resources/subscribe``, so this is the only
+    place that reaches into its private ``_mcp_server``. Without one (the test
+    shim) or with an incompatible FastMCP, subscriptions are disabled instead
+    of failing the import; clients can still poll or use ``approval_wait``.
+    """
+    server = getattr(app, "_mcp_server", None)
+    if server is None:
+        return None
+    if not all(callable(getattr(server, name, None)) for name in ("subscribe_resource", "unsubscribe_resource")):
+        _logger.warning("this FastMCP does not support resource subscriptions; approvals:// updates are disabled")
+        return None
+    return server
+
+
+def _register_subscriptions(app: Any) -> Callable[[], None] | None:
+    """Route ``resources/subscribe`` for approvals to this module; returns a function that stops notifying."""
+    server = _subscription_server(app)
+    if server is None:
+        return None
+
+    @server.subscribe_resource()
+    async def _subscribe(uri: Any) -> None:
+        session = server.request_context.session
+        _subscribers.setdefault(str(uri), {})[session] = asyncio.get_running_loop()
+
+    @server.unsubscribe_resource()
+    async def _unsubscribe(uri: Any) -> None:
+        _subscribers.get(str(uri), {}).pop(server.request_context.session, None)
+
+    return approval_events.listen(_notify_subscribers)
+
+
+_register_subscriptions(mcp)
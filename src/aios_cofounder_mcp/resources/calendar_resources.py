@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ..cache import result_cache
 from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
@@ -10,6 +11,7 @@ _repo = Repository(settings.db_url)
 
 
 @mcp.resource("calendar://event/{event_id}")
+@result_cache.cached("calendar://event", ttl=60, tags=lambda arguments, result: {f"event:{arguments['event_id']}"})
 def calendar_event(event_id: str) -> dict:
     try:
         return calendar_client.get_event(settings, _repo, event_id)
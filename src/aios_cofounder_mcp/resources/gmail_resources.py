@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ..cache import result_cache
 from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
@@ -9,7 +10,12 @@ from ..google import gmail as gmail_client
 _repo = Repository(settings.db_url)
 
 
+def _thread_tags(arguments: dict, result: dict) -> set[str]:
+    return {f"thread:{arguments['thread_id']}"} | {f"message:{message.get('id')}" for message in result.get("messages", [])}
+
+
 @mcp.resource("gmail://thread/{thread_id}")
+@result_cache.cached("gmail://thread", ttl=120, tags=_thread_tags)
 def gmail_thread(thread_id: str) -> dict:
     try:
         return gmail_client.get_thread(settings, _repo, thread_id)
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
 from ..google import oauth
+from ..cache import result_cache
+from ..dispatch import dispatcher
+from ..metrics import metrics
+from ..tracing import tracer
 
 
 _repo = Repository(settings.db_url)
@@ -35,6 +41,38 @@ def assistant_notes() -> dict:
     return {"notes": _repo.list_notes()}
 
 
+@mcp.resource("assistant://approvals")
+def assistant_approvals() -> dict:
+    return {"approvals": _repo.list_approvals(history_seconds=settings.approval_history_seconds)}
+
+
 @mcp.resource("assistant://audit")
 def assistant_audit() -> dict:
     return {"audit": _repo.list_audit()}
+
+
+@mcp.resource("assistant://audit/stats")
+def assistant_audit_stats() -> dict:
+    # the last 7 days including today, served from the daily rollup
+    since = (datetime.now(timezone.utc) - timedelta(days=6)).date().isoformat()
+    return _repo.audit_stats(since_day=since)
+
+
+@mcp.resource("dispatch://stats")
+def dispatch_stats() -> dict:
+    return {"groups": dispatcher.stats()}
+
+
+@mcp.resource("metrics://tools")
+def metrics_tools() -> dict:
+    return metrics.snapshot()
+
+
+@mcp.resource("traces://recent")
+def traces_recent() -> dict:
+    return {"sample_rate": tracer.sample_rate, "traces": tracer.recent()}
+
+
+@mcp.resource("cache://stats")
+def cache_stats() -> dict:
+    return result_cache.stats()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from email.utils import getaddresses, parseaddr
+from typing import Any, Iterable
+
+from .storage.repo import Repository
+
+_logger = logging.getLogger("aios_cofounder_mcp.rollups")
+
+# headers message_facts needs; gmail.get_metadata always requests them
+EMAIL_HEADERS = ("From", "To", "Cc")
+
+
+def _utc(value: str) -> str:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def event_fact(event: dict[str, Any]) -> tuple[str, str, str, int, str, str | None] | None:
+    """``(event_id, start_utc, day, minutes, attendees_json, updated)`` for a timed, booked event."""
+    start = (event.get("start") or {}).get("dateTime")
+    end = (event.get("end") or {}).get("dateTime")
+    if not event.get("id") or not start or not end:
+        return None
+    if event.get("status") == "cancelled" or event.get("transparency") == "transparent":
+        return None
+    attendees = event.get("attendees") or []
+    if any(attendee.get("self") and attendee.get("responseStatus") == "declined" for attendee in attendees):
+        return None
+    try:
+        begin = datetime.fromisoformat(start.replace("Z", "+00:00"))
+        finish = datetime.fromisoformat(end.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    others = sorted(
+        {
+            attendee["email"].lower()
+            for attendee in attendees
+            if attendee.get("email") and not attendee.get("self") and not attendee.get("resource")
+        }
+    )
+    minutes = max(0, int((finish - begin).total_seconds() // 60))
+    # the day is the event's own local date, not the UTC one
+    return event["id"], _utc(start), start[:10], minutes, json.dumps(others), event.get("updated")
+
+
+def message_facts(message: dict[str, Any]) -> list[tuple[str, str, str, str]]:
+    """``(message_id, contact, direction, day)`` rows: recipients of sent mail, or the sender of received mail."""
+    headers = message.get("headers") or {}
+    if not message.get("id") or not message.get("internal_date"):
+        return []
+    day = datetime.fromtimestamp(int(message["internal_date"]) / 1000, timezone.utc).date().isoformat()
+    if "SENT" in (message.get("label_ids") or []):
+        addresses = getaddresses([headers.get("To") or "", headers.get("Cc") or ""])
+        contacts = {address.lower() for _, address in addresses if address}
+        direction = "sent"
+    else:
+        sender = parseaddr(headers.get("From") or "")[1].lower()
+        contacts = {sender} if sender else set()
+        direction = "received"
+    return [(message["id"], contact, direction, day) for contact in sorted(contacts)]
+
+
+def record_events(
+    repo: Repository,
+    calendar_id: str,
+    events: Iterable[dict[str, Any]],
+    window: tuple[str, str] | None = None,
+) -> None:
+    """Upsert event facts; with ``window`` (a complete listing), facts starting in it that were not returned are dropped."""
+    facts = []
+    # declined, cancelled or now-free events stop counting
+    removed = []
+    for event in events:
+        fact = event_fact(event)
+        if fact:
+            facts.append(fact)
+        elif event.get("id"):
+            removed.append(event["id"])
+    try:
+        bounds = (_utc(window[0]), _utc(window[1])) if window else None
+    except ValueError:
+        bounds = None
+    try:
+        repo.sync_calendar_facts(calendar_id, facts, bounds, removed)
+    except sqlite3.Error:
+        # rollups are best effort; the calendar call itself succeeded
+        _logger.exception("calendar rollup update failed")
+
+
+def forget_event(repo: Repository, calendar_id: str, event_id: str) -> None:
+    try:
+        repo.sync_calendar_facts(calendar_id, [], None, removed=[event_id])
+    except sqlite3.Error:
+        _logger.exception("calendar rollup update failed")
+
+
+def record_messages(repo: Repository, messages: Iterable[dict[str, Any]]) -> None:
+    facts = [fact for message in messages for fact in message_facts(message)]
+    if not facts:
+        return
+    try:
+        repo.record_email_facts(facts)
+    except sqlite3.Error:
+        _logger.exception("email rollup update failed")
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+from typing import Any, Iterable
+
+from .storage.repo import Repository
+
+_logger = logging.getLogger("aios_cofounder_mcp.search_index")
+
+KINDS = ("message", "event", "contact", "note")
+# long bodies add little ranking signal but cost index space
+_MAX_BODY_CHARS = 20000
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def _meta(**values: Any) -> str:
+    return json.dumps({key: value for key, value in values.items() if value is not None}, sort_keys=True)
+
+
+def message_document(message: dict[str, Any]) -> tuple[str, str, str, str, str] | None:
+    """Index row for a message from ``gmail.get_metadata`` or ``gmail.parse_raw_message``."""
+    if not message.get("id"):
+        return None
+    headers = message.get("headers") or {}
+    subject = message.get("subject") or headers.get("Subject") or ""
+    sender = message.get("from") or headers.get("From")
+    body = message.get("text") or message.get("snippet") or ""
+    return (
+        "message",
+        message["id"],
+        subject,
+        body[:_MAX_BODY_CHARS],
+        _meta(thread_id=message.get("thread_id"), sender=sender, date=headers.get("Date") or message.get("date")),
+    )
+
+
+def event_document(calendar_id: str, event: dict[str, Any]) -> tuple[str, str, str, str, str] | None:
+    if not event.get("id"):
+        return None
+    start = event.get("start") or {}
+    body = "\n".join(part for part in (event.get("description"), event.get("location")) if part)
+    return (
+        "event",
+        f"{calendar_id}:{event['id']}",
+        event.get("summary") or "",
+        body[:_MAX_BODY_CHARS],
+        _meta(calendar_id=calendar_id, event_id=event["id"], start=start.get("dateTime") or start.get("date")),
+    )
+
+
+def person_document(person: dict[str, Any]) -> tuple[str, str, str, str, str] | None:
+    """Index row for a People API person; keyed by email so it merges with the local contacts row."""
+    emails = [item.get("value") for item in person.get("emailAddresses", []) if item.get("value")]
+    ref = emails[0].lower() if emails else person.get("resourceName")
+    if not ref:
+        return None
+    names = [item.get("displayName") for item in person.get("names", []) if item.get("displayName")]
+    organizations = [
+        " ".join(part for part in (item.get("name"), item.get("title")) if part) for item in person.get("organizations", [])
+    ]
+    return (
+        "contact",
+        ref,
+        names[0] if names else ref,
+        " ".join(part for part in (*organizations, *emails) if part),
+        _meta(email=emails[0] if emails else None, resource_name=person.get("resourceName")),
+    )
+
+
+def add_documents(repo: Repository, documents: Iterable[tuple[str, str, str, str, str] | None]) -> None:
+    """Upsert prepared rows (``*_document`` results); ``None`` entries are skipped."""
+    rows = [document for document in documents if document]
+    if not rows:
+        return
+    try:
+        repo.upsert_search_documents(rows)
+    except sqlite3.Error:
+        # the index is best effort; the API call that produced the data succeeded
+        _logger.exception("search index update failed")
+
+
+def index_messages(repo: Repository, messages: Iterable[dict[str, Any]]) -> None:
+    add_documents(repo, map(message_document, messages))
+
+
+def index_events(repo: Repository, calendar_id: str, events: Iterable[dict[str, Any]]) -> None:
+    events = list(events)
+    cancelled = [event["id"] for event in events if event.get("status") == "cancelled" and event.get("id")]
+    add_documents(repo, (event_document(calendar_id, event) for event in events if event.get("status") != "cancelled"))
+    if cancelled:
+        forget_events(repo, calendar_id, cancelled)
+
+
+def forget_events(repo: Repository, calendar_id: str, event_ids: Iterable[str]) -> None:
+    try:
+        repo.delete_search_documents("event", [f"{calendar_id}:{event_id}" for event_id in event_ids])
+    except sqlite3.Error:
+        _logger.exception("search index update failed")
+
+
+def index_people(repo: Repository, people: Iterable[dict[str, Any]]) -> None:
+    add_documents(repo, map(person_document, people))
+
+
+def match_expression(query: str) -> str | None:
+    """FTS5 expression matching any of the query's terms (BM25 rewards documents matching more of them)."""
+    terms = list(dict.fromkeys(term.lower() for term in _TERM.findall(query)))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+def search(repo: Repository, query: str, kinds: list[str] | None = None, limit: int = 10) -> list[dict[str, Any]]:
+    match = match_expression(query)
+    if match is None:
+        return []
+    return repo.search_documents(match, kinds, limit)
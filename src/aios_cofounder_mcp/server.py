@@ -49,11 +49,16 @@ from .tools import (  # noqa: E402
     web_tools,
     assistant_tools,
     approval_tools,
+    audit_tools,
+    context_tools,
+    output_tools,
+    batch_tools,
 )
 from .resources import (  # noqa: E402
     state_resources,
     gmail_resources,
     calendar_resources,
+    approval_resources,
 )
 from .prompts import (  # noqa: E402
     inbox_triage,
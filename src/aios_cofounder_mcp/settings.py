@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 @dataclass(frozen=True)
 class Settings:
     log_level: str
+    log_format: str
+    log_queue: bool
     db_url: str
     google_client_id: str | None
     google_client_secret: str | None
@@ -18,6 +20,41 @@ class Settings:
     oauth_state_ttl_seconds: int
     web_user_agent: str
     web_timeout_seconds: int
+    http_max_connections: int
+    http_max_keepalive_connections: int
+    http_keepalive_expiry_seconds: float
+    http_per_host_connections: int
+    http2_enabled: bool
+    web_cache_max_bytes: int
+    web_fetch_max_bytes: int
+    availability_index_ttl_seconds: int
+    calendar_fanout_workers: int
+    gmail_fetch_workers: int
+    summarize_max_messages: int
+    summarize_workers: int
+    triage_scan_limit: int
+    triage_batch_size: int
+    triage_keywords: str
+    meeting_brief_max_age_seconds: int
+    brief_precompute_hours: int
+    brief_precompute_interval_seconds: int
+    tool_workers: int
+    tool_concurrency_limits: str | None
+    tool_output_max_bytes: int
+    tool_output_budgets: str | None
+    result_cache_max_entries: int
+    result_cache_stale_seconds: int
+    result_cache_ttls: str | None
+    approval_ttl_seconds: int
+    approval_sweep_interval_seconds: int
+    approval_sweep_batch_size: int
+    approval_history_seconds: int
+    approval_wait_max_seconds: float
+    batch_max_calls: int
+    batch_concurrency: int
+    trace_sample_rate: float
+    trace_buffer_size: int
+    trace_export_path: str | None
 
 
 def _parse_scopes(raw: str | None) -> List[str]:
@@ -35,11 +72,19 @@ def _parse_scopes(raw: str | None) -> List[str]:
     return [scope.strip() for scope in normalized.split(",") if scope.strip()]
 
 
+def _parse_bool(raw: str | None, default: bool) -> bool:
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
 def load_settings() -> Settings:
     # load .env for local dev; production uses explicit environment
     load_dotenv()
     return Settings(
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_format=os.getenv("LOG_FORMAT", "text"),
+        log_queue=_parse_bool(os.getenv("LOG_QUEUE"), default=True),
         db_url=os.getenv("DB_URL", "sqlite:///./aios_cofounder_mcp.db"),
         google_client_id=os.getenv("GOOGLE_CLIENT_ID"),
         google_client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
@@ -48,6 +93,44 @@ def load_settings() -> Settings:
         oauth_state_ttl_seconds=int(os.getenv("OAUTH_STATE_TTL_SECONDS", "600")),
         web_user_agent=os.getenv("WEB_USER_AGENT", "aios-cofounder-mcp/0.1"),
         web_timeout_seconds=int(os.getenv("WEB_TIMEOUT_SECONDS", "12")),
+        http_max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+        http_max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        http_keepalive_expiry_seconds=float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")),
+        http_per_host_connections=int(os.getenv("HTTP_PER_HOST_CONNECTIONS", "6")),
+        http2_enabled=_parse_bool(os.getenv("HTTP2_ENABLED"), default=True),
+        web_cache_max_bytes=int(os.getenv("WEB_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        web_fetch_max_bytes=int(os.getenv("WEB_FETCH_MAX_BYTES", str(2 * 1024 * 1024))),
+        availability_index_ttl_seconds=int(os.getenv("AVAILABILITY_INDEX_TTL_SECONDS", "300")),
+        calendar_fanout_workers=int(os.getenv("CALENDAR_FANOUT_WORKERS", "4")),
+        gmail_fetch_workers=int(os.getenv("GMAIL_FETCH_WORKERS", "8")),
+        summarize_max_messages=int(os.getenv("SUMMARIZE_MAX_MESSAGES", "200")),
+        summarize_workers=int(os.getenv("SUMMARIZE_WORKERS", "4")),
+        triage_scan_limit=int(os.getenv("TRIAGE_SCAN_LIMIT", "200")),
+        triage_batch_size=int(os.getenv("TRIAGE_BATCH_SIZE", "50")),
+        triage_keywords=os.getenv(
+            "TRIAGE_KEYWORDS",
+            "urgent,asap,deadline,action required,today,tomorrow,invoice,contract,sign,approve,overdue",
+        ),
+        meeting_brief_max_age_seconds=int(os.getenv("MEETING_BRIEF_MAX_AGE_SECONDS", "3600")),
+        brief_precompute_hours=int(os.getenv("BRIEF_PRECOMPUTE_HOURS", "4")),
+        brief_precompute_interval_seconds=int(os.getenv("BRIEF_PRECOMPUTE_INTERVAL_SECONDS", "900")),
+        tool_workers=int(os.getenv("TOOL_WORKERS", "32")),
+        tool_concurrency_limits=os.getenv("TOOL_CONCURRENCY_LIMITS", "gmail=8,calendar=8,contacts=4,web=8"),
+        tool_output_max_bytes=int(os.getenv("TOOL_OUTPUT_MAX_BYTES", "262144")),
+        tool_output_budgets=os.getenv("TOOL_OUTPUT_BUDGETS", "gmail_get_thread=131072"),
+        result_cache_max_entries=int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "512")),
+        result_cache_stale_seconds=int(os.getenv("RESULT_CACHE_STALE_SECONDS", "30")),
+        result_cache_ttls=os.getenv("RESULT_CACHE_TTLS"),
+        approval_ttl_seconds=int(os.getenv("APPROVAL_TTL_SECONDS", "86400")),
+        approval_sweep_interval_seconds=int(os.getenv("APPROVAL_SWEEP_INTERVAL_SECONDS", "300")),
+        approval_sweep_batch_size=int(os.getenv("APPROVAL_SWEEP_BATCH_SIZE", "500")),
+        approval_history_seconds=int(os.getenv("APPROVAL_HISTORY_SECONDS", "604800")),
+        approval_wait_max_seconds=float(os.getenv("APPROVAL_WAIT_MAX_SECONDS", "300")),
+        batch_max_calls=int(os.getenv("BATCH_MAX_CALLS", "25")),
+        batch_concurrency=int(os.getenv("BATCH_CONCURRENCY", "8")),
+        trace_sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "0.01")),
+        trace_buffer_size=int(os.getenv("TRACE_BUFFER_SIZE", "100")),
+        trace_export_path=os.getenv("TRACE_EXPORT_PATH") or None,
     )
 
 
@@ -44,9 +44,30 @@ def get_connection(db_url: str) -> sqlite3.Connection:
     return conn
 
 
+# columns added to tables after their first release; CREATE TABLE IF NOT EXISTS
+# leaves existing databases untouched, so these are ALTERed in before the
+# script runs (its indexes may reference them)
+_ADDED_COLUMNS: dict[str, dict[str, str]] = {
+    "approvals": {"payload_hash": "TEXT"},
+    "audit_log": {"approval_id": "INTEGER"},
+    "assistant_notes": {"content_hash": "TEXT", "summarizer_version": "TEXT"},
+}
+
+
+def _add_missing_columns(conn: sqlite3.Connection) -> None:
+    for table, columns in _ADDED_COLUMNS.items():
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        if not existing:
+            continue
+        for column, definition in columns.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
 def run_migrations(conn: sqlite3.Connection) -> None:
     migrations_path = pathlib.Path(__file__).with_name("migrations.sql")
     sql = migrations_path.read_text(encoding="utf-8")
+    _add_missing_columns(conn)
     conn.executescript(sql)
     conn.commit()
 
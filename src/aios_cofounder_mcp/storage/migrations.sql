@@ -44,20 +44,296 @@ CREATE TABLE IF NOT EXISTS approvals (
     payload TEXT NOT NULL,
     status TEXT NOT NULL,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-    resolved_at TEXT
+    resolved_at TEXT,
+    payload_hash TEXT
 );
 
+-- at most one pending approval per (action, canonical payload); retries reuse it
+CREATE UNIQUE INDEX IF NOT EXISTS idx_approvals_pending_payload
+    ON approvals (action, payload_hash) WHERE status = 'pending';
+-- expiry sweeps and the default listing scan by status and age
+CREATE INDEX IF NOT EXISTS idx_approvals_status_created ON approvals (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_approvals_status_resolved ON approvals (status, resolved_at);
+
 CREATE TABLE IF NOT EXISTS audit_log (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     action TEXT NOT NULL,
     payload TEXT NOT NULL,
     result TEXT NOT NULL,
-    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    approval_id INTEGER
 );
 
+CREATE INDEX IF NOT EXISTS idx_audit_action_id ON audit_log (action, id);
+CREATE INDEX IF NOT EXISTS idx_audit_created_at ON audit_log (created_at);
+CREATE INDEX IF NOT EXISTS idx_audit_approval_id ON audit_log (approval_id) WHERE approval_id IS NOT NULL;
+
+-- per-day action counts, kept current by the trigger below
+CREATE TABLE IF NOT EXISTS audit_daily (
+    day TEXT NOT NULL,
+    action TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, action)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_audit_daily_insert AFTER INSERT ON audit_log
+BEGIN
+    INSERT INTO audit_daily (day, action, count) VALUES (date(NEW.created_at), NEW.action, 1)
+    ON CONFLICT (day, action) DO UPDATE SET count = count + 1;
+END;
+
+-- one-time backfill for databases that had audit rows before the rollup existed
+INSERT INTO audit_daily (day, action, count)
+SELECT date(created_at), action, COUNT(*) FROM audit_log
+WHERE NOT EXISTS (SELECT 1 FROM audit_daily)
+GROUP BY date(created_at), action;
+
 CREATE TABLE IF NOT EXISTS assistant_notes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     source TEXT NOT NULL,
     summary TEXT NOT NULL,
+    content_hash TEXT,
+    summarizer_version TEXT,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE INDEX IF NOT EXISTS idx_assistant_notes_source ON assistant_notes (source, id);
+CREATE INDEX IF NOT EXISTS idx_assistant_notes_content_hash ON assistant_notes (content_hash);
+
+-- rolling per-thread summaries; refreshes fold in only messages after last_message_id
+CREATE TABLE IF NOT EXISTS thread_summaries (
+    thread_id TEXT PRIMARY KEY,
+    history_id TEXT,
+    last_message_id TEXT,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    summary TEXT NOT NULL DEFAULT '',
+    digests TEXT NOT NULL DEFAULT '[]',
+    seen_paragraphs TEXT NOT NULL DEFAULT '[]',
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- HTTP cache for web_fetch, keyed by normalized URL; body is the zlib-compressed raw
+-- response and title/text the extraction from it. Times are Unix seconds; rows are
+-- evicted least recently used first once the total size exceeds the configured cap.
+CREATE TABLE IF NOT EXISTS web_cache (
+    url TEXT PRIMARY KEY,
+    final_url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL DEFAULT '{}',
+    body BLOB NOT NULL,
+    title TEXT,
+    text TEXT NOT NULL DEFAULT '',
+    etag TEXT,
+    last_modified TEXT,
+    fresh_until REAL NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_web_cache_last_used ON web_cache (last_used_at);
+
+-- meeting briefs keyed by the event revision they were built from
+CREATE TABLE IF NOT EXISTS meeting_briefs (
+    event_id TEXT PRIMARY KEY,
+    event_updated TEXT NOT NULL,
+    brief TEXT NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- weekly review rollups: fact rows are written as calendar/Gmail data is synced,
+-- and the triggers below keep the per-day aggregates current
+
+-- one row per timed calendar event seen by list_events (day is the event's local date)
+CREATE TABLE IF NOT EXISTS calendar_event_facts (
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    start TEXT NOT NULL,
+    day TEXT NOT NULL,
+    minutes INTEGER NOT NULL,
+    attendees TEXT NOT NULL,
+    updated TEXT,
+    PRIMARY KEY (calendar_id, event_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_calendar_event_facts_start ON calendar_event_facts (calendar_id, start);
+
+CREATE TABLE IF NOT EXISTS meeting_daily (
+    day TEXT PRIMARY KEY,
+    meetings INTEGER NOT NULL DEFAULT 0,
+    minutes INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meeting_attendee_daily (
+    day TEXT NOT NULL,
+    attendee TEXT NOT NULL,
+    meetings INTEGER NOT NULL DEFAULT 0,
+    minutes INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, attendee)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_meeting_facts_insert AFTER INSERT ON calendar_event_facts
+BEGIN
+    INSERT INTO meeting_daily (day, meetings, minutes) VALUES (NEW.day, 1, NEW.minutes)
+    ON CONFLICT (day) DO UPDATE SET meetings = meetings + 1, minutes = minutes + excluded.minutes;
+    INSERT INTO meeting_attendee_daily (day, attendee, meetings, minutes)
+    SELECT NEW.day, value, 1, NEW.minutes FROM json_each(NEW.attendees) WHERE true
+    ON CONFLICT (day, attendee) DO UPDATE SET meetings = meetings + 1, minutes = minutes + excluded.minutes;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_meeting_facts_delete AFTER DELETE ON calendar_event_facts
+BEGIN
+    UPDATE meeting_daily SET meetings = meetings - 1, minutes = minutes - OLD.minutes WHERE day = OLD.day;
+    UPDATE meeting_attendee_daily SET meetings = meetings - 1, minutes = minutes - OLD.minutes
+    WHERE day = OLD.day AND attendee IN (SELECT value FROM json_each(OLD.attendees));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_meeting_facts_update AFTER UPDATE ON calendar_event_facts
+BEGIN
+    UPDATE meeting_daily SET meetings = meetings - 1, minutes = minutes - OLD.minutes WHERE day = OLD.day;
+    UPDATE meeting_attendee_daily SET meetings = meetings - 1, minutes = minutes - OLD.minutes
+    WHERE day = OLD.day AND attendee IN (SELECT value FROM json_each(OLD.attendees));
+    INSERT INTO meeting_daily (day, meetings, minutes) VALUES (NEW.day, 1, NEW.minutes)
+    ON CONFLICT (day) DO UPDATE SET meetings = meetings + 1, minutes = minutes + excluded.minutes;
+    INSERT INTO meeting_attendee_daily (day, attendee, meetings, minutes)
+    SELECT NEW.day, value, 1, NEW.minutes FROM json_each(NEW.attendees) WHERE true
+    ON CONFLICT (day, attendee) DO UPDATE SET meetings = meetings + 1, minutes = minutes + excluded.minutes;
+END;
+
+-- one row per (message, counterpart) seen in Gmail metadata; a sent message has one row per recipient
+CREATE TABLE IF NOT EXISTS email_message_facts (
+    message_id TEXT NOT NULL,
+    contact TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (message_id, contact)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS email_contact_daily (
+    day TEXT NOT NULL,
+    contact TEXT NOT NULL,
+    sent INTEGER NOT NULL DEFAULT 0,
+    received INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, contact)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_email_facts_insert AFTER INSERT ON email_message_facts
+BEGIN
+    INSERT INTO email_contact_daily (day, contact, sent, received)
+    VALUES (NEW.day, NEW.contact, NEW.direction = 'sent', NEW.direction = 'received')
+    ON CONFLICT (day, contact) DO UPDATE SET sent = sent + excluded.sent, received = received + excluded.received;
+END;
+
+CREATE TABLE IF NOT EXISTS approval_daily (
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_approval_daily_resolve AFTER UPDATE OF status ON approvals
+WHEN OLD.status = 'pending' AND NEW.status <> 'pending'
+BEGIN
+    INSERT INTO approval_daily (day, status, count) VALUES (date(COALESCE(NEW.resolved_at, CURRENT_TIMESTAMP)), NEW.status, 1)
+    ON CONFLICT (day, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS notes_daily (
+    day TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_notes_daily_insert AFTER INSERT ON assistant_notes
+BEGIN
+    INSERT INTO notes_daily (day, count) VALUES (date(NEW.created_at), 1)
+    ON CONFLICT (day) DO UPDATE SET count = count + 1;
+END;
+
+-- one-time backfills for rows written before these rollups existed
+INSERT INTO approval_daily (day, status, count)
+SELECT date(resolved_at), status, COUNT(*) FROM approvals
+WHERE status <> 'pending' AND resolved_at IS NOT NULL AND NOT EXISTS (SELECT 1 FROM approval_daily)
+GROUP BY date(resolved_at), status;
+
+INSERT INTO notes_daily (day, count)
+SELECT date(created_at), COUNT(*) FROM assistant_notes
+WHERE NOT EXISTS (SELECT 1 FROM notes_daily)
+GROUP BY date(created_at);
+
+-- local full-text index over mail, events, contacts and notes (context_search);
+-- rows are upserted as data passes through the Google clients, and the
+-- triggers below mirror them into the FTS5 table
+CREATE TABLE IF NOT EXISTS search_documents (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    body TEXT NOT NULL DEFAULT '',
+    meta TEXT,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (kind, ref)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    title, body, content='search_documents', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_search_documents_insert AFTER INSERT ON search_documents
+BEGIN
+    INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_documents_delete AFTER DELETE ON search_documents
+BEGIN
+    INSERT INTO search_fts (search_fts, rowid, title, body) VALUES ('delete', OLD.id, OLD.title, OLD.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_documents_update AFTER UPDATE OF title, body ON search_documents
+BEGIN
+    INSERT INTO search_fts (search_fts, rowid, title, body) VALUES ('delete', OLD.id, OLD.title, OLD.body);
+    INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+END;
+
+-- local contacts and notes feed the index directly
+CREATE TRIGGER IF NOT EXISTS trg_search_contacts_upsert AFTER INSERT ON contacts
+BEGIN
+    INSERT INTO search_documents (kind, ref, title, body, meta)
+    VALUES ('contact', lower(NEW.email), NEW.name, trim(COALESCE(NEW.company, '') || ' ' || NEW.email), json_object('email', NEW.email))
+    ON CONFLICT (kind, ref) DO UPDATE SET title = excluded.title, body = excluded.body, meta = excluded.meta,
+        updated_at = CURRENT_TIMESTAMP;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_contacts_update AFTER UPDATE ON contacts
+BEGIN
+    INSERT INTO search_documents (kind, ref, title, body, meta)
+    VALUES ('contact', lower(NEW.email), NEW.name, trim(COALESCE(NEW.company, '') || ' ' || NEW.email), json_object('email', NEW.email))
+    ON CONFLICT (kind, ref) DO UPDATE SET title = excluded.title, body = excluded.body, meta = excluded.meta,
+        updated_at = CURRENT_TIMESTAMP;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_contacts_delete AFTER DELETE ON contacts
+BEGIN
+    DELETE FROM search_documents WHERE kind = 'contact' AND ref = lower(OLD.email);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_notes_insert AFTER INSERT ON assistant_notes
+BEGIN
+    INSERT INTO search_documents (kind, ref, title, body, meta)
+    VALUES ('note', CAST(NEW.id AS TEXT), NEW.source, NEW.summary, json_object('source', NEW.source));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_notes_delete AFTER DELETE ON assistant_notes
+BEGIN
+    DELETE FROM search_documents WHERE kind = 'note' AND ref = CAST(OLD.id AS TEXT);
+END;
+
+-- one-time backfill of contacts and notes written before the index existed
+INSERT INTO search_documents (kind, ref, title, body, meta)
+SELECT 'contact', lower(email), name, trim(COALESCE(company, '') || ' ' || email), json_object('email', email) FROM contacts
+WHERE NOT EXISTS (SELECT 1 FROM search_documents WHERE kind = 'contact')
+ON CONFLICT (kind, ref) DO NOTHING;
+
+INSERT INTO search_documents (kind, ref, title, body, meta)
+SELECT 'note', CAST(id AS TEXT), source, summary, json_object('source', source) FROM assistant_notes
+WHERE NOT EXISTS (SELECT 1 FROM search_documents WHERE kind = 'note')
+ON CONFLICT (kind, ref) DO NOTHING;
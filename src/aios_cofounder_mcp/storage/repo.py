@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from datetime import datetime, timezone
 from dataclasses import dataclass
 from typing import Any, Iterable
 
+from ..metrics import instrument_methods
+from ..notifications import approval_events
+from ..tracing import trace_methods
 from .db import get_connection
 
 
+def canonical_payload_hash(payload: dict[str, Any]) -> str:
+    """SHA-256 of the payload as sorted, compact JSON; equal arguments hash equally."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _sql_timestamp(value: str) -> str:
+    """ISO-8601 (any offset) to SQLite's UTC ``CURRENT_TIMESTAMP`` format, so range filters use the index."""
+    parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@instrument_methods("repository")
+@trace_methods("repository")
 @dataclass
 class Repository:
     db_url: str
@@ -60,6 +81,19 @@ class Repository:
             ).fetchone()
         return dict(row) if row else {}
 
+    def known_contact_emails(self, emails: Iterable[str]) -> set[str]:
+        """The subset of ``emails`` (lower-cased) present in the contacts table."""
+        wanted = sorted({email.lower() for email in emails if email})
+        if not wanted:
+            return set()
+        placeholders = ",".join("?" for _ in wanted)
+        with self._conn() as conn:
+            rows = conn.execute(
+                f"SELECT lower(email) AS email FROM contacts WHERE lower(email) IN ({placeholders})",
+                wanted,
+            ).fetchall()
+        return {row["email"] for row in rows}
+
     def save_oauth_tokens(self, provider: str, token_json: str, scopes: Iterable[str], expiry: str | None) -> None:
         scopes_value = ",".join(scopes)
         with self._conn() as conn:
@@ -124,43 +158,160 @@ class Repository:
             )
             conn.commit()
 
-    def create_approval(self, action: str, payload: dict[str, Any]) -> int:
+    def create_approval(self, action: str, payload: dict[str, Any], ttl_seconds: int | None = None) -> int:
+        """Return the pending approval for ``(action, payload)``, creating it if needed.
+
+        A pending match older than ``ttl_seconds`` is expired first, so the
+        caller gets a fresh approval instead of a stale one.
+        """
+        digest = canonical_payload_hash(payload)
+        lookup = "SELECT id FROM approvals WHERE action = ? AND payload_hash = ? AND status = 'pending'"
         with self._conn() as conn:
+            if ttl_seconds:
+                conn.execute(
+                    "UPDATE approvals SET status = 'expired', resolved_at = CURRENT_TIMESTAMP "
+                    "WHERE action = ? AND payload_hash = ? AND status = 'pending' AND created_at < datetime('now', ?)",
+                    (action, digest, f"-{int(ttl_seconds)} seconds"),
+                )
+            row = conn.execute(lookup, (action, digest)).fetchone()
+            if row:
+                conn.commit()
+                return int(row["id"])
+            # a concurrent retry may insert first; the partial unique index makes that a no-op
             conn.execute(
-                "INSERT INTO approvals (action, payload, status) VALUES (?, ?, ?)",
-                (action, json.dumps(payload), "pending"),
+                "INSERT INTO approvals (action, payload, status, payload_hash) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (action, payload_hash) WHERE status = 'pending' DO NOTHING",
+                (action, json.dumps(payload), "pending", digest),
             )
             conn.commit()
-            row = conn.execute("SELECT id FROM approvals ORDER BY id DESC LIMIT 1").fetchone()
+            row = conn.execute(lookup, (action, digest)).fetchone()
         return int(row["id"]) if row else 0
 
-    def resolve_approval(self, approval_id: int, decision: str) -> dict[str, Any] | None:
+    def resolve_approval(
+        self, approval_id: int, decision: str, ttl_seconds: int | None = None
+    ) -> dict[str, Any] | None:
+        """Resolve a pending approval; ``None`` if it does not exist or is no longer pending.
+
+        A pending approval older than ``ttl_seconds`` is expired instead, so a
+        late decision cannot revive it between sweeps.
+        """
+        columns = "id, action, payload, payload_hash, status, created_at, resolved_at"
         with self._conn() as conn:
-            conn.execute(
-                "UPDATE approvals SET status = ?, resolved_at = CURRENT_TIMESTAMP WHERE id = ?",
+            expired = self._expire_stale(conn, approval_id, ttl_seconds) if ttl_seconds else False
+            row = conn.execute(
+                "UPDATE approvals SET status = ?, resolved_at = CURRENT_TIMESTAMP WHERE id = ? AND status = 'pending' "
+                f"RETURNING {columns}",
                 (decision, approval_id),
-            )
+            ).fetchone()
             conn.commit()
-            row = conn.execute(
-                "SELECT id, action, payload, status, created_at, resolved_at FROM approvals WHERE id = ?",
-                (approval_id,),
+        if expired:
+            approval_events.publish(approval_id, "expired")
+        if not row:
+            return None
+        approval_events.publish(approval_id, row["status"])
+        return dict(row)
+
+    @staticmethod
+    def _expire_stale(conn: Any, approval_id: int, ttl_seconds: int) -> bool:
+        return (
+            conn.execute(
+                "UPDATE approvals SET status = 'expired', resolved_at = CURRENT_TIMESTAMP "
+                "WHERE id = ? AND status = 'pending' AND created_at < datetime('now', ?) RETURNING id",
+                (approval_id, f"-{int(ttl_seconds)} seconds"),
             ).fetchone()
-        return dict(row) if row else None
+            is not None
+        )
+
+    def expire_approval(self, approval_id: int, ttl_seconds: int) -> bool:
+        """Expire one pending approval older than ``ttl_seconds``; whether it was."""
+        with self._conn() as conn:
+            expired = self._expire_stale(conn, approval_id, ttl_seconds)
+            conn.commit()
+        if expired:
+            approval_events.publish(approval_id, "expired")
+        return expired
 
     def get_approval(self, approval_id: int) -> dict[str, Any] | None:
         with self._conn() as conn:
             row = conn.execute(
-                "SELECT id, action, payload, status, created_at, resolved_at FROM approvals WHERE id = ?",
+                "SELECT id, action, payload, payload_hash, status, created_at, resolved_at FROM approvals WHERE id = ?",
                 (approval_id,),
             ).fetchone()
         return dict(row) if row else None
 
-    def list_approvals(self, limit: int = 50) -> list[dict[str, Any]]:
+    def resolve_approvals(
+        self,
+        decision: str,
+        approval_ids: Iterable[int] | None = None,
+        action: str | None = None,
+        older_than_seconds: int | None = None,
+        ttl_seconds: int | None = None,
+    ) -> list[int]:
+        """Resolve every pending approval matching all given filters in one transaction.
+
+        Matches older than ``ttl_seconds`` are expired instead, as in ``resolve_approval``.
+        """
+        clauses = ["status = 'pending'"]
+        params: list[Any] = []
+        if approval_ids is not None:
+            ids = list(approval_ids)
+            clauses.append(f"id IN ({','.join('?' * len(ids)) or 'NULL'})")
+            params.extend(ids)
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if older_than_seconds is not None:
+            clauses.append("created_at < datetime('now', ?)")
+            params.append(f"-{int(older_than_seconds)} seconds")
+        where = " AND ".join(clauses)
         with self._conn() as conn:
+            expired = []
+            if ttl_seconds:
+                expired = conn.execute(
+                    "UPDATE approvals SET status = 'expired', resolved_at = CURRENT_TIMESTAMP "
+                    f"WHERE {where} AND created_at < datetime('now', ?) RETURNING id",
+                    (*params, f"-{int(ttl_seconds)} seconds"),
+                ).fetchall()
             rows = conn.execute(
-                "SELECT id, action, payload, status, created_at, resolved_at FROM approvals ORDER BY id DESC LIMIT ?",
-                (limit,),
+                f"UPDATE approvals SET status = ?, resolved_at = CURRENT_TIMESTAMP WHERE {where} RETURNING id",
+                (decision, *params),
+            ).fetchall()
+            conn.commit()
+        for approval_id in sorted(int(row["id"]) for row in expired):
+            approval_events.publish(approval_id, "expired")
+        resolved = sorted(int(row["id"]) for row in rows)
+        for approval_id in resolved:
+            approval_events.publish(approval_id, decision)
+        return resolved
+
+    def expire_approvals(self, ttl_seconds: int, batch_size: int = 500) -> list[int]:
+        """Mark up to ``batch_size`` pending approvals older than ``ttl_seconds`` as expired."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                "UPDATE approvals SET status = 'expired', resolved_at = CURRENT_TIMESTAMP WHERE id IN ("
+                "SELECT id FROM approvals WHERE status = 'pending' AND created_at < datetime('now', ?) LIMIT ?"
+                ") RETURNING id",
+                (f"-{int(ttl_seconds)} seconds", batch_size),
             ).fetchall()
+            conn.commit()
+        expired = sorted(int(row["id"]) for row in rows)
+        for approval_id in expired:
+            approval_events.publish(approval_id, "expired")
+        return expired
+
+    def list_approvals(self, limit: int = 50, history_seconds: int | None = 7 * 24 * 3600) -> list[dict[str, Any]]:
+        """Pending approvals plus those approved/denied within ``history_seconds`` (``None``: everything)."""
+        columns = "id, action, payload, status, created_at, resolved_at"
+        with self._conn() as conn:
+            if history_seconds is None:
+                rows = conn.execute(f"SELECT {columns} FROM approvals ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT {columns} FROM approvals WHERE status = 'pending' "
+                    "OR (status IN ('approved', 'denied') AND resolved_at >= datetime('now', ?)) "
+                    "ORDER BY id DESC LIMIT ?",
+                    (f"-{int(history_seconds)} seconds", limit),
+                ).fetchall()
         # previous implementation (kept for reference)
         # rows = conn.execute(
         #     "SELECT id, action, payload, status, created_at, resolved_at FROM approvals ORDER BY created_at DESC LIMIT ?",
@@ -168,14 +319,23 @@ class Repository:
         # ).fetchall()
         return [dict(row) for row in rows]
 
-    def add_audit(self, action: str, payload: dict[str, Any], result: dict[str, Any]) -> dict[str, Any]:
+    def add_audit(
+        self,
+        action: str,
+        payload: dict[str, Any],
+        result: dict[str, Any],
+        approval_id: int | None = None,
+    ) -> dict[str, Any]:
         with self._conn() as conn:
-            conn.execute(
-                "INSERT INTO audit_log (action, payload, result) VALUES (?, ?, ?)",
-                (action, json.dumps(payload), json.dumps(result)),
+            cursor = conn.execute(
+                "INSERT INTO audit_log (action, payload, result, approval_id) VALUES (?, ?, ?, ?)",
+                (action, json.dumps(payload), json.dumps(result), approval_id),
             )
             conn.commit()
-            row = conn.execute("SELECT id, action, payload, result, created_at FROM audit_log ORDER BY id DESC LIMIT 1").fetchone()
+            row = conn.execute(
+                "SELECT id, action, payload, result, created_at, approval_id FROM audit_log WHERE id = ?",
+                (cursor.lastrowid,),
+            ).fetchone()
         return dict(row) if row else {}
 
     def list_audit(self, limit: int = 50) -> list[dict[str, Any]]:
@@ -186,18 +346,423 @@ class Repository:
             ).fetchall()
         return [dict(row) for row in rows]
 
-    def add_note(self, source: str, summary: str) -> dict[str, Any]:
+    def query_audit(
+        self,
+        action: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        approval_id: int | None = None,
+        cursor: int | None = None,
+        limit: int = 50,
+        include_details: bool = False,
+    ) -> dict[str, Any]:
+        """Newest-first audit rows matching the filters, paged by ``id`` (keyset).
+
+        Pass the returned ``next_cursor`` back as ``cursor`` for the next page.
+        Payload/result JSON is only read when ``include_details`` is set.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(_sql_timestamp(since))
+        if until:
+            clauses.append("created_at < ?")
+            params.append(_sql_timestamp(until))
+        if approval_id is not None:
+            clauses.append("approval_id = ?")
+            params.append(approval_id)
+        if cursor is not None:
+            clauses.append("id < ?")
+            params.append(cursor)
+        columns = "id, action, created_at, approval_id" + (", payload, result" if include_details else "")
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._conn() as conn:
+            rows = conn.execute(
+                f"SELECT {columns} FROM audit_log {where}ORDER BY id DESC LIMIT ?",
+                (*params, limit + 1),
+            ).fetchall()
+        items = [dict(row) for row in rows[:limit]]
+        return {"items": items, "next_cursor": items[-1]["id"] if len(rows) > limit else None}
+
+    def audit_stats(self, since_day: str | None = None, until_day: str | None = None) -> dict[str, Any]:
+        """Action counts per day from the ``audit_daily`` rollup (days are ``YYYY-MM-DD``, inclusive)."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if since_day:
+            clauses.append("day >= ?")
+            params.append(since_day)
+        if until_day:
+            clauses.append("day <= ?")
+            params.append(until_day)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._conn() as conn:
+            rows = conn.execute(
+                f"SELECT day, action, count FROM audit_daily {where}ORDER BY day, action",
+                params,
+            ).fetchall()
+        totals: dict[str, int] = {}
+        for row in rows:
+            totals[row["action"]] = totals.get(row["action"], 0) + row["count"]
+        return {
+            "since_day": since_day,
+            "until_day": until_day,
+            "totals": totals,
+            "total": sum(totals.values()),
+            "daily": [dict(row) for row in rows],
+        }
+
+    def sync_calendar_facts(
+        self,
+        calendar_id: str,
+        facts: list[tuple[str, str, str, int, str, str | None]],
+        window: tuple[str, str] | None = None,
+        removed: Iterable[str] = (),
+    ) -> None:
+        """Upsert event facts (rollup triggers fire only for new or changed events).
+
+        ``window`` is a UTC ``[start, end)`` that ``facts`` fully cover: facts
+        starting in it but absent from ``facts`` were deleted or declined.
+        """
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT INTO calendar_event_facts (calendar_id, event_id, start, day, minutes, attendees, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (calendar_id, event_id) DO UPDATE SET start = excluded.start, day = excluded.day, "
+                "minutes = excluded.minutes, attendees = excluded.attendees, updated = excluded.updated "
+                "WHERE excluded.updated IS NOT calendar_event_facts.updated",
+                [(calendar_id, *fact) for fact in facts],
+            )
+            if window:
+                conn.execute(
+                    "DELETE FROM calendar_event_facts WHERE calendar_id = ? AND start >= ? AND start < ? "
+                    "AND event_id NOT IN (SELECT value FROM json_each(?))",
+                    (calendar_id, window[0], window[1], json.dumps([fact[0] for fact in facts])),
+                )
+            removed = list(removed)
+            if removed:
+                conn.executemany(
+                    "DELETE FROM calendar_event_facts WHERE calendar_id = ? AND event_id = ?",
+                    [(calendar_id, event_id) for event_id in removed],
+                )
+            conn.commit()
+
+    def record_email_facts(self, facts: list[tuple[str, str, str, str]]) -> None:
+        """Insert ``(message_id, contact, direction, day)`` rows; messages already counted are skipped."""
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO email_message_facts (message_id, contact, direction, day) VALUES (?, ?, ?, ?)",
+                facts,
+            )
+            conn.commit()
+
+    def weekly_rollups(self, since_day: str, until_day: str, top: int = 10) -> dict[str, Any]:
+        """Meeting, email, approval, note and audit aggregates for ``[since_day, until_day]`` from the rollup tables."""
+        days = (since_day, until_day)
+        with self._conn() as conn:
+            meeting_days = conn.execute(
+                "SELECT day, meetings, minutes FROM meeting_daily WHERE day BETWEEN ? AND ? AND meetings > 0 ORDER BY day",
+                days,
+            ).fetchall()
+            attendees = conn.execute(
+                "SELECT attendee, SUM(meetings) AS meetings, SUM(minutes) AS minutes FROM meeting_attendee_daily "
+                "WHERE day BETWEEN ? AND ? GROUP BY attendee HAVING SUM(meetings) > 0 "
+                "ORDER BY meetings DESC, minutes DESC LIMIT ?",
+                (*days, top),
+            ).fetchall()
+            email_totals = conn.execute(
+                "SELECT COALESCE(SUM(sent), 0) AS sent, COALESCE(SUM(received), 0) AS received "
+                "FROM email_contact_daily WHERE day BETWEEN ? AND ?",
+                days,
+            ).fetchone()
+            contacts = conn.execute(
+                "SELECT contact, SUM(sent) AS sent, SUM(received) AS received FROM email_contact_daily "
+                "WHERE day BETWEEN ? AND ? GROUP BY contact ORDER BY SUM(sent) + SUM(received) DESC LIMIT ?",
+                (*days, top),
+            ).fetchall()
+            approvals = conn.execute(
+                "SELECT status, SUM(count) AS count FROM approval_daily WHERE day BETWEEN ? AND ? GROUP BY status",
+                days,
+            ).fetchall()
+            notes = conn.execute(
+                "SELECT day, count FROM notes_daily WHERE day BETWEEN ? AND ? ORDER BY day",
+                days,
+            ).fetchall()
+        return {
+            "since_day": since_day,
+            "until_day": until_day,
+            "meetings": {
+                "total": sum(row["meetings"] for row in meeting_days),
+                "hours": round(sum(row["minutes"] for row in meeting_days) / 60, 2),
+                "daily": [
+                    {"day": row["day"], "meetings": row["meetings"], "hours": round(row["minutes"] / 60, 2)}
+                    for row in meeting_days
+                ],
+                "top_attendees": [
+                    {"attendee": row["attendee"], "meetings": row["meetings"], "hours": round(row["minutes"] / 60, 2)}
+                    for row in attendees
+                ],
+            },
+            "email": {
+                "sent": email_totals["sent"],
+                "received": email_totals["received"],
+                "top_contacts": [dict(row) for row in contacts],
+            },
+            "approvals": {row["status"]: row["count"] for row in approvals},
+            "notes": {"created": sum(row["count"] for row in notes), "daily": [dict(row) for row in notes]},
+            "audit": self.audit_stats(since_day, until_day)["totals"],
+        }
+
+    def upsert_search_documents(self, documents: list[tuple[str, str, str, str, str | None]]) -> None:
+        """Index ``(kind, ref, title, body, meta_json)`` rows.
+
+        A shorter body never replaces a longer one, so a metadata-only
+        sighting (subject and snippet) keeps the full text indexed earlier.
+        """
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT INTO search_documents (kind, ref, title, body, meta) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, ref) DO UPDATE SET title = excluded.title, "
+                "body = CASE WHEN length(excluded.body) >= length(body) THEN excluded.body ELSE body END, "
+                "meta = excluded.meta, updated_at = CURRENT_TIMESTAMP "
+                "WHERE excluded.title IS NOT title OR excluded.meta IS NOT meta "
+                "OR (length(excluded.body) >= length(body) AND excluded.body IS NOT body)",
+                documents,
+            )
+            conn.commit()
+
+    def delete_search_documents(self, kind: str, refs: Iterable[str]) -> None:
+        with self._conn() as conn:
+            conn.executemany(
+                "DELETE FROM search_documents WHERE kind = ? AND ref = ?",
+                [(kind, ref) for ref in refs],
+            )
+            conn.commit()
+
+    def search_documents(self, match: str, kinds: list[str] | None = None, limit: int = 10) -> list[dict[str, Any]]:
+        """BM25-ranked hits for an FTS5 ``match`` expression; titles weigh three times the body."""
+        clauses = ["search_fts MATCH ?"]
+        params: list[Any] = [match]
+        if kinds:
+            clauses.append(f"d.kind IN ({','.join('?' * len(kinds))})")
+            params.extend(kinds)
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT d.kind, d.ref, d.title, d.meta, snippet(search_fts, 1, '[', ']', '...', 16) AS snippet, "
+                "bm25(search_fts, 3.0, 1.0) AS rank "
+                "FROM search_fts JOIN search_documents d ON d.id = search_fts.rowid "
+                f"WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [
+            {
+                "kind": row["kind"],
+                "ref": row["ref"],
+                "title": row["title"],
+                "snippet": row["snippet"],
+                "score": round(-row["rank"], 4),
+                "meta": json.loads(row["meta"]) if row["meta"] else {},
+            }
+            for row in rows
+        ]
+
+    def get_thread_summary(self, thread_id: str) -> dict[str, Any] | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT thread_id, history_id, last_message_id, message_count, summary, digests, seen_paragraphs, "
+                "updated_at FROM thread_summaries WHERE thread_id = ?",
+                (thread_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return {**dict(row), "digests": json.loads(row["digests"]), "seen_paragraphs": json.loads(row["seen_paragraphs"])}
+
+    def save_thread_summary(
+        self,
+        thread_id: str,
+        history_id: str | None,
+        last_message_id: str | None,
+        message_count: int,
+        summary: str,
+        digests: list[dict[str, Any]],
+        seen_paragraphs: list[str],
+    ) -> None:
         with self._conn() as conn:
             conn.execute(
-                "INSERT INTO assistant_notes (source, summary) VALUES (?, ?)",
-                (source, summary),
+                "INSERT INTO thread_summaries (thread_id, history_id, last_message_id, message_count, summary, digests, "
+                "seen_paragraphs) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (thread_id) DO UPDATE SET history_id = excluded.history_id, "
+                "last_message_id = excluded.last_message_id, message_count = excluded.message_count, "
+                "summary = excluded.summary, digests = excluded.digests, seen_paragraphs = excluded.seen_paragraphs, "
+                "updated_at = CURRENT_TIMESTAMP",
+                (
+                    thread_id,
+                    history_id,
+                    last_message_id,
+                    message_count,
+                    summary,
+                    json.dumps(digests),
+                    json.dumps(seen_paragraphs),
+                ),
             )
             conn.commit()
+
+    def get_web_cache(self, url: str, now: float) -> dict[str, Any] | None:
+        """Cached response for a normalized URL, marking it recently used."""
+        with self._conn() as conn:
             row = conn.execute(
-                "SELECT id, source, summary, created_at FROM assistant_notes ORDER BY id DESC LIMIT 1"
+                "UPDATE web_cache SET last_used_at = ? WHERE url = ? RETURNING url, final_url, status, headers, body, "
+                "title, text, etag, last_modified, fresh_until, size, stored_at",
+                (now, url),
             ).fetchone()
+            conn.commit()
+        return {**dict(row), "headers": json.loads(row["headers"])} if row else None
+
+    def save_web_cache(self, entry: dict[str, Any], max_bytes: int) -> None:
+        """Store ``entry`` and evict least recently used rows until the cache fits in ``max_bytes``."""
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO web_cache (url, final_url, status, headers, body, title, text, etag, last_modified, "
+                "fresh_until, size, stored_at, last_used_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET final_url = excluded.final_url, status = excluded.status, "
+                "headers = excluded.headers, body = excluded.body, title = excluded.title, text = excluded.text, "
+                "etag = excluded.etag, last_modified = excluded.last_modified, fresh_until = excluded.fresh_until, "
+                "size = excluded.size, stored_at = excluded.stored_at, last_used_at = excluded.last_used_at",
+                (
+                    entry["url"],
+                    entry["final_url"],
+                    entry["status"],
+                    json.dumps(entry["headers"]),
+                    entry["body"],
+                    entry["title"],
+                    entry["text"],
+                    entry["etag"],
+                    entry["last_modified"],
+                    entry["fresh_until"],
+                    entry["size"],
+                    entry["stored_at"],
+                    entry["stored_at"],
+                ),
+            )
+            conn.execute(
+                "DELETE FROM web_cache WHERE url IN (SELECT url FROM (SELECT url, SUM(size) OVER "
+                "(ORDER BY last_used_at DESC, url) AS running FROM web_cache) WHERE running > ?)",
+                (max_bytes,),
+            )
+            conn.commit()
+
+    def revalidate_web_cache(
+        self, url: str, headers: dict[str, str], etag: str | None, last_modified: str | None, fresh_until: float
+    ) -> None:
+        """Apply a ``304 Not Modified``: merged headers, validators and a new freshness deadline."""
+        with self._conn() as conn:
+            conn.execute(
+                "UPDATE web_cache SET headers = ?, etag = ?, last_modified = ?, fresh_until = ? WHERE url = ?",
+                (json.dumps(headers), etag, last_modified, fresh_until, url),
+            )
+            conn.commit()
+
+    def delete_web_cache(self, url: str) -> None:
+        with self._conn() as conn:
+            conn.execute("DELETE FROM web_cache WHERE url = ?", (url,))
+            conn.commit()
+
+    def get_meeting_brief(self, event_id: str, event_updated: str, max_age_seconds: int) -> dict[str, Any] | None:
+        """Cached brief for this revision of the event, if built within ``max_age_seconds``."""
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT brief FROM meeting_briefs WHERE event_id = ? AND event_updated = ? "
+                "AND created_at >= datetime('now', ?)",
+                (event_id, event_updated, f"-{int(max_age_seconds)} seconds"),
+            ).fetchone()
+        return json.loads(row["brief"]) if row else None
+
+    def save_meeting_brief(self, event_id: str, event_updated: str, brief: dict[str, Any]) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO meeting_briefs (event_id, event_updated, brief) VALUES (?, ?, ?) "
+                "ON CONFLICT(event_id) DO UPDATE SET event_updated = excluded.event_updated, "
+                "brief = excluded.brief, created_at = CURRENT_TIMESTAMP",
+                (event_id, event_updated, json.dumps(brief)),
+            )
+            conn.commit()
+
+    def add_note(
+        self, source: str, summary: str, content_hash: str | None = None, version: str | None = None
+    ) -> dict[str, Any]:
+        with self._conn() as conn:
+            row = conn.execute(
+                "INSERT INTO assistant_notes (source, summary, content_hash, summarizer_version) VALUES (?, ?, ?, ?) "
+                "RETURNING id, source, summary, content_hash, created_at",
+                (source, summary, content_hash, version),
+            ).fetchone()
+            conn.commit()
         return dict(row) if row else {}
 
+    def get_note(self, source: str, version: str) -> dict[str, Any] | None:
+        """Latest note for ``source`` memoized by summarizer ``version`` (other versions are ignored)."""
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT id, source, summary, content_hash, created_at FROM assistant_notes "
+                "WHERE source = ? AND summarizer_version = ? AND content_hash IS NOT NULL ORDER BY id DESC LIMIT 1",
+                (source, version),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def add_notes(
+        self, notes: Iterable[tuple[str, str, str | None]], version: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Insert ``(source, summary, content_hash)`` rows written by summarizer ``version`` in one transaction."""
+        created: list[dict[str, Any]] = []
+        with self._conn() as conn:
+            for source, summary, content_hash in notes:
+                row = conn.execute(
+                    "INSERT INTO assistant_notes (source, summary, content_hash, summarizer_version) "
+                    "VALUES (?, ?, ?, ?) RETURNING id, source, summary, content_hash, created_at",
+                    (source, summary, content_hash, version),
+                ).fetchone()
+                created.append(dict(row))
+            conn.commit()
+        return created
+
+    def get_notes(self, sources: list[str], version: str) -> dict[str, dict[str, Any]]:
+        """Latest note per source memoized by summarizer ``version``, for the sources that have one."""
+        if not sources:
+            return {}
+        placeholders = ",".join("?" for _ in sources)
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT id, source, summary, content_hash, created_at FROM assistant_notes "
+                f"WHERE source IN ({placeholders}) AND summarizer_version = ? AND content_hash IS NOT NULL ORDER BY id",
+                [*sources, version],
+            ).fetchall()
+        return {row["source"]: dict(row) for row in rows}
+
+    def get_note_by_hash(self, content_hash: str) -> dict[str, Any] | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT id, source, summary, content_hash, created_at FROM assistant_notes "
+                "WHERE content_hash = ? ORDER BY id DESC LIMIT 1",
+                (content_hash,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def get_notes_by_hash(self, content_hashes: list[str]) -> dict[str, dict[str, Any]]:
+        """Latest note per content hash, for the hashes that have one."""
+        if not content_hashes:
+            return {}
+        placeholders = ",".join("?" for _ in content_hashes)
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT id, source, summary, content_hash, created_at FROM assistant_notes "
+                f"WHERE content_hash IN ({placeholders}) ORDER BY id",
+                content_hashes,
+            ).fetchall()
+        return {row["content_hash"]: dict(row) for row in rows}
+
     def list_notes(self, limit: int = 50) -> list[dict[str, Any]]:
         with self._conn() as conn:
             rows = conn.execute(
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TypeVar
 
-from ..assistant.models import ToolResponse
+from ..dispatch import dispatcher
+from ..logging_conf import Lazy
+from ..metrics import metrics
+from ..output_budget import output_budget
+from ..tracing import tracer
 
+_F = TypeVar("_F", bound=Callable[..., Any])
 _logger = logging.getLogger("aios_cofounder_mcp.tools")
 _SENSITIVE_KEYS = {"code", "access_token", "refresh_token", "id_token", "authorization", "token"}
 # previous implementation (kept for reference)
@@ -34,11 +42,17 @@ def _redact_value(value: Any, *, max_len: int = 200, depth: int = 0) -> Any:
 
 def log_tool_call(tool_name: str, payload: dict[str, Any]) -> None:
     # wrapper exists to keep audit logs consistent across tools
-    _logger.info("tool_call %s payload=%s", tool_name, _redact_value(payload))
+    if not _logger.isEnabledFor(logging.INFO):
+        return
+    # redaction walks the whole payload (e.g. draft bodies), so it only runs if a handler formats the record
+    redacted = Lazy(_redact_value, payload)
+    _logger.info("tool_call %s payload=%s", tool_name, redacted, extra={"tool": tool_name, "payload": redacted})
 
 
 def response_ok(data: dict[str, Any]) -> dict[str, Any]:
-    return ToolResponse(ok=True, data=data).model_dump()
+    # plain dicts rather than a pydantic model, so large, already trusted
+    # payloads (whole threads) are not revalidated and copied per call
+    return {"ok": True, "data": data, "error": None, "status": None, "approval_id": None}
 
 
 def response_error(
@@ -46,4 +60,71 @@ def response_error(
     status: str | None = None,
     approval_id: int | None = None,
 ) -> dict[str, Any]:
-    return ToolResponse(ok=False, error=error, status=status, approval_id=approval_id).model_dump()
+    return {"ok": False, "data": None, "error": error, "status": status, "approval_id": approval_id}
+
+
+def _estimated_size(arguments: dict[str, Any]) -> int:
+    """Rough request size from top-level arguments; serializing them only for a metric costs too much."""
+    size = 0
+    for value in arguments.values():
+        if isinstance(value, (str, bytes)):
+            size += len(value)
+        elif isinstance(value, (list, tuple, dict)):
+            size += 16 * len(value)
+        else:
+            size += 8
+    return size
+
+
+def _instrumented(fn: _F, budgeted: bool) -> _F:
+    @functools.wraps(fn)
+    def _measured(*args: Any, **kwargs: Any) -> Any:
+        with tracer.span(fn.__name__, "tool"), metrics.timed("tool", fn.__name__) as observation:
+            observation.bytes_in = _estimated_size(kwargs)
+            result = fn(*args, **kwargs)
+            if not isinstance(result, dict):
+                return result
+            observation.error = not result.get("ok", True)
+            data = result.get("data")
+            if data is None or not budgeted or output_budget.limit_for(fn.__name__) <= 0:
+                # unbudgeted results are serialized once, by the transport; bytes_out stays unset
+                return result
+            # the budget check needs the bytes anyway, so the size metric reuses them
+            encoded = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+            observation.bytes_out = len(encoded)
+            return output_budget.apply(fn.__name__, result, encoded)
+
+    return _measured  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    name: str
+    group: str
+    read_only: bool
+    call: Callable[..., Awaitable[Any]]
+
+
+# every tool registered through ``tool``; ``call`` is the dispatched, instrumented copy
+registry: dict[str, ToolSpec] = {}
+
+
+def tool(group: str, *, budgeted: bool = True, read_only: bool = False) -> Callable[[_F], _F]:
+    """Register a tool whose body runs on the dispatch pool under ``group``'s limit.
+
+    The module-level function is returned unchanged so it can still be
+    called directly; only the copy registered with the server is async,
+    recorded in :mod:`metrics`, traced and subject to the output budget.
+    ``read_only`` tools neither change external systems nor assistant state,
+    so ``batch_execute`` may run them concurrently.
+    """
+
+    def decorator(fn: _F) -> _F:
+        from ..server import mcp
+
+        dispatched = dispatcher.wrap(_instrumented(fn, budgeted), group)
+        mcp.tool(name=fn.__name__, description=fn.__doc__, annotations={"readOnlyHint": read_only})(dispatched)
+        registry[fn.__name__] = ToolSpec(fn.__name__, group, read_only, dispatched)
+        return fn
+
+    return decorator
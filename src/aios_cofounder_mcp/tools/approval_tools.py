@@ -1,35 +1,101 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
+from ..dispatch import dispatcher
+from ..notifications import approval_events
 from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
 from ..audit import log_action
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
 
 _repo = Repository(settings.db_url)
 
 
-@mcp.tool()
+@tool("approvals")
 def approval_request(action: str, payload: dict[str, Any]) -> dict:
     """Create a pending approval record."""
     log_tool_call("approval_request", {"action": action, "payload": payload})
-    approval_id = _repo.create_approval(action, payload)
+    approval_id = _repo.create_approval(action, payload, ttl_seconds=settings.approval_ttl_seconds)
     result = {"approval_id": approval_id, "status": "pending"}
-    log_action(_repo, "approval_request", {"action": action}, result)
+    log_action(_repo, "approval_request", {"action": action}, result, approval_id)
     return response_ok(result)
 
 
-@mcp.tool()
+@tool("approvals")
 def approval_resolve(approval_id: int, decision: str) -> dict:
     """Approve or deny an action."""
     log_tool_call("approval_resolve", {"approval_id": approval_id, "decision": decision})
     if decision not in {"approved", "denied"}:
         return response_error("invalid_decision")
-    record = _repo.resolve_approval(approval_id, decision)
+    record = _repo.resolve_approval(approval_id, decision, ttl_seconds=settings.approval_ttl_seconds)
     if not record:
-        return response_error("approval_not_found")
-    log_action(_repo, "approval_resolve", {"approval_id": approval_id, "decision": decision}, record)
+        # approved, denied and expired approvals are final
+        return response_error("approval_not_pending" if _repo.get_approval(approval_id) else "approval_not_found")
+    log_action(_repo, "approval_resolve", {"approval_id": approval_id, "decision": decision}, record, approval_id)
+    return response_ok(record)
+
+
+@tool("approvals")
+def approval_resolve_bulk(
+    decision: str,
+    approval_ids: list[int] | None = None,
+    action: str | None = None,
+    older_than_seconds: int | None = None,
+) -> dict:
+    """Approve or deny every pending approval matching the given IDs, action and/or minimum age."""
+    log_tool_call(
+        "approval_resolve_bulk",
+        {"decision": decision, "approval_ids": approval_ids, "action": action, "older_than_seconds": older_than_seconds},
+    )
+    if decision not in {"approved", "denied"}:
+        return response_error("invalid_decision")
+    if approval_ids is None and action is None and older_than_seconds is None:
+        # refuse to resolve every pending approval by accident
+        return response_error("filter_required")
+    resolved = _repo.resolve_approvals(
+        decision, approval_ids, action, older_than_seconds, ttl_seconds=settings.approval_ttl_seconds
+    )
+    result = {"decision": decision, "approval_ids": resolved, "count": len(resolved)}
+    log_action(
+        _repo,
+        "approval_resolve_bulk",
+        {"decision": decision, "approval_ids": approval_ids, "action": action, "older_than_seconds": older_than_seconds},
+        result,
+    )
+    return response_ok(result)
+
+
+@mcp.tool(name="approval_wait", annotations={"readOnlyHint": True})
+async def approval_wait(approval_id: int, timeout: float = 60) -> dict:
+    """Wait until an approval leaves the pending state, or until timeout seconds pass.
+
+    A pending approval past APPROVAL_TTL_SECONDS is expired right away rather than waited on.
+    """
+    log_tool_call("approval_wait", {"approval_id": approval_id, "timeout": timeout})
+    timeout = max(0.0, min(float(timeout), settings.approval_wait_max_seconds))
+    loop = asyncio.get_running_loop()
+    resolved = asyncio.Event()
+    # listen before the first read so a resolution in between is not missed
+    stop_listening = approval_events.listen(lambda *_: loop.call_soon_threadsafe(resolved.set), approval_id)
+    try:
+        record = await dispatcher.run("approvals", _repo.get_approval, approval_id)
+        if not record:
+            return response_error("approval_not_found")
+        ttl = settings.approval_ttl_seconds
+        if record["status"] == "pending" and ttl > 0:
+            # the sweeper may not have reached it yet; nothing can approve it any more
+            if await dispatcher.run("approvals", _repo.expire_approval, approval_id, ttl):
+                record = await dispatcher.run("approvals", _repo.get_approval, approval_id)
+        if record["status"] == "pending":
+            try:
+                await asyncio.wait_for(resolved.wait(), timeout)
+            except asyncio.TimeoutError:
+                return response_error("approval_wait_timeout", status="pending", approval_id=approval_id)
+            record = await dispatcher.run("approvals", _repo.get_approval, approval_id)
+    finally:
+        stop_listening()
     return response_ok(record)
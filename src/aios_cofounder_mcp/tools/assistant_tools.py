@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from ..server import mcp
+from datetime import datetime, timedelta, timezone
+
 from ..settings import settings
 from ..storage.repo import Repository
 from ..assistant import service as assistant_service
+from ..assistant import threads, triage
+from ..google import calendar as calendar_client
+from ..google import gmail as gmail_client
 from ..assistant.models import EmailSummary, MeetingBrief, DraftEmail
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
 
 _repo = Repository(settings.db_url)
 
 
-@mcp.tool()
+@tool("assistant")
 def summarize_email(message_id: str) -> dict:
     """Summarize an email and store assistant memory."""
     log_tool_call("summarize_email", {"message_id": message_id})
@@ -22,7 +26,62 @@ def summarize_email(message_id: str) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("assistant")
+def summarize_emails(message_ids: list[str] | None = None, query: str | None = None, limit: int = 100) -> dict:
+    """Summarize many emails, given by id or by Gmail search query, storing a note for each."""
+    log_tool_call("summarize_emails", {"message_ids": message_ids, "query": query, "limit": limit})
+    if bool(message_ids) == bool(query):
+        return response_error("message_ids_or_query_required")
+    try:
+        if query:
+            message_ids = gmail_client.list_message_ids(
+                settings, _repo, query, max(1, min(limit, settings.summarize_max_messages))
+            )
+        elif len(message_ids) > settings.summarize_max_messages:
+            return response_error("too_many_messages")
+        return response_ok(assistant_service.summarize_emails(settings, _repo, message_ids))
+    except RuntimeError as exc:
+        return response_error(str(exc))
+
+
+@tool("assistant")
+def summarize_thread(thread_id: str, rebuild: bool = False) -> dict:
+    """Rolling summary of an email thread; refreshes fetch only messages added since the last call.
+
+    Returns an overview, the latest message's digest and recent per-message
+    digests (quoted text removed). rebuild=true reprocesses the whole thread.
+    """
+    log_tool_call("summarize_thread", {"thread_id": thread_id, "rebuild": rebuild})
+    try:
+        return response_ok(threads.summarize_thread(settings, _repo, thread_id, rebuild))
+    except RuntimeError as exc:
+        return response_error(str(exc))
+
+
+@tool("assistant", read_only=True)
+def inbox_triage(
+    query: str = "in:inbox newer_than:7d",
+    limit: int = 20,
+    scan: int | None = None,
+    cursor: str | None = None,
+) -> dict:
+    """Rank recent messages by priority and return a compact top list.
+
+    Scores combine known-contact senders and their frequency, recency,
+    Gmail labels and keyword hits; reasons lists the features that
+    contributed. Pass next_cursor back with the same query for the next
+    (older) window.
+    """
+    log_tool_call("inbox_triage", {"query": query, "limit": limit, "scan": scan, "cursor": cursor})
+    scan = max(1, min(scan or settings.triage_scan_limit, settings.triage_scan_limit))
+    try:
+        data = triage.triage(settings, _repo, query, max(1, min(limit, scan)), scan, cursor)
+        return response_ok(data)
+    except RuntimeError as exc:
+        return response_error(str(exc))
+
+
+@tool("assistant")
 def meeting_brief(event_id: str) -> dict:
     """Prepare a meeting brief."""
     log_tool_call("meeting_brief", {"event_id": event_id})
@@ -33,7 +92,30 @@ def meeting_brief(event_id: str) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+# not read-only: refresh=true re-lists the calendar, which rewrites rollups and search rows
+@tool("assistant")
+def weekly_review_data(days: int = 7, refresh: bool = False) -> dict:
+    """Weekly digest from the local rollups: meetings and hours per day and attendee,
+    emails sent/received per contact, approvals resolved, notes created and audited actions.
+
+    Rollups follow the calendar and Gmail data the server has already synced;
+    refresh=true first re-lists the primary calendar for the window.
+    """
+    log_tool_call("weekly_review_data", {"days": days, "refresh": refresh})
+    days = max(1, min(days, 92))
+    today = datetime.now(timezone.utc).date()
+    since = today - timedelta(days=days - 1)
+    try:
+        if refresh:
+            calendar_client.list_events(
+                settings, _repo, f"{since.isoformat()}T00:00:00Z", f"{(today + timedelta(days=1)).isoformat()}T00:00:00Z"
+            )
+        return response_ok(_repo.weekly_rollups(since.isoformat(), today.isoformat()))
+    except RuntimeError as exc:
+        return response_error(str(exc))
+
+
+@tool("assistant", read_only=True)
 def compose_email_reply(context: str, tone: str | None = None) -> dict:
     """Generate an email reply draft (never sends)."""
     log_tool_call("compose_email_reply", {"context": context, "tone": tone})
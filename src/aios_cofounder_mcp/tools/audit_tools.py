@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from ..settings import settings
+from ..storage.repo import Repository
+from . import log_tool_call, response_ok, response_error, tool
+
+
+_repo = Repository(settings.db_url)
+_MAX_PAGE = 500
+
+
+@tool("audit", read_only=True)
+def audit_query(
+    action: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    approval_id: int | None = None,
+    cursor: int | None = None,
+    limit: int = 50,
+    include_details: bool = False,
+) -> dict:
+    """Query the audit log by action, time range (ISO-8601) and approval ID, newest first.
+
+    Pass next_cursor back as cursor to page. Payload/result JSON is omitted
+    unless include_details is true.
+    """
+    log_tool_call(
+        "audit_query",
+        {"action": action, "since": since, "until": until, "approval_id": approval_id, "cursor": cursor, "limit": limit},
+    )
+    try:
+        page = _repo.query_audit(
+            action=action,
+            since=since,
+            until=until,
+            approval_id=approval_id,
+            cursor=cursor,
+            limit=max(1, min(limit, _MAX_PAGE)),
+            include_details=include_details,
+        )
+    except ValueError:
+        return response_error("invalid_time_range")
+    return response_ok(page)
+
+
+@tool("audit", read_only=True)
+def audit_stats(since_day: str | None = None, until_day: str | None = None) -> dict:
+    """Count audit actions per day (YYYY-MM-DD, inclusive) without reading raw rows."""
+    log_tool_call("audit_stats", {"since_day": since_day, "until_day": until_day})
+    return response_ok(_repo.audit_stats(since_day, until_day))
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
 from ..google import oauth
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
 
 _repo = Repository(settings.db_url)
 
 
-@mcp.tool()
+@tool("auth")
 def auth_google_start() -> dict:
     """Start Google OAuth flow and return an authorization URL."""
     log_tool_call("auth_google_start", {})
@@ -21,7 +20,7 @@ def auth_google_start() -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("auth", read_only=True)
 def auth_status(approval_id: str | None = None) -> dict:
     """Return OAuth status for an approval_id or current connection status."""
     log_tool_call("auth_status", {"approval_id": approval_id})
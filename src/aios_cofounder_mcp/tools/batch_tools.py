@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any
+
+from ..metrics import metrics
+from ..server import mcp
+from ..settings import settings
+from ..tracing import tracer
+from . import log_tool_call, registry, response_error, response_ok
+
+
+async def _run_call(index: int, call: Any) -> dict[str, Any]:
+    if not isinstance(call, dict) or not isinstance(call.get("tool"), str):
+        return {"index": index, "tool": None, **response_error("invalid_call")}
+    name = call["tool"]
+    args = call.get("args") or {}
+    spec = registry.get(name)
+    if spec is None:
+        return {"index": index, "tool": name, **response_error("unknown_tool")}
+    if not isinstance(args, dict):
+        return {"index": index, "tool": name, **response_error("invalid_arguments")}
+    try:
+        inspect.signature(spec.call).bind(**args)
+    except TypeError:
+        return {"index": index, "tool": name, **response_error("invalid_arguments")}
+    try:
+        result = await spec.call(**args)
+    except Exception as exc:
+        return {"index": index, "tool": name, **response_error(str(exc) or type(exc).__name__)}
+    return {"index": index, "tool": name, **result}
+
+
+@mcp.tool(name="batch_execute", annotations={"readOnlyHint": False})
+async def batch_execute(calls: list[dict[str, Any]]) -> dict:
+    """Run several tool calls in one round trip.
+
+    Each call is ``{"tool": name, "args": {...}}``. Read-only tools run
+    concurrently (still under their group limits); tools that change state run
+    one at a time in input order afterwards, each through its own approval
+    gate. Results come back in input order with a per-item ``ok``/``error``.
+    """
+    log_tool_call("batch_execute", {"tools": [call.get("tool") if isinstance(call, dict) else None for call in calls]})
+    if len(calls) > settings.batch_max_calls:
+        return response_error("too_many_calls")
+    with tracer.span("batch_execute", "tool", calls=len(calls)), metrics.timed("tool", "batch_execute"):
+        results: list[dict[str, Any] | None] = [None] * len(calls)
+        semaphore = asyncio.Semaphore(settings.batch_concurrency)
+
+        async def _bounded(index: int, call: Any) -> None:
+            async with semaphore:
+                results[index] = await _run_call(index, call)
+
+        def _is_read_only(call: Any) -> bool:
+            spec = registry.get(call.get("tool")) if isinstance(call, dict) else None
+            # unknown or malformed calls are cheap errors, so they go with the reads
+            return spec is None or spec.read_only
+
+        await asyncio.gather(*(_bounded(index, call) for index, call in enumerate(calls) if _is_read_only(call)))
+        for index, call in enumerate(calls):
+            if results[index] is None:
+                results[index] = await _run_call(index, call)
+    return response_ok({"results": results})
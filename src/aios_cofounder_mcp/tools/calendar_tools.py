@@ -2,84 +2,184 @@ from __future__ import annotations
 
 from typing import Any
 
-from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
 from ..google import calendar as calendar_client
 from ..approvals import ensure_approval
+from ..cache import result_cache
 from ..audit import log_action
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
 
 _repo = Repository(settings.db_url)
 
 
-@mcp.tool()
-def calendar_list_events(start: str, end: str) -> dict:
-    """List calendar events in a time range."""
+def _listed_event_tags(arguments: dict[str, Any], result: dict[str, Any]) -> set[str]:
+    tags = set()
+    for event in result["data"]["events"]:
+        tags.add(f"event:{event.get('id')}")
+        if event.get("recurringEventId"):
+            tags.add(f"event:{event['recurringEventId']}")
+    return tags
+
+
+def _invalidate_event(event_id: str, event: dict[str, Any] | None = None) -> None:
+    # the old time range is covered by the event tag; the new one by span overlap
+    start = (event or {}).get("start", {})
+    end = (event or {}).get("end", {})
+    result_cache.invalidate(
+        tags={f"event:{event_id}"},
+        start=start.get("dateTime") or start.get("date"),
+        end=end.get("dateTime") or end.get("date"),
+    )
+
+
+@tool("calendar", read_only=True)
+def calendar_list_calendars() -> dict:
+    """List the calendars visible to the connected account."""
+    log_tool_call("calendar_list_calendars", {})
+    try:
+        calendars = calendar_client.list_calendars(settings, _repo)
+        return response_ok({"calendars": calendars})
+    except RuntimeError as exc:
+        return response_error(str(exc))
+
+
+@tool("calendar", read_only=True)
+@result_cache.cached(
+    "calendar_list_events",
+    ttl=60,
+    tags=_listed_event_tags,
+    span=lambda arguments: (arguments["start"], arguments["end"]),
+)
+def calendar_list_events(
+    start: str,
+    end: str,
+    local_recurrence: bool = False,
+    calendar_ids: list[str] | str | None = None,
+) -> dict:
+    """List calendar events in a time range across one, several or "all" calendars."""
     # TODO: normalize error mapping across calendar tools.
-    log_tool_call("calendar_list_events", {"start": start, "end": end})
+    log_tool_call(
+        "calendar_list_events",
+        {"start": start, "end": end, "local_recurrence": local_recurrence, "calendar_ids": calendar_ids},
+    )
     try:
-        events = calendar_client.list_events(settings, _repo, start, end)
-        return response_ok({"events": events})
+        result = calendar_client.list_events_across(
+            settings,
+            _repo,
+            start,
+            end,
+            calendar_ids,
+            local_recurrence=local_recurrence,
+        )
+        return response_ok(result)
     except RuntimeError as exc:
         return response_error(str(exc))
 
 
-@mcp.tool()
-def calendar_find_free_slots(duration_minutes: int, window_start: str, window_end: str) -> dict:
-    """Find available time slots in a range."""
+@tool("calendar", read_only=True)
+def calendar_find_free_slots(
+    duration_minutes: int,
+    window_start: str,
+    window_end: str,
+    calendar_ids: list[str] | str | None = None,
+    attendees: list[str] | None = None,
+    working_hours_start: str | None = None,
+    working_hours_end: str | None = None,
+    time_zone: str | None = None,
+    buffer_minutes: int = 0,
+    include_weekends: bool = False,
+    max_slots: int = 10,
+) -> dict:
+    """Find ranked meeting slots across calendars and attendees in a range."""
     log_tool_call(
         "calendar_find_free_slots",
         {
             "duration_minutes": duration_minutes,
             "window_start": window_start,
             "window_end": window_end,
+            "calendar_ids": calendar_ids,
+            "attendees": attendees,
+            "working_hours_start": working_hours_start,
+            "working_hours_end": working_hours_end,
+            "time_zone": time_zone,
+            "buffer_minutes": buffer_minutes,
+            "include_weekends": include_weekends,
+            "max_slots": max_slots,
         },
     )
     try:
-        slots = calendar_client.find_free_slots(settings, _repo, duration_minutes, window_start, window_end)
+        slots = calendar_client.find_free_slots(
+            settings,
+            _repo,
+            duration_minutes,
+            window_start,
+            window_end,
+            calendar_ids=calendar_ids,
+            attendees=attendees,
+            working_hours_start=working_hours_start,
+            working_hours_end=working_hours_end,
+            time_zone=time_zone,
+            buffer_minutes=buffer_minutes,
+            include_weekends=include_weekends,
+            max_slots=max_slots,
+        )
         return response_ok(slots)
     except RuntimeError as exc:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("calendar")
 def calendar_create_event(
     title: str,
     start: str,
     end: str,
     attendees: list[str],
     approval_id: int | None = None,
+    calendar_id: str = "primary",
 ) -> dict:
     """Create a calendar event (requires approval)."""
     log_tool_call(
         "calendar_create_event",
-        {"title": title, "start": start, "end": end, "attendees": attendees, "approval_id": approval_id},
+        {
+            "title": title,
+            "start": start,
+            "end": end,
+            "attendees": attendees,
+            "approval_id": approval_id,
+            "calendar_id": calendar_id,
+        },
     )
     # approval gate is required for audit trail consistency
     approval = ensure_approval(
         repo=_repo,
         action="calendar_create_event",
-        payload={"title": title, "start": start, "end": end, "attendees": attendees},
+        payload={"title": title, "start": start, "end": end, "attendees": attendees, "calendar_id": calendar_id},
         approval_id=approval_id,
     )
     if not approval.ok:
         return response_error("approval_required", status=approval.status, approval_id=approval.approval_id)
     try:
-        event = calendar_client.create_event(settings, _repo, title, start, end, attendees)
-        log_action(_repo, "calendar_create_event", {"title": title, "start": start, "end": end}, event)
+        event = calendar_client.create_event(settings, _repo, title, start, end, attendees, calendar_id=calendar_id)
+        result_cache.invalidate(start=start, end=end)
+        log_action(_repo, "calendar_create_event", {"title": title, "start": start, "end": end}, event, approval_id)
         return response_ok(event)
     except RuntimeError as exc:
         return response_error(str(exc))
 
 
-@mcp.tool()
-def calendar_update_event(event_id: str, changes: dict[str, Any], approval_id: int | None = None) -> dict:
+@tool("calendar")
+def calendar_update_event(
+    event_id: str,
+    changes: dict[str, Any],
+    approval_id: int | None = None,
+    calendar_id: str = "primary",
+) -> dict:
     """Update event details (requires approval)."""
     log_tool_call(
         "calendar_update_event",
-        {"event_id": event_id, "changes": changes, "approval_id": approval_id},
+        {"event_id": event_id, "changes": changes, "approval_id": approval_id, "calendar_id": calendar_id},
     )
     # previous implementation (kept for reference)
     # if approval_id is None:
@@ -87,34 +187,39 @@ def calendar_update_event(event_id: str, changes: dict[str, Any], approval_id: i
     approval = ensure_approval(
         repo=_repo,
         action="calendar_update_event",
-        payload={"event_id": event_id, "changes": changes},
+        payload={"event_id": event_id, "changes": changes, "calendar_id": calendar_id},
         approval_id=approval_id,
     )
     if not approval.ok:
         return response_error("approval_required", status=approval.status, approval_id=approval.approval_id)
     try:
-        event = calendar_client.update_event(settings, _repo, event_id, changes)
-        log_action(_repo, "calendar_update_event", {"event_id": event_id, "changes": changes}, event)
+        event = calendar_client.update_event(settings, _repo, event_id, changes, calendar_id=calendar_id)
+        _invalidate_event(event_id, event)
+        log_action(_repo, "calendar_update_event", {"event_id": event_id, "changes": changes}, event, approval_id)
         return response_ok(event)
     except RuntimeError as exc:
         return response_error(str(exc))
 
 
-@mcp.tool()
-def calendar_cancel_event(event_id: str, approval_id: int | None = None) -> dict:
+@tool("calendar")
+def calendar_cancel_event(event_id: str, approval_id: int | None = None, calendar_id: str = "primary") -> dict:
     """Cancel an event (requires approval)."""
-    log_tool_call("calendar_cancel_event", {"event_id": event_id, "approval_id": approval_id})
+    log_tool_call(
+        "calendar_cancel_event",
+        {"event_id": event_id, "approval_id": approval_id, "calendar_id": calendar_id},
+    )
     approval = ensure_approval(
         repo=_repo,
         action="calendar_cancel_event",
-        payload={"event_id": event_id},
+        payload={"event_id": event_id, "calendar_id": calendar_id},
         approval_id=approval_id,
     )
     if not approval.ok:
         return response_error("approval_required", status=approval.status, approval_id=approval.approval_id)
     try:
-        result = calendar_client.cancel_event(settings, _repo, event_id)
-        log_action(_repo, "calendar_cancel_event", {"event_id": event_id}, result)
+        result = calendar_client.cancel_event(settings, _repo, event_id, calendar_id=calendar_id)
+        _invalidate_event(event_id)
+        log_action(_repo, "calendar_cancel_event", {"event_id": event_id}, result, approval_id)
         return response_ok(result)
     except RuntimeError as exc:
         return response_error(str(exc))
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
 from ..google import contacts as contacts_client
 from ..approvals import ensure_approval
+from ..cache import result_cache
 from ..audit import log_action
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
 
 _repo = Repository(settings.db_url)
 
 
-@mcp.tool()
+def _contact_tags(arguments: dict, result: dict) -> set[str]:
+    emails = result["data"].get("emailAddresses", [])
+    return {f"contact:{arguments['contact_id']}"} | {f"email:{item.get('value', '').lower()}" for item in emails}
+
+
+@tool("contacts", read_only=True)
 def contacts_search(query: str) -> dict:
     """Search Google Contacts."""
     log_tool_call("contacts_search", {"query": query})
@@ -23,7 +28,8 @@ def contacts_search(query: str) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("contacts", read_only=True)
+@result_cache.cached("contacts_get", ttl=600, tags=_contact_tags)
 def contacts_get(contact_id: str) -> dict:
     """Return full contact details."""
     log_tool_call("contacts_get", {"contact_id": contact_id})
@@ -34,7 +40,7 @@ def contacts_get(contact_id: str) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("contacts")
 def contacts_create_or_update(
     name: str,
     email: str,
@@ -56,7 +62,8 @@ def contacts_create_or_update(
         return response_error("approval_required", status=approval.status, approval_id=approval.approval_id)
     try:
         contact = contacts_client.create_or_update_contact(settings, _repo, name, email, company)
-        log_action(_repo, "contacts_create_or_update", {"email": email}, contact)
+        result_cache.invalidate(tags={f"contact:{contact.get('resourceName')}", f"email:{email.lower()}"})
+        log_action(_repo, "contacts_create_or_update", {"email": email}, contact, approval_id)
         return response_ok(contact)
     except RuntimeError as exc:
         return response_error(str(exc))
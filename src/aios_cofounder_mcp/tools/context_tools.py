@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from .. import search_index
+from ..settings import settings
+from ..storage.repo import Repository
+from . import log_tool_call, response_ok, response_error, tool
+
+
+_repo = Repository(settings.db_url)
+_MAX_HITS = 50
+
+
+@tool("context", read_only=True)
+def context_search(query: str, kinds: list[str] | None = None, limit: int = 10) -> dict:
+    """Search locally indexed mail, calendar events, contacts and notes in one call.
+
+    Hits are BM25-ranked and typed by kind (message, event, contact, note);
+    ref is the id to pass to the matching tool. Only data the server has
+    already seen (fetched messages, listed events, contacts, notes) is indexed.
+    """
+    log_tool_call("context_search", {"query": query, "kinds": kinds, "limit": limit})
+    if kinds and any(kind not in search_index.KINDS for kind in kinds):
+        return response_error("invalid_kind")
+    hits = search_index.search(_repo, query, kinds, max(1, min(limit, _MAX_HITS)))
+    return response_ok({"hits": hits})
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-from ..server import mcp
 from ..settings import settings
 from ..storage.repo import Repository
 from ..google import gmail as gmail_client
 from ..approvals import ensure_approval
+from ..cache import result_cache
 from ..audit import log_action
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
 
 _repo = Repository(settings.db_url)
 
 
-@mcp.tool()
+@tool("gmail", read_only=True)
 def gmail_search(query: str, limit: int = 10) -> dict:
     """Search Gmail messages and return metadata."""
     log_tool_call("gmail_search", {"query": query, "limit": limit})
@@ -23,7 +23,8 @@ def gmail_search(query: str, limit: int = 10) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("gmail", read_only=True)
+@result_cache.cached("gmail_get_message", ttl=300, tags=lambda arguments, result: {f"message:{arguments['message_id']}"})
 def gmail_get_message(message_id: str) -> dict:
     """Return full email content (plain text preferred)."""
     log_tool_call("gmail_get_message", {"message_id": message_id})
@@ -34,7 +35,7 @@ def gmail_get_message(message_id: str) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("gmail", read_only=True)
 def gmail_get_thread(thread_id: str) -> dict:
     """Return all messages in a thread."""
     log_tool_call("gmail_get_thread", {"thread_id": thread_id})
@@ -45,7 +46,7 @@ def gmail_get_thread(thread_id: str) -> dict:
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("gmail")
 def gmail_create_draft(to: str, subject: str, body: str, thread_id: str | None = None) -> dict:
     """Create an email draft only."""
     log_tool_call(
@@ -60,7 +61,7 @@ def gmail_create_draft(to: str, subject: str, body: str, thread_id: str | None =
         return response_error(str(exc))
 
 
-@mcp.tool()
+@tool("gmail")
 def gmail_apply_labels(
     labels: list[str],
     message_id: str | None = None,
@@ -97,7 +98,8 @@ def gmail_apply_labels(
         )
     try:
         result = gmail_client.apply_labels(settings, _repo, ids, labels)
-        log_action(_repo, "gmail_apply_labels", {"message_ids": ids, "labels": labels}, result)
+        result_cache.invalidate(tags={f"message:{message_id}" for message_id in ids})
+        log_action(_repo, "gmail_apply_labels", {"message_ids": ids, "labels": labels}, result, approval_id)
         return response_ok(result)
     except RuntimeError as exc:
         return response_error(str(exc))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from ..output_budget import output_budget
+from . import log_tool_call, response_ok, response_error, tool
+
+
+@tool("output", budgeted=False, read_only=True)
+def tool_output_continue(continuation: str, offset: int) -> dict:
+    """Fetch the full result of a truncated tool call in chunks: start at offset 0, follow next_offset and join partial_json."""
+    log_tool_call("tool_output_continue", {"continuation": continuation, "offset": offset})
+    chunk = output_budget.continue_from(continuation, offset)
+    if chunk is None:
+        return response_error("continuation_not_found")
+    return response_ok(chunk)
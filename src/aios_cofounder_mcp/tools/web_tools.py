@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from ..server import mcp
 from ..settings import settings
+from ..storage.repo import Repository
 from ..web import search as web_search_client
 from ..web import fetch as web_fetch_client
-from . import log_tool_call, response_ok, response_error
+from . import log_tool_call, response_ok, response_error, tool
 
+_repo = Repository(settings.db_url)
 
-@mcp.tool()
+
+@tool("web", read_only=True)
 def web_search(query: str, limit: int = 5) -> dict:
     """Perform a web search and return top results."""
     log_tool_call("web_search", {"query": query, "limit": limit})
@@ -18,12 +20,12 @@ def web_search(query: str, limit: int = 5) -> dict:
         return response_error(f"web_search_failed:{exc}")
 
 
-@mcp.tool()
+@tool("web", read_only=True)
 def web_fetch(url: str) -> dict:
-    """Fetch page content and extract readable text."""
+    """Fetch page content and extract readable text; ``from_cache`` marks a response served from the HTTP cache."""
     log_tool_call("web_fetch", {"url": url})
     try:
-        result = web_fetch_client.fetch(settings, url)
+        result = web_fetch_client.fetch(settings, _repo, url)
         return response_ok(result)
     except Exception as exc:
         return response_error(f"web_fetch_failed:{exc}")
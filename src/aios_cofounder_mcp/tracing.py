@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, TypeVar
+
+from .settings import Settings, settings
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    kind: str
+    start_ns: int
+    end_ns: int | None = None
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def as_dict(self) -> dict[str, Any]:
+        duration = (self.end_ns - self.start_ns) / 1e6 if self.end_ns is not None else None
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "duration_ms": round(duration, 3) if duration is not None else None,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+@dataclass
+class _Trace:
+    spans: list[Span] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# current span (or _UNSAMPLED so nested calls skip the sampling decision)
+_UNSAMPLED = object()
+_current: contextvars.ContextVar[Any] = contextvars.ContextVar("aios_current_span", default=None)
+_trace: contextvars.ContextVar[_Trace | None] = contextvars.ContextVar("aios_current_trace", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Tracer:
+    """Parent/child spans propagated through contextvars.
+
+    The sampling decision is made once per root span (normally a tool call)
+    and inherited by everything nested under it, including work on the
+    dispatch pool, which copies the caller's context. Finished traces are
+    kept in a ring buffer and optionally appended to a JSONL file in an
+    OTLP-like ``resourceSpans`` shape.
+    """
+
+    def __init__(self, sample_rate: float, buffer_size: int = 100, export_path: str | None = None) -> None:
+        self.sample_rate = sample_rate
+        self.export_path = export_path
+        self._recent: deque[list[dict[str, Any]]] = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span | None]:
+        parent = _current.get()
+        if parent is _UNSAMPLED or (parent is None and (self.sample_rate <= 0 or random.random() >= self.sample_rate)):
+            if parent is None:
+                token = _current.set(_UNSAMPLED)
+                try:
+                    yield None
+                finally:
+                    _current.reset(token)
+            else:
+                yield None
+            return
+
+        trace = _trace.get() if parent is not None else _Trace()
+        span = Span(
+            trace_id=parent.trace_id if parent is not None else _new_id(128),
+            span_id=_new_id(64),
+            parent_id=parent.span_id if parent is not None else None,
+            name=name,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        span_token = _current.set(span)
+        trace_token = _trace.set(trace) if parent is None else None
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current.reset(span_token)
+            if trace is not None:
+                with trace.lock:
+                    trace.spans.append(span)
+            if trace_token is not None:
+                _trace.reset(trace_token)
+                self._finish(trace)
+
+    def _finish(self, trace: _Trace) -> None:
+        with trace.lock:
+            spans = sorted(trace.spans, key=lambda item: item.start_ns)
+        with self._lock:
+            self._recent.append([span.as_dict() for span in spans])
+            if self.export_path:
+                with open(self.export_path, "a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(_otlp(spans), default=str) + "\n")
+
+    def recent(self, limit: int = 20) -> list[list[dict[str, Any]]]:
+        with self._lock:
+            return list(self._recent)[-limit:][::-1]
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp(spans: list[Span]) -> dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", "aios-cofounder-mcp")]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "aios_cofounder_mcp.tracing"},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                "parentSpanId": span.parent_id or "",
+                                "name": span.name,
+                                "startTimeUnixNano": str(span.start_ns),
+                                "endTimeUnixNano": str(span.end_ns),
+                                "attributes": [_attribute("kind", span.kind)]
+                                + [_attribute(key, value) for key, value in span.attributes.items()],
+                                # STATUS_CODE_ERROR = 2, STATUS_CODE_UNSET = 0
+                                "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def trace_methods(kind: str) -> Callable[[type[_T]], type[_T]]:
+    """Class decorator opening a span around every public method."""
+
+    def decorator(cls: type[_T]) -> type[_T]:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value):
+                continue
+            setattr(cls, attr, _traced_method(kind, f"{cls.__name__}.{attr}", value))
+        return cls
+
+    return decorator
+
+
+def _traced_method(kind: str, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tracer.span(name, kind):
+            return method(*args, **kwargs)
+
+    return _wrapper
+
+
+def build_tracer(settings: Settings) -> Tracer:
+    export_path = settings.trace_export_path
+    if export_path:
+        os.makedirs(os.path.dirname(os.path.abspath(export_path)), exist_ok=True)
+    return Tracer(
+        sample_rate=settings.trace_sample_rate,
+        buffer_size=settings.trace_buffer_size,
+        export_path=export_path,
+    )
+
+
+tracer = build_tracer(settings)
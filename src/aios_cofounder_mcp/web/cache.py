@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# freshness guessed from Last-Modified when the server gives none (RFC 9111 4.2.2)
+_HEURISTIC_FRACTION = 0.1
+_HEURISTIC_MAX_SECONDS = 24 * 3600
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# response headers kept with a cached entry; the rest only matter to the transfer
+STORED_HEADERS = ("content-type", "cache-control", "etag", "last-modified", "expires", "date", "age", "vary")
+
+
+def normalize_url(url: str) -> str:
+    """Cache key: lower-case scheme and host, default port and fragment dropped, query sorted."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_directives(headers: Mapping[str, str]) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for item in (headers.get("cache-control") or "").split(","):
+        name, _, value = item.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _seconds(value: str | None) -> int | None:
+    try:
+        return max(int(value), 0) if value is not None else None
+    except ValueError:
+        return None
+
+
+def fresh_until(headers: Mapping[str, str], now: float | None = None) -> float | None:
+    """When a response stops being fresh, or ``None`` if it must not be stored.
+
+    Applies a private cache's view of RFC 9111: ``no-store`` and ``Vary: *``
+    are never stored, ``no-cache`` is stored but revalidated on every use,
+    and ``max-age`` (less ``Age``) wins over ``Expires``, which wins over the
+    Last-Modified heuristic. A response with no freshness and no validator
+    is not worth keeping.
+    """
+    now = time.time() if now is None else now
+    directives = cache_directives(headers)
+    if "no-store" in directives or (headers.get("vary") or "").strip() == "*":
+        return None
+    validated = bool(headers.get("etag") or headers.get("last-modified"))
+    date = _http_date(headers.get("date")) or now
+    if "no-cache" in directives:
+        lifetime = 0.0
+    elif (max_age := _seconds(directives.get("max-age"))) is not None:
+        lifetime = max_age - (_seconds(headers.get("age")) or 0)
+    elif (expires := _http_date(headers.get("expires"))) is not None or headers.get("expires"):
+        # an unparseable Expires means already expired
+        lifetime = (expires or 0) - date
+    elif (modified := _http_date(headers.get("last-modified"))) is not None:
+        lifetime = min(max(date - modified, 0) * _HEURISTIC_FRACTION, _HEURISTIC_MAX_SECONDS)
+    else:
+        lifetime = 0.0
+    if lifetime <= 0 and not validated:
+        return None
+    return now + max(lifetime, 0)
+
+
+def stored_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    return {name: headers[name] for name in STORED_HEADERS if headers.get(name)}
+
+
+def conditional_headers(entry: dict[str, Any]) -> dict[str, str]:
+    """Validators to revalidate a stale entry with."""
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
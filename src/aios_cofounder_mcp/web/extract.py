@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+# subtrees that never hold article text
+SKIPPED_TAGS = frozenset(
+    {"script", "style", "noscript", "template", "svg", "iframe", "nav", "header", "footer", "aside", "form", "button", "select"}
+)
+# elements whose text is kept; text outside them (menus, bare divs) is dropped
+CONTENT_TAGS = frozenset({"p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "pre", "figcaption"})
+# void elements have no end tag, so they are never pushed on the open-element stack
+_VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"})
+_BOILERPLATE_ROLES = frozenset({"navigation", "banner", "contentinfo", "complementary", "search", "dialog"})
+# block starts that imply </p> (HTML's "close a p element")
+_CLOSES_P = frozenset(
+    {"address", "article", "aside", "blockquote", "details", "div", "dl", "fieldset", "figcaption", "figure", "footer",
+     "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "menu", "nav", "ol", "p", "pre", "section",
+     "table", "ul", "li", "dd", "dt"}
+)
+# an optional end tag is implied only up to the nearest enclosing container
+_SCOPE_BOUNDARIES = frozenset(
+    {"html", "body", "div", "td", "th", "table", "button", "blockquote", "section", "article", "main", "figure",
+     "template", "object"}
+)
+_P = frozenset({"p"})
+_P_BOUNDARIES = _SCOPE_BOUNDARIES | (_CLOSES_P - _P)
+# start tag -> (elements it implicitly closes, containers that bound the search)
+_IMPLIED_ENDS = {
+    "li": (frozenset({"li"}), frozenset({"ul", "ol", "menu"})),
+    "dt": (frozenset({"dt", "dd"}), frozenset({"dl"})),
+    "dd": (frozenset({"dt", "dd"}), frozenset({"dl"})),
+}
+_WHITESPACE = re.compile(r"\s+")
+
+
+class TextExtractor(HTMLParser):
+    """Single-pass title and readable-text extraction, fed incrementally.
+
+    Content inside ``SKIPPED_TAGS`` (and elements with a navigation-like ARIA
+    role or ``hidden``) is ignored as it streams past, so nothing is built
+    beyond the title and the kept text blocks. Call ``feed`` per decoded
+    chunk, then ``close`` and ``result``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title: str | None = None
+        self._title_parts: list[str] | None = None
+        # open elements as (tag, counted as a content block)
+        self._open: list[tuple[str, bool]] = []
+        # stack depth at which a skipped subtree starts
+        self._skip_at: int | None = None
+        self._block_depth = 0
+        self._current: list[str] = []
+        self._segments: list[str] = []
+
+    def _flush(self) -> None:
+        if self._current:
+            segment = _WHITESPACE.sub(" ", "".join(self._current)).strip()
+            if segment:
+                self._segments.append(segment)
+            self._current = []
+
+    def _pop_to(self, index: int) -> None:
+        """Close ``self._open[index]`` and everything opened inside it."""
+        while len(self._open) > index:
+            tag, counted = self._open.pop()
+            if counted:
+                self._block_depth -= 1
+                self._flush()
+            elif tag == "title" and self._title_parts is not None:
+                self.title = _WHITESPACE.sub(" ", "".join(self._title_parts)).strip() or None
+                self._title_parts = None
+        if self._skip_at is not None and len(self._open) <= self._skip_at:
+            self._skip_at = None
+
+    def _find_open(self, targets: frozenset[str], boundaries: frozenset[str]) -> int | None:
+        for index in range(len(self._open) - 1, -1, -1):
+            tag = self._open[index][0]
+            if tag in targets:
+                return index
+            if tag in boundaries:
+                return None
+        return None
+
+    def _close_implied(self, tag: str) -> None:
+        # html.parser reports tags as written, so optional end tags (</p>, </li>, ...) are
+        # implied here; otherwise a hidden <li> or <p> would swallow the rest of the page
+        if tag in _IMPLIED_ENDS:
+            targets, boundaries = _IMPLIED_ENDS[tag]
+            index = self._find_open(targets, boundaries | _SCOPE_BOUNDARIES)
+            if index is not None:
+                self._pop_to(index)
+        if tag in _CLOSES_P:
+            index = self._find_open(_P, _P_BOUNDARIES)
+            if index is not None:
+                self._pop_to(index)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        if tag in _VOID_TAGS:
+            if tag == "br" and self._skip_at is None and self._block_depth:
+                self._current.append(" ")
+            return
+        if self._skip_at is None:
+            attributes = dict(attrs)
+            if tag in SKIPPED_TAGS or "hidden" in attributes or (attributes.get("role") or "").lower() in _BOILERPLATE_ROLES:
+                self._skip_at = len(self._open)
+        counted = self._skip_at is None and tag in CONTENT_TAGS
+        if counted:
+            self._flush()
+            self._block_depth += 1
+        elif tag == "title" and self._skip_at is None and self.title is None:
+            self._title_parts = []
+        self._open.append((tag, counted))
+
+    def handle_endtag(self, tag: str) -> None:
+        # an end tag closes the nearest open element of that name and everything inside it;
+        # a stray end tag with no open element is ignored
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index][0] == tag:
+                self._pop_to(index)
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_at is not None:
+            return
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        elif self._block_depth:
+            self._current.append(data)
+
+    def result(self) -> tuple[str | None, str]:
+        self._flush()
+        return self.title, " ".join(self._segments)
+
+
+def extract(html: str) -> tuple[str | None, str]:
+    parser = TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.result()
@@ -1,22 +1,122 @@
 from __future__ import annotations
 
+import codecs
+import time
+import zlib
+from typing import Any
+
 import httpx
-from bs4 import BeautifulSoup
 
 from ..settings import Settings
+from ..storage.repo import Repository
+from . import cache as web_cache
+from .extract import TextExtractor
+from .http import http_clients, request_options
+
+# an absent Content-Type is read as HTML
+_HTML_TYPES = frozenset({"", "text/html", "application/xhtml+xml"})
+_TEXT_TYPES = _HTML_TYPES | {"text/plain"}
+
+
+def _result(url: str, title: str | None, text: str, from_cache: bool, truncated: bool = False) -> dict[str, Any]:
+    return {"url": url, "title": title, "text": text, "from_cache": from_cache, "truncated": truncated}
+
+
+def _decoder(response: httpx.Response) -> codecs.IncrementalDecoder:
+    try:
+        return codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _read(response: httpx.Response, media_type: str, max_bytes: int) -> tuple[bytes, str | None, str, bool]:
+    """Stream the (decompressed) body into the extractor, stopping at ``max_bytes``.
+
+    Returns the raw bytes read, title, text and whether the body was cut off.
+    """
+    decoder = _decoder(response)
+    extractor = TextExtractor() if media_type in _HTML_TYPES else None
+    plain: list[str] = []
+    chunks: list[bytes] = []
+    size = 0
+    truncated = False
+    for chunk in response.iter_bytes():
+        if size + len(chunk) > max_bytes:
+            chunk = chunk[: max_bytes - size]
+            truncated = True
+        chunks.append(chunk)
+        size += len(chunk)
+        decoded = decoder.decode(chunk)
+        if extractor is not None:
+            extractor.feed(decoded)
+        else:
+            plain.append(decoded)
+        if truncated:
+            break
+    tail = decoder.decode(b"", final=True)
+    if extractor is None:
+        return b"".join(chunks), None, " ".join("".join(plain + [tail]).split()), truncated
+    extractor.feed(tail)
+    extractor.close()
+    title, text = extractor.result()
+    return b"".join(chunks), title, text, truncated
+
+
+def fetch(settings: Settings, repo: Repository, url: str) -> dict[str, Any]:
+    """Fetch a page and extract its title and readable text, through the HTTP cache.
+
+    A fresh cached entry is returned without a request; a stale one with an
+    ETag or Last-Modified is revalidated, and a ``304`` reuses the stored
+    extraction. ``from_cache`` tells the caller which happened. Bodies are
+    streamed into the extractor and cut off after ``WEB_FETCH_MAX_BYTES``
+    (``truncated``; truncated pages are not cached); non-text content types
+    are refused before any of the body is read.
+    """
+    caching = settings.web_cache_max_bytes > 0
+    key = web_cache.normalize_url(url)
+    now = time.time()
+    entry = repo.get_web_cache(key, now) if caching else None
+    if entry and entry["fresh_until"] > now:
+        return _result(url, entry["title"], entry["text"], from_cache=True)
 
+    conditional = web_cache.conditional_headers(entry) if entry else None
+    with http_clients.stream("GET", url, **request_options(settings, conditional)) as response:
+        if entry and response.status_code == 304:
+            headers = {**entry["headers"], **web_cache.stored_headers(response.headers)}
+            until = web_cache.fresh_until(headers, now)
+            if until is None:
+                repo.delete_web_cache(key)
+            else:
+                repo.revalidate_web_cache(key, headers, headers.get("etag"), headers.get("last-modified"), until)
+            return _result(url, entry["title"], entry["text"], from_cache=True)
+        response.raise_for_status()
+        media_type = (response.headers.get("content-type") or "").split(";")[0].strip().lower()
+        if media_type not in _TEXT_TYPES:
+            raise RuntimeError(f"unsupported_content_type:{media_type}")
+        raw, title, text, truncated = _read(response, media_type, settings.web_fetch_max_bytes)
 
-def fetch(settings: Settings, url: str) -> dict[str, str | None]:
-    headers = {"User-Agent": settings.web_user_agent}
-    with httpx.Client(timeout=settings.web_timeout_seconds, headers=headers, follow_redirects=True) as client:
-        response = client.get(url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    text = " ".join(p.get_text(strip=True) for p in soup.find_all("p"))
-    return {
-        "url": url,
-        "title": soup.title.get_text(strip=True) if soup.title else None,
-        "text": text,
-    }
+    until = None
+    if caching and response.status_code == 200 and not truncated:
+        until = web_cache.fresh_until(response.headers, now)
+    if until is not None:
+        body = zlib.compress(raw)
+        repo.save_web_cache(
+            {
+                "url": key,
+                "final_url": str(response.url),
+                "status": response.status_code,
+                "headers": web_cache.stored_headers(response.headers),
+                "body": body,
+                "title": title,
+                "text": text,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "fresh_until": until,
+                "size": len(body) + len(text.encode("utf-8")),
+                "stored_at": now,
+            },
+            settings.web_cache_max_bytes,
+        )
+    elif entry:
+        repo.delete_web_cache(key)
+    return _result(url, title, text, from_cache=False, truncated=truncated)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..settings import Settings, settings
+
+
+def _host(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def request_options(settings: Settings, headers: dict[str, str] | None = None) -> dict[str, Any]:
+    """Per-request ``headers`` and ``timeout`` from ``settings``, overriding the shared client's defaults."""
+    return {
+        "headers": {"User-Agent": settings.web_user_agent, **(headers or {})},
+        "timeout": settings.web_timeout_seconds,
+    }
+
+
+class HttpClients:
+    """Process-wide pooled ``httpx`` client shared by the web helpers.
+
+    The client is created lazily and reused, so repeated requests to the
+    same host ride a kept-alive connection (HTTP/2 when the ``h2`` package
+    is installed). httpx only bounds the pool as a whole, so requests also
+    take a per-host slot, keeping one busy site from holding every
+    connection. The user agent and timeout given here are defaults; callers
+    holding their own ``Settings`` pass theirs per request.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: float,
+        max_connections: int,
+        max_keepalive: int,
+        keepalive_expiry: float,
+        per_host: int,
+        http2: bool,
+    ) -> None:
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.per_host = per_host
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._client: httpx.Client | None = None
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _options(self) -> dict[str, Any]:
+        return {
+            "timeout": self.timeout,
+            "headers": {"User-Agent": self.user_agent},
+            "follow_redirects": True,
+            "limits": self.limits,
+            "http2": self.http2,
+        }
+
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(**self._options())
+            return self._client
+
+    @contextmanager
+    def host_slot(self, url: str) -> Iterator[None]:
+        with self._lock:
+            slot = self._host_slots.setdefault(_host(url), threading.BoundedSemaphore(self.per_host))
+        with slot:
+            yield
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        with self.host_slot(url):
+            return self.client().get(url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """``client.stream`` holding the host slot until the body has been read or abandoned."""
+        with self.host_slot(url), self.client().stream(method, url, **kwargs) as response:
+            yield response
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+
+def build_http_clients(settings: Settings) -> HttpClients:
+    return HttpClients(
+        user_agent=settings.web_user_agent,
+        timeout=settings.web_timeout_seconds,
+        max_connections=settings.http_max_connections,
+        max_keepalive=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        per_host=settings.http_per_host_connections,
+        http2=settings.http2_enabled,
+    )
+
+
+http_clients = build_http_clients(settings)
+atexit.register(http_clients.close)
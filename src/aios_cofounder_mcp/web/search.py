@@ -2,17 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
 from bs4 import BeautifulSoup
 
 from ..settings import Settings
+from .http import http_clients, request_options
 
 
 def search(settings: Settings, query: str, limit: int = 5) -> list[dict[str, Any]]:
     url = "https://duckduckgo.com/html/"
-    headers = {"User-Agent": settings.web_user_agent}
-    with httpx.Client(timeout=settings.web_timeout_seconds, headers=headers, follow_redirects=True) as client:
-        response = client.get(url, params={"q": query})
+    response = http_clients.get(url, params={"q": query}, **request_options(settings))
     response.raise_for_status()
     soup = BeautifulSoup(response.text, "html.parser")
     results: list[dict[str, Any]] = []
@@ -0,0 +1,77 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from aios_cofounder_mcp.approvals import ensure_approval, sweep_expired_approvals
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import get_connection, init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+
+def _age(approval_ids: list[int], seconds: int) -> None:
+    conn = get_connection(settings.db_url)
+    conn.executemany(
+        "UPDATE approvals SET created_at = datetime('now', ?) WHERE id = ?",
+        [(f"-{seconds} seconds", approval_id) for approval_id in approval_ids],
+    )
+    conn.commit()
+
+
+def test_bulk_resolve_sweeper_and_default_listing() -> None:
+    repo = Repository(settings.db_url)
+    ids = [repo.create_approval("expiry_test", {"n": n}) for n in range(5)]
+    other = repo.create_approval("expiry_other", {"n": 0})
+
+    assert repo.resolve_approvals("denied", approval_ids=ids[:2]) == ids[:2]
+    # already resolved rows are left alone
+    assert repo.resolve_approvals("approved", approval_ids=ids[:2]) == []
+
+    _age(ids[2:], 7200)
+    assert sweep_expired_approvals(repo, ttl_seconds=3600, batch_size=2) == 3
+    assert {repo.get_approval(i)["status"] for i in ids[2:]} == {"expired"}
+    assert repo.get_approval(other)["status"] == "pending"
+
+    listed = {row["id"] for row in repo.list_approvals(limit=1000)}
+    assert other in listed and set(ids[:2]) <= listed
+    assert not listed & set(ids[2:])
+    assert set(ids) <= {row["id"] for row in repo.list_approvals(limit=1000, history_seconds=None)}
+
+    assert repo.resolve_approvals("approved", action="expiry_other") == [other]
+
+
+def test_stale_pending_approval_is_replaced_on_retry() -> None:
+    repo = Repository(settings.db_url)
+    first = ensure_approval(repo, "stale_test", {"n": 1}, None).approval_id
+    _age([first], settings.approval_ttl_seconds + 60)
+    second = ensure_approval(repo, "stale_test", {"n": 1}, None).approval_id
+    assert second != first
+    assert repo.get_approval(first)["status"] == "expired"
+
+
+def test_only_fresh_pending_approvals_can_be_resolved() -> None:
+    repo = Repository(settings.db_url)
+    denied = repo.create_approval("resolve_test", {"n": 1})
+    assert repo.resolve_approval(denied, "denied")["status"] == "denied"
+    assert repo.resolve_approval(denied, "approved") is None
+    assert repo.get_approval(denied)["status"] == "denied"
+
+    stale = repo.create_approval("resolve_test", {"n": 2})
+    _age([stale], settings.approval_ttl_seconds + 60)
+    # between sweeps the stale row is refused by the approval gate and expired on resolve
+    assert ensure_approval(repo, "resolve_test", {"n": 2}, stale).status == "approval_expired"
+    assert repo.resolve_approval(stale, "approved", ttl_seconds=settings.approval_ttl_seconds) is None
+    assert repo.get_approval(stale)["status"] == "expired"
+
+
+def test_bulk_resolve_expires_stale_matches() -> None:
+    repo = Repository(settings.db_url)
+    stale = repo.create_approval("bulk_stale_test", {"n": 1})
+    fresh = repo.create_approval("bulk_stale_test", {"n": 2})
+    _age([stale], settings.approval_ttl_seconds + 60)
+    ttl = settings.approval_ttl_seconds
+    assert repo.resolve_approvals("approved", approval_ids=[stale], ttl_seconds=ttl) == []
+    assert repo.get_approval(stale)["status"] == "expired"
+    assert ensure_approval(repo, "bulk_stale_test", {"n": 1}, stale).status == "approval_expired"
+    assert repo.resolve_approvals("approved", action="bulk_stale_test", ttl_seconds=ttl) == [fresh]
@@ -0,0 +1,64 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import asyncio
+from types import SimpleNamespace
+
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+
+init_db(settings.db_url)
+
+from aios_cofounder_mcp.resources import approval_resources
+from aios_cofounder_mcp.storage.repo import Repository
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.updated: list[str] = []
+
+    async def send_resource_updated(self, uri) -> None:
+        self.updated.append(str(uri))
+
+
+class _LowLevelServer:
+    def __init__(self, session: _Session) -> None:
+        self.handlers = {}
+        self.request_context = SimpleNamespace(session=session)
+
+    def subscribe_resource(self):
+        return lambda fn: self.handlers.setdefault("subscribe", fn)
+
+    def unsubscribe_resource(self):
+        return lambda fn: self.handlers.setdefault("unsubscribe", fn)
+
+
+def test_subscribers_are_notified_until_they_unsubscribe() -> None:
+    repo = Repository(settings.db_url)
+    session = _Session()
+    server = _LowLevelServer(session)
+    stop = approval_resources._register_subscriptions(SimpleNamespace(_mcp_server=server))
+    first = repo.create_approval("subscription_test", {"n": 1})
+    second = repo.create_approval("subscription_test", {"n": 2})
+
+    async def _scenario() -> None:
+        await server.handlers["subscribe"](f"approvals://{first}")
+        await server.handlers["subscribe"](f"approvals://{second}")
+        # resolutions are published from worker threads, as tools do
+        await asyncio.to_thread(repo.resolve_approval, first, "approved")
+        await asyncio.sleep(0.05)
+        await server.handlers["unsubscribe"](f"approvals://{second}")
+        await asyncio.to_thread(repo.resolve_approval, second, "denied")
+        await asyncio.sleep(0.05)
+
+    try:
+        asyncio.run(_scenario())
+    finally:
+        stop()
+    assert session.updated == [f"approvals://{first}"]
+
+
+def test_servers_without_subscription_hooks_are_skipped() -> None:
+    assert approval_resources._register_subscriptions(SimpleNamespace()) is None
+    assert approval_resources._register_subscriptions(SimpleNamespace(_mcp_server=object())) is None
@@ -0,0 +1,44 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import asyncio
+import threading
+
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import get_connection, init_db
+
+init_db(settings.db_url)
+
+from aios_cofounder_mcp.storage.repo import Repository
+from aios_cofounder_mcp.tools.approval_tools import approval_wait
+
+
+def test_wait_returns_on_resolution_and_times_out_while_pending() -> None:
+    repo = Repository(settings.db_url)
+    approval_id = repo.create_approval("wait_test", {"n": 1})
+
+    timed_out = asyncio.run(approval_wait(approval_id, timeout=0.05))
+    assert timed_out["error"] == "approval_wait_timeout"
+    assert timed_out["status"] == "pending"
+
+    threading.Timer(0.1, repo.resolve_approval, args=(approval_id, "approved")).start()
+    result = asyncio.run(approval_wait(approval_id, timeout=5))
+    assert result["ok"] is True
+    assert result["data"]["status"] == "approved"
+
+    assert asyncio.run(approval_wait(10**9, timeout=0))["error"] == "approval_not_found"
+
+
+def test_wait_on_a_stale_pending_approval_expires_it() -> None:
+    repo = Repository(settings.db_url)
+    approval_id = repo.create_approval("wait_stale_test", {"n": 1})
+    conn = get_connection(settings.db_url)
+    conn.execute(
+        "UPDATE approvals SET created_at = datetime('now', ?) WHERE id = ?",
+        (f"-{settings.approval_ttl_seconds + 60} seconds", approval_id),
+    )
+    conn.commit()
+    result = asyncio.run(approval_wait(approval_id, timeout=30))
+    assert result["ok"] is True and result["data"]["status"] == "expired"
+    assert repo.get_approval(approval_id)["status"] == "expired"
@@ -0,0 +1,34 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from aios_cofounder_mcp.approvals import ensure_approval
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+
+def test_retries_reuse_the_pending_approval_and_approval_is_bound_to_payload() -> None:
+    repo = Repository(settings.db_url)
+    payload = {"event_id": "evt-dedupe", "changes": {"summary": "Sync", "location": "Room 1"}}
+
+    first = ensure_approval(repo, "calendar_update_event", payload, None)
+    reordered = {"changes": {"location": "Room 1", "summary": "Sync"}, "event_id": "evt-dedupe"}
+    second = ensure_approval(repo, "calendar_update_event", reordered, None)
+    assert first.approval_id == second.approval_id
+    assert first.status == "approval_required"
+
+    repo.resolve_approval(first.approval_id, "approved")
+    assert ensure_approval(repo, "calendar_update_event", reordered, first.approval_id).ok
+
+    tampered = {**payload, "changes": {"summary": "Sync", "location": "Room 2"}}
+    mismatch = ensure_approval(repo, "calendar_update_event", tampered, first.approval_id)
+    assert not mismatch.ok and mismatch.status == "approval_payload_mismatch"
+    other_action = ensure_approval(repo, "calendar_cancel_event", payload, first.approval_id)
+    assert other_action.status == "approval_action_mismatch"
+
+    # once resolved, the same payload needs a fresh approval
+    third = ensure_approval(repo, "calendar_update_event", payload, None)
+    assert third.approval_id != first.approval_id
@@ -0,0 +1,36 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from datetime import datetime, timezone
+
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+
+def test_filters_keyset_pages_and_daily_rollup() -> None:
+    repo = Repository(settings.db_url)
+    before = repo.audit_stats()["totals"]
+    for n in range(5):
+        repo.add_audit("audit_test_send", {"n": n}, {"ok": True}, approval_id=900 + n % 2)
+    repo.add_audit("audit_test_other", {}, {})
+
+    first = repo.query_audit(action="audit_test_send", limit=2)
+    assert [item["approval_id"] for item in first["items"]] == [900, 901]
+    assert "payload" not in first["items"][0]
+    second = repo.query_audit(action="audit_test_send", limit=2, cursor=first["next_cursor"], include_details=True)
+    third = repo.query_audit(action="audit_test_send", limit=2, cursor=second["next_cursor"])
+    ids = [item["id"] for page in (first, second, third) for item in page["items"]]
+    assert len(ids) == 5 and ids == sorted(ids, reverse=True)
+    assert third["next_cursor"] is None
+    assert second["items"][0]["payload"]
+
+    assert len(repo.query_audit(approval_id=901)["items"]) == 2
+    assert repo.query_audit(action="audit_test_send", since="2999-01-01T00:00:00Z")["items"] == []
+
+    stats = repo.audit_stats(since_day=datetime.now(timezone.utc).date().isoformat())
+    assert stats["totals"]["audit_test_send"] - before.get("audit_test_send", 0) == 5
+    assert stats["totals"]["audit_test_other"] - before.get("audit_test_other", 0) == 1
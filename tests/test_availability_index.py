@@ -0,0 +1,89 @@
+from aios_cofounder_mcp.availability import AvailabilityIndex
+
+
+def test_find_free_matches_gaps_and_tracks_event_changes() -> None:
+    index = AvailabilityIndex(resolution_minutes=5)
+    index.load_busy(
+        "2025-03-03T00:00:00Z",
+        "2025-03-05T00:00:00Z",
+        [
+            {"start": "2025-03-03T09:00:00Z", "end": "2025-03-03T10:00:00Z"},
+            {"start": "2025-03-03T23:30:00Z", "end": "2025-03-04T00:30:00Z"},
+        ],
+    )
+    index.upsert_event(
+        {
+            "id": "evt1",
+            "start": {"dateTime": "2025-03-03T12:00:00Z"},
+            "end": {"dateTime": "2025-03-03T12:30:00Z"},
+        }
+    )
+
+    free = index.find_free("2025-03-03T08:00:00Z", "2025-03-04T02:00:00Z", 60)
+    assert free == [
+        {"start": "2025-03-03T08:00:00+00:00", "end": "2025-03-03T09:00:00+00:00"},
+        {"start": "2025-03-03T10:00:00+00:00", "end": "2025-03-03T12:00:00+00:00"},
+        {"start": "2025-03-03T12:30:00+00:00", "end": "2025-03-03T23:30:00+00:00"},
+        {"start": "2025-03-04T00:30:00+00:00", "end": "2025-03-04T02:00:00+00:00"},
+    ]
+
+    index.upsert_event(
+        {
+            "id": "evt1",
+            "start": {"dateTime": "2025-03-03T14:00:00Z"},
+            "end": {"dateTime": "2025-03-03T14:07:00Z"},
+        }
+    )
+    assert index.busy_blocks("2025-03-03T11:00:00Z", "2025-03-03T15:00:00Z") == [
+        {"start": "2025-03-03T14:00:00+00:00", "end": "2025-03-03T14:10:00+00:00"},
+    ]
+    index.remove_event("evt1")
+    assert index.busy_blocks("2025-03-03T11:00:00Z", "2025-03-03T15:00:00Z") == []
+
+
+def test_covers_respects_loaded_ranges() -> None:
+    index = AvailabilityIndex()
+    index.load_busy("2025-03-03T08:00:00Z", "2025-03-03T12:00:00Z", [])
+    index.load_events("2025-03-03T12:00:00Z", "2025-03-03T18:00:00Z", [])
+    assert index.covers("2025-03-03T09:00:00Z", "2025-03-03T17:00:00Z")
+    assert not index.covers("2025-03-03T07:00:00Z", "2025-03-03T09:00:00Z")
+    assert not index.covers("2025-03-03T09:00:00Z", "2025-03-03T17:00:00Z", max_age_seconds=-1)
+
+
+def test_changes_to_freebusy_windows_force_a_reload_and_reloads_clip_events() -> None:
+    index = AvailabilityIndex()
+    index.load_busy("2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z", [{"start": "2025-03-03T09:00:00Z", "end": "2025-03-03T10:00:00Z"}])
+    index.upsert_event({"id": "new", "start": {"dateTime": "2025-03-03T13:00:00Z"}, "end": {"dateTime": "2025-03-03T14:00:00Z"}}, created=True)
+    assert index.covers("2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z")
+    # the 09:00 block has no event id, so moving it can only be handled by refetching
+    index.upsert_event({"id": "moved", "start": {"dateTime": "2025-03-03T15:00:00Z"}, "end": {"dateTime": "2025-03-03T16:00:00Z"}})
+    assert not index.covers("2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z")
+
+    index = AvailabilityIndex()
+    event = {"id": "long", "start": {"dateTime": "2025-03-03T11:00:00Z"}, "end": {"dateTime": "2025-03-03T15:00:00Z"}}
+    index.load_events("2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z", [event])
+    index.load_busy("2025-03-03T13:00:00Z", "2025-03-03T18:00:00Z", [])
+    assert index.busy_blocks("2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z") == [
+        {"start": "2025-03-03T11:00:00+00:00", "end": "2025-03-03T13:00:00+00:00"},
+    ]
+    index.remove_event("long")
+    assert index.busy_blocks("2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z") == []
+
+
+def test_counters_survive_more_than_255_overlapping_bookings() -> None:
+    index = AvailabilityIndex()
+    block = ("2025-03-03T09:00:00Z", "2025-03-03T10:00:00Z")
+    for _ in range(300):
+        index.add_busy(*block)
+    for _ in range(299):
+        index.remove_busy(*block)
+    # one booking is left, so the hour is still busy
+    assert index.busy_blocks("2025-03-03T08:00:00Z", "2025-03-03T11:00:00Z") == [
+        {"start": "2025-03-03T09:00:00+00:00", "end": "2025-03-03T10:00:00+00:00"},
+    ]
+    index.remove_busy(*block)
+    assert index.find_free("2025-03-03T08:00:00Z", "2025-03-03T11:00:00Z", 60) == [
+        {"start": "2025-03-03T08:00:00+00:00", "end": "2025-03-03T11:00:00+00:00"},
+    ]
+    index.load_busy("2025-03-03T00:00:00Z", "2025-03-04T00:00:00Z", [{"start": block[0], "end": block[1]}])
+    assert len(index.busy_blocks("2025-03-03T00:00:00Z", "2025-03-04T00:00:00Z")) == 1
@@ -0,0 +1,54 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import asyncio
+import threading
+import time
+
+from aios_cofounder_mcp.tools import registry, tool
+from aios_cofounder_mcp.tools.batch_tools import batch_execute
+
+
+def test_reads_run_concurrently_and_results_keep_input_order() -> None:
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    order: list[str] = []
+
+    @tool("web", read_only=True)
+    def batch_test_read(value: int) -> dict:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {"ok": True, "data": {"value": value}, "error": None, "status": None, "approval_id": None}
+
+    @tool("approvals")
+    def batch_test_write(value: int) -> dict:
+        order.append(f"write{value}")
+        return {"ok": False, "data": None, "error": "approval_required", "status": "pending", "approval_id": 1}
+
+    try:
+        calls = [
+            {"tool": "batch_test_write", "args": {"value": 1}},
+            {"tool": "batch_test_read", "args": {"value": 2}},
+            {"tool": "batch_test_read", "args": {"value": 3}},
+            {"tool": "missing_tool", "args": {}},
+            {"tool": "batch_test_read", "args": {"bogus": 1}},
+            {"tool": "batch_test_read", "args": {"value": 4}},
+        ]
+        result = asyncio.run(batch_execute(calls))
+    finally:
+        registry.pop("batch_test_read", None)
+        registry.pop("batch_test_write", None)
+
+    items = result["data"]["results"]
+    assert [item["index"] for item in items] == list(range(6))
+    assert items[0]["status"] == "pending" and items[0]["error"] == "approval_required"
+    assert [items[i]["data"]["value"] for i in (1, 2, 5)] == [2, 3, 4]
+    assert items[3]["error"] == "unknown_tool"
+    assert items[4]["error"] == "invalid_arguments"
+    assert active["peak"] == 3
+    assert order == ["write1"]
@@ -0,0 +1,127 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import random
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from aios_cofounder_mcp.settings import settings
+
+from aios_cofounder_mcp.availability import AvailabilityIndex
+from aios_cofounder_mcp.google import calendar
+from aios_cofounder_mcp.google.calendar import (
+    _fetched_availability,
+    _indexed_availability,
+    _merge_busy,
+    _rank_candidate_slots,
+    _rank_slots,
+    _working_windows,
+)
+
+
+def _dt(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def test_merge_busy_sweeps_overlapping_participants() -> None:
+    alice = [{"start": "2025-03-03T09:00:00Z", "end": "2025-03-03T10:00:00Z"}]
+    bob = [
+        {"start": "2025-03-03T09:30:00Z", "end": "2025-03-03T11:00:00Z"},
+        {"start": "2025-03-03T11:00:00Z", "end": "2025-03-03T11:30:00Z"},
+        {"start": "2025-03-03T13:00:00Z", "end": "2025-03-03T14:00:00Z"},
+    ]
+    merged = _merge_busy([alice, bob])
+    assert merged == [
+        (_dt("2025-03-03T09:00:00+00:00"), _dt("2025-03-03T11:30:00+00:00")),
+        (_dt("2025-03-03T13:00:00+00:00"), _dt("2025-03-03T14:00:00+00:00")),
+    ]
+
+
+def test_candidate_slots_respect_working_hours_and_buffer() -> None:
+    tz = ZoneInfo("America/New_York")
+    busy = [(_dt("2025-03-03T10:00:00-05:00"), _dt("2025-03-03T11:00:00-05:00"))]
+    slots = _rank_candidate_slots(
+        busy,
+        _dt("2025-03-03T00:00:00-05:00"),
+        _dt("2025-03-04T00:00:00-05:00"),
+        duration=timedelta(minutes=30),
+        tz=tz,
+        working_hours=(time(9), time(12)),
+        buffer=timedelta(minutes=15),
+        limit=20,
+    )
+    starts = sorted(slot["start"] for slot in slots)
+    assert starts == [
+        "2025-03-03T09:00:00-05:00",
+        "2025-03-03T09:15:00-05:00",
+        "2025-03-03T11:15:00-05:00",
+        "2025-03-03T11:30:00-05:00",
+    ]
+    assert all(
+        _dt(slot["end"]) - _dt(slot["start"]) == timedelta(minutes=30) for slot in slots
+    )
+    assert [slot["rank"] for slot in slots] == [1, 2, 3, 4]
+
+
+def test_candidate_slots_prefer_room_around_meetings() -> None:
+    busy = [(_dt("2025-03-03T10:00:00+00:00"), _dt("2025-03-03T11:00:00+00:00"))]
+    slots = _rank_candidate_slots(
+        busy,
+        _dt("2025-03-03T08:00:00+00:00"),
+        _dt("2025-03-03T12:00:00+00:00"),
+        duration=timedelta(minutes=60),
+        tz=timezone.utc,
+        limit=1,
+    )
+    assert slots[0]["start"] == "2025-03-03T08:00:00+00:00"
+    assert slots[0]["slack_minutes"] == 60
+
+
+def test_bitmap_and_freebusy_paths_rank_the_same_slots() -> None:
+    rng = random.Random(3)
+    tz = ZoneInfo("Europe/Berlin")
+    start, end = _dt("2025-03-03T00:00:00+01:00"), _dt("2025-03-10T00:00:00+01:00")
+    busy = []
+    for _ in range(40):
+        block_start = start + timedelta(minutes=5 * rng.randrange(0, 7 * 288))
+        block_end = block_start + timedelta(minutes=rng.choice([15, 30, 60, 120]))
+        busy.append({"start": block_start.isoformat(), "end": block_end.isoformat()})
+    index = AvailabilityIndex()
+    index.load_busy(start, end, busy)
+    windows = _working_windows(start, end, tz, (time(9), time(17, 30)), include_weekends=False)
+
+    for buffer in (timedelta(0), timedelta(minutes=10)):
+        fetched = _fetched_availability([busy], start.isoformat(), end.isoformat(), 45, buffer)
+        indexed = _indexed_availability(index, start, end, 45, buffer)
+        assert _merge_busy([indexed[0]]) == _merge_busy([fetched[0]])
+        assert [(_dt(gap["start"]), _dt(gap["end"])) for gap in indexed[1]] == [
+            (_dt(gap["start"]), _dt(gap["end"])) for gap in fetched[1]
+        ]
+        ranked = [
+            _rank_slots(gaps, windows, duration=timedelta(minutes=45), tz=tz, limit=500)
+            for gaps in (fetched[2], indexed[2])
+        ]
+        assert ranked[0] == ranked[1] and ranked[0]
+
+
+def test_covered_primary_window_is_answered_without_freebusy(monkeypatch) -> None:
+    index = AvailabilityIndex()
+    index.load_busy(
+        "2025-03-03T08:00:00Z", "2025-03-03T18:00:00Z", [{"start": "2025-03-03T10:00:00Z", "end": "2025-03-03T11:00:00Z"}]
+    )
+    monkeypatch.setattr(calendar, "primary_availability", index)
+
+    def _no_service(settings, repo):
+        raise AssertionError("freebusy should not be queried")
+
+    monkeypatch.setattr(calendar, "_get_service", _no_service)
+    result = calendar.find_free_slots(
+        settings, None, 60, "2025-03-03T09:00:00Z", "2025-03-03T12:00:00Z", max_slots=3
+    )
+    assert result["busy"] == [{"start": "2025-03-03T10:00:00+00:00", "end": "2025-03-03T11:00:00+00:00"}]
+    assert result["free"] == [
+        {"start": "2025-03-03T09:00:00+00:00", "end": "2025-03-03T10:00:00+00:00"},
+        {"start": "2025-03-03T11:00:00+00:00", "end": "2025-03-03T12:00:00+00:00"},
+    ]
+    assert [slot["start"] for slot in result["slots"]] == ["2025-03-03T09:00:00+00:00", "2025-03-03T11:00:00+00:00"]
@@ -0,0 +1,41 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from aios_cofounder_mcp import search_index
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+
+def test_hits_are_typed_ranked_and_kept_current() -> None:
+    repo = Repository(settings.db_url)
+    repo.upsert_contact("Quinn Zephyr", "quinn@zephyr.example", "Zephyrworks", None)
+    repo.add_note("gmail:zq-1", "Zephyrworks wants the renewal quote by Friday")
+    search_index.index_messages(
+        repo,
+        [{"id": "zq-1", "thread_id": "t-zq", "headers": {"Subject": "Zephyrworks renewal quote", "From": "quinn@zephyr.example"}, "snippet": "quote"}],
+    )
+    search_index.index_events(
+        repo,
+        "primary",
+        [{"id": "zev-1", "summary": "Zephyrworks renewal call", "description": "pricing", "start": {"dateTime": "2026-03-02T10:00:00Z"}}],
+    )
+
+    hits = search_index.search(repo, "zephyrworks renewal")
+    assert {hit["kind"] for hit in hits} == {"message", "event", "contact", "note"}
+    # both terms in the title outrank a single body match
+    assert hits[0]["kind"] in {"message", "event"} and hits[-1]["kind"] == "contact"
+    assert search_index.search(repo, "renewals", kinds=["event"])[0]["ref"] == "primary:zev-1"
+
+    # a later metadata sighting does not replace the full body fetched earlier
+    search_index.index_messages(repo, [{"id": "zq-1", "subject": "Zephyrworks renewal quote", "text": "Full body with the word turbine"}])
+    search_index.index_messages(repo, [{"id": "zq-1", "headers": {"Subject": "Zephyrworks renewal quote"}, "snippet": "quote"}])
+    assert search_index.search(repo, "turbine")[0]["ref"] == "zq-1"
+
+    search_index.forget_events(repo, "primary", ["zev-1"])
+    repo.upsert_contact("Quinn Zephyr", "quinn@zephyr.example", "Acme", None)
+    kinds = {hit["kind"] for hit in search_index.search(repo, "zephyrworks")}
+    assert kinds == {"message", "note"}
@@ -0,0 +1,79 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import asyncio
+import threading
+import time
+
+from aios_cofounder_mcp.dispatch import Dispatcher, check_cancelled
+
+
+def test_group_limit_bounds_concurrency_but_not_other_groups() -> None:
+    dispatcher = Dispatcher(max_workers=8, group_limits={"gmail": 2})
+    active = {"gmail": 0, "web": 0}
+    peak = {"gmail": 0, "web": 0}
+    lock = threading.Lock()
+
+    def work(group: str) -> str:
+        with lock:
+            active[group] += 1
+            peak[group] = max(peak[group], active[group])
+        time.sleep(0.05)
+        with lock:
+            active[group] -= 1
+        return group
+
+    async def main() -> list[str]:
+        calls = [dispatcher.run("gmail", work, "gmail") for _ in range(6)]
+        calls += [dispatcher.run("web", work, "web") for _ in range(4)]
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(main())
+    assert results.count("gmail") == 6
+    assert peak == {"gmail": 2, "web": 4}
+    assert dispatcher.stats()["gmail"]["completed"] == 6
+    assert dispatcher.stats()["gmail"]["max_waiting"] >= 4
+    dispatcher.shutdown()
+
+
+def test_cancelled_call_signals_worker_thread() -> None:
+    dispatcher = Dispatcher(max_workers=2, group_limits={})
+    stopped = threading.Event()
+
+    def work() -> None:
+        for _ in range(200):
+            try:
+                check_cancelled()
+            except RuntimeError:
+                stopped.set()
+                return
+            time.sleep(0.01)
+
+    async def main() -> None:
+        task = asyncio.create_task(dispatcher.run("gmail", work))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
+    assert stopped.wait(1)
+    dispatcher.shutdown()
+
+
+def test_groups_work_across_event_loops_and_only_blocked_calls_wait() -> None:
+    dispatcher = Dispatcher(max_workers=4, group_limits={"gmail": 2})
+
+    async def main(calls: int) -> None:
+        await asyncio.gather(*(dispatcher.run("gmail", time.sleep, 0.02) for _ in range(calls)))
+
+    asyncio.run(main(2))
+    assert dispatcher.stats()["gmail"]["max_waiting"] == 0
+    # a second loop (e.g. another asyncio.run) reuses the same group
+    asyncio.run(main(5))
+    stats = dispatcher.stats()["gmail"]
+    assert (stats["completed"], stats["running"], stats["waiting"], stats["max_waiting"]) == (7, 0, 0, 3)
+    dispatcher.shutdown()
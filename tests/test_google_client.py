@@ -0,0 +1,23 @@
+import threading
+import time
+
+from aios_cofounder_mcp.google import client
+
+
+def test_fan_out_reuses_long_lived_workers_in_order() -> None:
+    seen: set[threading.Thread] = set()
+
+    def _work(item: int) -> int:
+        seen.add(threading.current_thread())
+        time.sleep(0.01)
+        return item * 2
+
+    for _ in range(5):
+        assert client.map_concurrently(_work, range(8), max_workers=4) == [item * 2 for item in range(8)]
+    # the same pool threads (and their cached services) serve every call
+    assert len(seen) <= client._fetch_pool()._max_workers
+    assert threading.current_thread() not in seen
+
+    # a fan-out started from a pool worker runs inline instead of waiting on the pool
+    nested = client.map_concurrently(lambda item: client.map_concurrently(_work, [item, item], 2), [1, 2], 2)
+    assert nested == [[2, 2], [4, 4]]
@@ -0,0 +1,57 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aios_cofounder_mcp.web.http import HttpClients
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports: set[int] = set()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.ports.add(self.client_address[1])
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+        body = b"<html><title>ok</title></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_connections_are_reused_and_capped_per_host() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    clients = HttpClients("test-agent", 5, max_connections=10, max_keepalive=10, keepalive_expiry=30, per_host=2, http2=True)
+    try:
+        for _ in range(3):
+            assert clients.get(url).status_code == 200
+        assert len(_Handler.ports) == 1
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            assert all(response.status_code == 200 for response in pool.map(clients.get, [url] * 6))
+        assert _Handler.peak == 2
+        assert len(_Handler.ports) == 2
+    finally:
+        clients.close()
+        server.shutdown()
+        server.server_close()
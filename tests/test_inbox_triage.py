@@ -0,0 +1,80 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import time
+
+from aios_cofounder_mcp.assistant import triage
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+_NOW_MS = int(time.time() * 1000)
+MESSAGES = {
+    "m1": ("Deals <deals@shop.example>", "50% off today", ["CATEGORY_PROMOTIONS", "UNREAD"], 1, "<mailto:x>"),
+    "m2": ("Dana <Dana@Client.example>", "Contract needs your signature", ["IMPORTANT", "UNREAD"], 2, None),
+    "m3": ("Stranger <someone@else.example>", "Hello", [], 72, None),
+    "m4": ("Dana <dana@client.example>", "Re: contract", ["UNREAD"], 5, None),
+    "m5": ("Bot <no-reply@service.example>", "Your weekly report", [], 3, None),
+}
+
+
+def _fake_gmail(monkeypatch, requested_pages: list) -> None:
+    ids = list(MESSAGES)
+
+    def _pages(settings, repo, query, page_size, page_token=None):
+        start = int(page_token or 0)
+        while True:
+            requested_pages.append(start)
+            chunk = ids[start : start + page_size]
+            start += page_size
+            token = str(start) if start < len(ids) else None
+            yield chunk, token
+            if token is None:
+                return
+
+    def _metadata(settings, repo, message_ids, headers):
+        return [
+            {
+                "id": message_id,
+                "thread_id": f"t-{message_id}",
+                "label_ids": MESSAGES[message_id][2],
+                "internal_date": str(_NOW_MS - MESSAGES[message_id][3] * 3600 * 1000),
+                "snippet": "",
+                "headers": {
+                    "From": MESSAGES[message_id][0],
+                    "Subject": MESSAGES[message_id][1],
+                    "Date": None,
+                    "List-Unsubscribe": MESSAGES[message_id][4],
+                },
+            }
+            for message_id in message_ids
+        ]
+
+    monkeypatch.setattr(triage.gmail_client, "message_id_pages", _pages)
+    monkeypatch.setattr(triage.gmail_client, "get_metadata", _metadata)
+
+
+def test_known_contacts_and_signals_rank_first(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    repo.upsert_contact("Dana", "dana@client.example", "Client", None)
+    requested: list = []
+    _fake_gmail(monkeypatch, requested)
+
+    result = triage.triage(settings, repo, "in:inbox", limit=3, scan=5)
+    assert [item["id"] for item in result["items"]] == ["m2", "m4", "m3"]
+    assert "known_sender" in result["items"][0]["reasons"] and result["items"][0]["labels"] == ["IMPORTANT", "UNREAD"]
+    assert result["scanned"] == 5 and result["next_cursor"] is None
+
+
+def test_scan_window_stops_paging_and_returns_a_cursor(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    requested: list = []
+    _fake_gmail(monkeypatch, requested)
+
+    first = triage.triage(settings, repo, "in:inbox", limit=10, scan=2)
+    assert first["scanned"] == 2 and requested == [0]
+    second = triage.triage(settings, repo, "in:inbox", limit=10, scan=2, cursor=first["next_cursor"])
+    assert {item["id"] for item in second["items"]} == {"m3", "m4"}
@@ -0,0 +1,18 @@
+import logging
+
+from aios_cofounder_mcp import logging_conf
+
+
+def test_reconfiguring_replaces_the_queue_listener():
+    logging_conf.configure_logging("INFO", use_queue=True)
+    first = logging_conf._listener
+    logging_conf.configure_logging("INFO", use_queue=True)
+    second = logging_conf._listener
+    assert first is not second
+    assert first._thread is None
+    assert second._thread is not None
+
+    logging_conf.configure_logging("INFO")
+    assert logging_conf._listener is None
+    assert second._thread is None
+    assert isinstance(logging.getLogger().handlers[0], logging.StreamHandler)
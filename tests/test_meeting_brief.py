@@ -0,0 +1,30 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from aios_cofounder_mcp.assistant import precompute, service
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+
+def test_brief_is_reused_until_the_event_changes(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    event = {"id": "brief-evt", "updated": "2026-01-05T09:00:00.000Z", "summary": "Sync", "attendees": [{"email": "a@x.com"}]}
+    searches: list[str] = []
+
+    monkeypatch.setattr(service.calendar_client, "get_event", lambda settings, repo, event_id: dict(event))
+    monkeypatch.setattr(service.gmail_client, "search", lambda settings, repo, query, limit: searches.append(query) or [])
+    monkeypatch.setattr(precompute.calendar_client, "list_events", lambda settings, repo, start, end: [dict(event)])
+
+    assert precompute.precompute_meeting_briefs(settings, repo, hours=4) == 1
+    brief = service.meeting_brief(settings, repo, "brief-evt")
+    assert brief["purpose"] == "Sync" and brief["attendees"] == ["a@x.com"]
+    assert len(searches) == 1
+
+    event["updated"] = "2026-01-05T10:00:00.000Z"
+    event["summary"] = "Sync (moved)"
+    assert service.meeting_brief(settings, repo, "brief-evt")["purpose"] == "Sync (moved)"
+    assert len(searches) == 2
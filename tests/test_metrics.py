@@ -0,0 +1,59 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from aios_cofounder_mcp.metrics import Metrics, metrics
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+
+def test_histogram_quantiles_and_prometheus_output() -> None:
+    registry = Metrics()
+    for _ in range(90):
+        registry.observe("tool", "gmail_search", 0.02, bytes_out=100)
+    for _ in range(10):
+        registry.observe("tool", "gmail_search", 2.0, error=True)
+
+    stats = registry.snapshot()["tool"]["gmail_search"]
+    assert stats["count"] == 100
+    assert stats["errors"] == 10
+    assert stats["bytes_out"] == 9000
+    assert 10 <= stats["p50_ms"] <= 25
+    assert 1000 <= stats["p99_ms"] <= 2500
+
+    text = registry.prometheus()
+    assert 'aios_calls_total{kind="tool",name="gmail_search"} 100' in text
+    assert 'aios_latency_seconds_bucket{kind="tool",name="gmail_search",le="+Inf"} 100' in text
+
+
+def test_repository_methods_are_timed() -> None:
+    before = metrics.snapshot().get("repository", {}).get("list_notes", {}).get("count", 0)
+    Repository("sqlite:///:memory:").list_notes()
+    assert metrics.snapshot()["repository"]["list_notes"]["count"] == before + 1
+
+
+def test_only_budgeted_tool_results_are_serialized_for_metrics(monkeypatch) -> None:
+    from aios_cofounder_mcp import tools
+
+    dumped = []
+    real_dumps = tools.json.dumps
+    monkeypatch.setattr(tools.json, "dumps", lambda value, **kwargs: dumped.append(value) or real_dumps(value, **kwargs))
+
+    def metrics_probe_unbudgeted(text: str) -> dict:
+        return tools.response_ok({"echo": text})
+
+    def metrics_probe_budgeted(text: str) -> dict:
+        return tools.response_ok({"echo": text})
+
+    tools._instrumented(metrics_probe_unbudgeted, budgeted=False)(text="abc")
+    tools._instrumented(metrics_probe_budgeted, budgeted=True)(text="abc")
+    # the data is serialized once; the budget measures the envelope around it without the data
+    assert [value for value in dumped if "ok" not in value] == [{"echo": "abc"}]
+    assert all(value["data"] is None for value in dumped if "ok" in value)
+    snapshot = metrics.snapshot()["tool"]
+    assert snapshot["metrics_probe_unbudgeted"]["bytes_out"] == 0
+    assert snapshot["metrics_probe_budgeted"]["bytes_out"] == len('{"echo":"abc"}')
+    assert snapshot["metrics_probe_budgeted"]["bytes_in"] == 3
@@ -0,0 +1,46 @@
+import json
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from aios_cofounder_mcp.output_budget import MIN_CHUNK_BYTES, OutputBudget
+from aios_cofounder_mcp.tools import response_ok
+
+
+def _wire_size(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def test_first_page_is_truncated_json_and_chunks_reassemble_the_full_result() -> None:
+    budget = OutputBudget(default_bytes=2048, per_tool={"small_tool": 0, "tiny_tool": 3})
+    data = {"messages": [{"id": str(i), "body": 'héllo "wörld" ' * 40} for i in range(50)]}
+
+    first = budget.apply("gmail_get_thread", response_ok(data))
+    page = first["data"]
+    assert first["ok"] is True and page["truncated"] is True
+    # the budget covers the whole response, envelope included
+    assert _wire_size(first) <= 2048
+    # usable without any continuation: a prefix of the messages with shortened bodies
+    assert 0 < len(page["result"]["messages"]) <= page["max_items"] < 50
+    assert data["messages"][0]["body"].startswith(page["result"]["messages"][0]["body"].rstrip("…"))
+    assert budget.apply("gmail_get_thread", response_ok(data))["data"]["result"] == page["result"]
+
+    parts, offset = [], page["next_offset"]
+    while offset is not None:
+        chunk = budget.continue_from(page["continuation"], offset)
+        # quotes escaped inside partial_json still count against the budget
+        assert _wire_size(response_ok(chunk)) <= 2048
+        parts.append(chunk["partial_json"])
+        offset = chunk["next_offset"]
+    assert json.loads("".join(parts)) == data
+    # a retried final chunk (say, after a transport error) is served again
+    assert budget.continue_from(page["continuation"], chunk["offset"]) == chunk
+    assert budget.continue_from("unknown", 0) is None
+
+    # a zero budget disables truncation for that tool
+    assert budget.apply("small_tool", response_ok(data))["data"] == data
+    # a budget below the minimum chunk still advances
+    tiny = budget.apply("tiny_tool", response_ok(data))["data"]
+    assert tiny["result"] is None
+    chunk = budget.continue_from(tiny["continuation"], 0)
+    assert chunk["next_offset"] > 0 and _wire_size(response_ok(chunk)) <= MIN_CHUNK_BYTES
@@ -0,0 +1,156 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import pytest
+
+from aios_cofounder_mcp.google.recurrence import expand_events, is_supported
+
+STANDUP = {
+    "id": "standup",
+    "summary": "Daily standup",
+    "attendees": [{"email": "team@example.com"}],
+    "start": {"dateTime": "2025-03-03T09:00:00-05:00", "timeZone": "America/New_York"},
+    "end": {"dateTime": "2025-03-03T09:15:00-05:00", "timeZone": "America/New_York"},
+    "recurrence": [
+        "RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+        "EXDATE;TZID=America/New_York:20250305T090000",
+    ],
+}
+
+
+def test_weekly_expansion_applies_exdate_overrides_and_dst() -> None:
+    moved = {
+        "id": "standup_20250304T140000Z",
+        "recurringEventId": "standup",
+        "originalStartTime": {"dateTime": "2025-03-04T09:00:00-05:00", "timeZone": "America/New_York"},
+        "start": {"dateTime": "2025-03-04T10:00:00-05:00"},
+        "end": {"dateTime": "2025-03-04T10:15:00-05:00"},
+        "summary": "Standup (moved)",
+    }
+    lunch = {
+        "id": "lunch",
+        "start": {"dateTime": "2025-03-06T12:00:00-05:00"},
+        "end": {"dateTime": "2025-03-06T13:00:00-05:00"},
+    }
+    events = list(expand_events([STANDUP, moved, lunch], "2025-03-03T00:00:00Z", "2025-03-11T00:00:00Z"))
+
+    assert [event["id"] for event in events] == [
+        "standup_20250303T140000Z",
+        "standup_20250304T140000Z",
+        "standup_20250306T140000Z",
+        "lunch",
+        "standup_20250307T140000Z",
+        "standup_20250310T130000Z",
+    ]
+    assert events[1]["summary"] == "Standup (moved)"
+    # the US switches to daylight time on 2025-03-09; wall-clock time is kept
+    assert events[-1]["start"]["dateTime"] == "2025-03-10T09:00:00-04:00"
+    # instances are views over the master rather than copies
+    assert events[0]["attendees"] is STANDUP["attendees"]
+
+
+def test_monthly_ordinal_byday_with_count_and_all_day() -> None:
+    board = {
+        "id": "board",
+        "start": {"date": "2025-01-14"},
+        "end": {"date": "2025-01-15"},
+        "recurrence": ["RRULE:FREQ=MONTHLY;BYDAY=2TU;COUNT=3"],
+    }
+    events = list(expand_events([board], "2025-01-01T00:00:00Z", "2025-12-31T00:00:00Z"))
+    assert [event["start"]["date"] for event in events] == ["2025-01-14", "2025-02-11", "2025-03-11"]
+
+
+def test_unsupported_rules_are_flagged() -> None:
+    assert is_supported(STANDUP)
+    assert not is_supported({"recurrence": ["RRULE:FREQ=HOURLY;INTERVAL=2"]})
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=WEEKLY;BYMONTH=6",
+        "FREQ=DAILY;BYMONTHDAY=1",
+        "FREQ=WEEKLY;BYSETPOS=1;BYDAY=MO,TU",
+        "FREQ=WEEKLY;INTERVAL=2;WKST=SU;BYDAY=MO",
+        "FREQ=WEEKLY;BYDAY=1MO",
+        "FREQ=MONTHLY;BYMONTH=6",
+        "FREQ=MONTHLY;BYDAY=FR;BYMONTHDAY=13",
+        "FREQ=YEARLY;BYDAY=20MO",
+        "FREQ=YEARLY;BYMONTHDAY=1",
+        "FREQ=YEARLY;BYMONTH=3,9;BYDAY=MO;BYSETPOS=-1",
+    ],
+)
+def test_rules_the_expander_does_not_implement_are_rejected(rule: str) -> None:
+    assert not is_supported({"recurrence": [f"RRULE:{rule}"]})
+
+
+@pytest.mark.parametrize(
+    "rule",
+    ["FREQ=WEEKLY;WKST=SU;BYDAY=MO,WE", "FREQ=YEARLY;BYMONTH=11;BYDAY=4TH", "FREQ=YEARLY;BYMONTH=3;BYDAY=SU;BYSETPOS=-1"],
+)
+def test_supported_combinations(rule: str) -> None:
+    assert is_supported({"recurrence": [f"RRULE:{rule}"]})
+
+
+def test_unsupported_series_fall_back_to_instances(monkeypatch) -> None:
+    from aios_cofounder_mcp.google import calendar
+
+    master = {
+        "id": "june",
+        "start": {"dateTime": "2026-01-05T09:00:00Z"},
+        "end": {"dateTime": "2026-01-05T09:30:00Z"},
+        "recurrence": ["RRULE:FREQ=WEEKLY;BYMONTH=6"],
+    }
+    instance = {
+        "id": "june_20260601",
+        "recurringEventId": "june",
+        "start": {"dateTime": "2026-06-01T09:00:00Z"},
+        "end": {"dateTime": "2026-06-01T09:30:00Z"},
+    }
+    instances_calls = []
+
+    class _Events:
+        def list(self, **params):
+            return type("Request", (), {"execute": lambda request: {"items": [master]}})()
+
+        def instances(self, **params):
+            instances_calls.append(params["eventId"])
+            return type("Request", (), {"execute": lambda request: {"items": [instance]}})()
+
+    service = type("Service", (), {"events": lambda service: _Events()})()
+    monkeypatch.setattr(calendar, "_get_service", lambda settings, repo: service)
+    events = list(calendar.iter_events(None, None, "2026-01-01T00:00:00Z", "2026-07-01T00:00:00Z"))
+    assert instances_calls == ["june"]
+    assert [event["start"]["dateTime"] for event in events] == ["2026-06-01T09:00:00Z"]
+
+
+def test_exception_moved_out_of_the_window_suppresses_its_slot(monkeypatch) -> None:
+    from aios_cofounder_mcp.google import calendar
+
+    master = {**STANDUP, "iCalUID": "standup@example.com"}
+    # Wednesday's standup moved to the following week; the windowed listing does not include it
+    moved_out = {
+        "id": "standup_20250306T140000Z",
+        "recurringEventId": "standup",
+        "originalStartTime": {"dateTime": "2025-03-06T09:00:00-05:00", "timeZone": "America/New_York"},
+        "start": {"dateTime": "2025-03-12T09:00:00-04:00"},
+        "end": {"dateTime": "2025-03-12T09:15:00-04:00"},
+    }
+    listed: list[dict] = []
+
+    class _Events:
+        def list(self, **params):
+            listed.append(params)
+            items = [master, moved_out] if "iCalUID" in params else [master]
+            return type("Request", (), {"execute": lambda request: {"items": items}})()
+
+    service = type("Service", (), {"events": lambda service: _Events()})()
+    monkeypatch.setattr(calendar, "_get_service", lambda settings, repo: service)
+    events = list(calendar.iter_events(None, None, "2025-03-03T00:00:00Z", "2025-03-08T00:00:00Z"))
+    assert [event["id"] for event in events] == [
+        "standup_20250303T140000Z",
+        "standup_20250304T140000Z",
+        "standup_20250307T140000Z",
+    ]
+    assert "timeMin" not in listed[1] and listed[1]["iCalUID"] == "standup@example.com"
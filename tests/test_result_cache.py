@@ -0,0 +1,90 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import time
+
+from aios_cofounder_mcp.cache import ResultCache
+
+
+def _ok(data):
+    return {"ok": True, "data": data, "error": None, "status": None, "approval_id": None}
+
+
+def test_hits_lru_bound_and_invalidation_by_tag_and_span() -> None:
+    cache = ResultCache(max_entries=2, stale_seconds=0)
+    calls: list[tuple[str, str]] = []
+
+    @cache.cached(
+        "list_events",
+        ttl=60,
+        tags=lambda arguments, result: {f"event:{event}" for event in result["data"]},
+        span=lambda arguments: (arguments["start"], arguments["end"]),
+    )
+    def list_events(start: str, end: str) -> dict:
+        calls.append((start, end))
+        return _ok(["evt1"] if start.startswith("2026-01-05") else [])
+
+    monday = ("2026-01-05T00:00:00Z", "2026-01-06T00:00:00Z")
+    tuesday = ("2026-01-06T00:00:00Z", "2026-01-07T00:00:00Z")
+    list_events(*monday)
+    list_events(start=monday[0], end=monday[1])
+    assert len(calls) == 1
+
+    list_events(*tuesday)
+    cache.invalidate(tags={"event:evt1"})
+    list_events(*monday)
+    list_events(*tuesday)
+    assert len(calls) == 3
+
+    # an event moved into Tuesday evicts the overlapping listing only
+    cache.invalidate(start="2026-01-06T10:00:00Z", end="2026-01-06T11:00:00Z")
+    list_events(*monday)
+    list_events(*tuesday)
+    assert len(calls) == 4
+
+    list_events("2026-01-07T00:00:00Z", "2026-01-08T00:00:00Z")
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_stale_while_revalidate_and_errors_are_not_cached() -> None:
+    cache = ResultCache(max_entries=10, stale_seconds=60)
+    values = iter(range(100))
+
+    @cache.cached("counter", ttl=1)
+    def counter() -> dict:
+        return _ok(next(values))
+
+    @cache.cached("failing", ttl=60)
+    def failing() -> dict:
+        return {"error": f"boom{next(values)}"}
+
+    assert counter()["data"] == 0
+    cache.ttls["counter"] = 0
+    assert counter()["data"] == 1  # ttl 0 bypasses the cache
+    cache.ttls.pop("counter")
+    time.sleep(1.05)
+    assert counter()["data"] == 0  # stale value served while refreshing
+    deadline = time.monotonic() + 2
+    while counter()["data"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert counter()["data"] == 2
+
+    assert failing() != failing()
+
+
+def test_callers_cannot_mutate_cached_results() -> None:
+    cache = ResultCache(max_entries=4, stale_seconds=0)
+
+    @cache.cached("get_event", ttl=60)
+    def get_event(event_id: str) -> dict:
+        return _ok({"id": event_id, "attendees": ["a@example.com"]})
+
+    first = get_event("evt1")
+    first["data"]["calendarId"] = "primary"
+    first["data"]["attendees"].append("b@example.com")
+    second = get_event("evt1")
+    second["data"]["attendees"].clear()
+    assert get_event("evt1")["data"] == {"id": "evt1", "attendees": ["a@example.com"]}
+    assert cache.stats()["hits"] == 2
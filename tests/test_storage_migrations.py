@@ -23,3 +23,25 @@ def test_migrations_create_tables() -> None:
         "assistant_notes",
     }
     assert expected.issubset(tables)
+
+
+def test_migrations_add_columns_to_existing_tables() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = f"{tmpdir}/legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE approvals (id INTEGER PRIMARY KEY AUTOINCREMENT, action TEXT NOT NULL, "
+            "payload TEXT NOT NULL, status TEXT NOT NULL, created_at TEXT DEFAULT CURRENT_TIMESTAMP, resolved_at TEXT)"
+        )
+        conn.execute("INSERT INTO approvals (action, payload, status) VALUES ('a', '{}', 'pending')")
+        conn.commit()
+        conn.close()
+
+        init_db(f"sqlite:///{db_path}")
+        conn = sqlite3.connect(db_path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(approvals)").fetchall()}
+        rows = conn.execute("SELECT COUNT(*) FROM approvals").fetchone()[0]
+        conn.close()
+
+    assert "payload_hash" in columns
+    assert rows == 1
@@ -0,0 +1,145 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import base64
+from dataclasses import replace
+from email.message import EmailMessage
+
+import pytest
+
+from aios_cofounder_mcp.assistant import service, summarizer
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+BODY = """Hi team,
+
+The launch review moved to Thursday. Please send the launch checklist before the launch review.
+The venue has parking. Marketing will share the launch deck with the checklist on Wednesday.
+
+Thanks,
+Priya
+Head of Product
+
+On Mon, Jan 5, 2026 at 9:00 AM Sam <sam@example.com> wrote:
+> Can we move the review?
+"""
+
+
+def test_summary_skips_quotes_and_signature() -> None:
+    summary = summarizer.summarize(BODY, max_sentences=2)
+    assert "launch review moved" in summary
+    assert "Priya" not in summary and "move the review" not in summary
+
+
+def test_sentences_keep_closing_quotes_and_brackets() -> None:
+    text = 'He said "done." Then we left (really!) Next, the board said "(fine.)" Done.'
+    assert summarizer.split_sentences(text) == [
+        'He said "done."',
+        "Then we left (really!)",
+        'Next, the board said "(fine.)"',
+        "Done.",
+    ]
+
+
+def test_vectorized_and_pure_python_ranking_agree() -> None:
+    pytest.importorskip("numpy")
+    sentences = summarizer.split_sentences(summarizer.clean_body(BODY))
+    counts = [summarizer.Counter(summarizer._tokens(sentence)) for sentence in sentences]
+    vectorized = summarizer._rank_numpy(counts)
+    fallback = summarizer._rank_python(counts)
+    assert all(abs(a - b) < 1e-6 for a, b in zip(vectorized, fallback))
+
+
+def test_repeat_summaries_reuse_the_stored_note(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    fetched: list[str] = []
+
+    def _get_message(settings, repo, message_id):
+        fetched.append(message_id)
+        return {"id": message_id, "text": BODY, "snippet": ""}
+
+    monkeypatch.setattr(service.gmail_client, "get_message", _get_message)
+    first = service.summarize_email(settings, repo, "memo-1")
+    notes = len(repo.list_notes(limit=1000))
+    assert service.summarize_email(settings, repo, "memo-1") == first
+    assert fetched == ["memo-1"] and len(repo.list_notes(limit=1000)) == notes
+
+    # the same body under another id reuses the summary but still records its own note
+    second = service.summarize_email(settings, repo, "memo-2")
+    assert second["summary"] == first["summary"] and second["note_id"] != first["note_id"]
+
+    # a summarizer change makes stored notes stale, so the message is summarized again
+    monkeypatch.setattr(service.summarizer, "SUMMARIZER_VERSION", "test-next")
+    third = service.summarize_email(settings, repo, "memo-1")
+    assert fetched == ["memo-1", "memo-2", "memo-1"] and third["note_id"] != first["note_id"]
+
+
+def _raw(body: str) -> str:
+    message = EmailMessage()
+    message["Subject"] = "Launch"
+    message.set_content(body)
+    return base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+
+
+def test_batch_summaries_run_on_the_pool_and_reuse_notes(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    fetched: list[list[str]] = []
+
+    def _get_raw_messages(settings, repo, message_ids):
+        fetched.append(list(message_ids))
+        return [
+            {"id": message_id, "error": "not found"} if message_id == "batch-missing" else {"id": message_id, "raw": _raw(BODY)}
+            for message_id in message_ids
+        ]
+
+    monkeypatch.setattr(service.gmail_client, "get_raw_messages", _get_raw_messages)
+    pooled = replace(settings, summarize_workers=2)
+    ids = ["batch-1", "batch-2", "batch-missing", "batch-1"]
+    first = service.summarize_emails(pooled, repo, ids)
+    assert [item["message_id"] for item in first["results"]] == ["batch-1", "batch-2", "batch-missing"]
+    assert (first["summarized"], first["cached"], first["failed"]) == (2, 0, 1)
+    assert first["results"][0]["summary"] == summarizer.summarize(BODY)
+
+    second = service.summarize_emails(pooled, repo, ["batch-1", "batch-2"])
+    assert fetched == [["batch-1", "batch-2", "batch-missing"]]
+    assert all(item["cached"] for item in second["results"])
+    assert [item["note_id"] for item in second["results"]] == [item["note_id"] for item in first["results"][:2]]
+
+
+def test_batch_reuses_summaries_by_content_and_reports_failures(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    other = "Pricing draft attached.\n\nPlease review the enterprise tier before Friday's board call."
+    bodies = {"dup-seed": BODY, "dup-missing": None, "dup-1": BODY, "dup-2": other, "dup-3": other}
+    summarize = summarizer.summarize
+    summarized: list[str] = []
+    progress: list[tuple[float, str]] = []
+
+    def _get_raw_messages(settings, repo, message_ids):
+        return [
+            {"id": message_id, "error": "not found"} if bodies[message_id] is None else {"id": message_id, "raw": _raw(bodies[message_id])}
+            for message_id in message_ids
+        ]
+
+    def _summarize(text):
+        summarized.append(text)
+        return summarize(text)
+
+    monkeypatch.setattr(service.gmail_client, "get_raw_messages", _get_raw_messages)
+    monkeypatch.setattr(service.summarizer, "summarize", _summarize)
+    monkeypatch.setattr(service, "report_progress", lambda done, total, message: progress.append((done, message)))
+    inline = replace(settings, summarize_workers=0)
+    service.summarize_emails(inline, repo, ["dup-seed"])
+    summarized.clear()
+    progress.clear()
+    # BODY is known under "dup-seed"; ``other`` appears twice in this batch
+    result = service.summarize_emails(inline, repo, list(bodies)[1:])
+
+    assert len(summarized) == 1 and "enterprise tier" in summarized[0]
+    assert result["results"][2]["summary"] == result["results"][3]["summary"]
+    assert (result["summarized"], result["failed"]) == (3, 1)
+    assert [done for done, _ in progress] == [1, 2, 3, 4]
+    assert progress[0][1] == "dup-missing: not found"
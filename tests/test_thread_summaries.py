@@ -0,0 +1,58 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import base64
+from email.message import EmailMessage
+
+from aios_cofounder_mcp.assistant import threads
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+PROPOSAL = "We propose a three year term at the discounted enterprise rate for all seats."
+
+
+def _raw(sender: str, body: str) -> str:
+    message = EmailMessage()
+    message["From"] = sender
+    message["Subject"] = "Deal"
+    message.set_content(body)
+    return base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+
+
+BODIES = {
+    "d1": ("ann@x.com", f"Hi Bob,\n\n{PROPOSAL}\n\nThanks,\nAnn"),
+    "d2": ("bob@y.com", f"Legal approved the redlines yesterday.\n\nOn Mon, Ann wrote:\n> {PROPOSAL}"),
+    # a forward that pastes the earlier paragraph without quote markers
+    "d3": ("ann@x.com", f"Sharing with finance.\n\n{PROPOSAL}"),
+}
+
+
+def test_refresh_folds_in_only_new_messages(monkeypatch) -> None:
+    repo = Repository(settings.db_url)
+    thread = {"id": "deal-1", "historyId": "100", "messages": [{"id": "d1"}, {"id": "d2"}]}
+    fetched: list[list[str]] = []
+
+    def _raw_messages(settings, repo, message_ids):
+        fetched.append(list(message_ids))
+        return [{"id": message_id, "internalDate": "1767261600000", "raw": _raw(*BODIES[message_id])} for message_id in message_ids]
+
+    monkeypatch.setattr(threads.gmail_client, "get_thread_index", lambda settings, repo, thread_id: thread)
+    monkeypatch.setattr(threads.gmail_client, "get_raw_messages", _raw_messages)
+
+    first = threads.summarize_thread(settings, repo, "deal-1")
+    assert (first["message_count"], first["new_messages"]) == (2, 2)
+    assert "three year term" in first["recent"][0]["summary"]
+    assert first["recent"][1]["summary"] == "Legal approved the redlines yesterday."
+
+    assert threads.summarize_thread(settings, repo, "deal-1")["new_messages"] == 0
+    assert fetched == [["d1", "d2"]]
+
+    thread["historyId"] = "120"
+    thread["messages"].append({"id": "d3"})
+    third = threads.summarize_thread(settings, repo, "deal-1")
+    assert fetched[-1] == ["d3"] and third["message_count"] == 3
+    assert third["latest"]["summary"] == "Sharing with finance."
@@ -0,0 +1,53 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import contextvars
+import json
+import threading
+
+from aios_cofounder_mcp.tracing import Tracer
+
+
+def test_nested_spans_share_trace_and_export(tmp_path) -> None:
+    export = tmp_path / "traces.jsonl"
+    tracer = Tracer(sample_rate=1.0, export_path=str(export))
+
+    with tracer.span("meeting_brief", "tool"):
+        with tracer.span("calendar.events.get", "google"):
+            pass
+        with tracer.span("gmail.users.messages.list", "google"):
+            pass
+
+    [trace] = tracer.recent()
+    root = trace[0]
+    assert root["name"] == "meeting_brief" and root["parent_id"] is None
+    assert {span["parent_id"] for span in trace[1:]} == {root["span_id"]}
+    assert {span["trace_id"] for span in trace} == {root["trace_id"]}
+
+    exported = json.loads(export.read_text().splitlines()[0])
+    spans = exported["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["meeting_brief", "calendar.events.get", "gmail.users.messages.list"]
+
+
+def test_unsampled_root_suppresses_children_and_threads_inherit_context() -> None:
+    tracer = Tracer(sample_rate=0.0)
+    with tracer.span("tool") as root:
+        with tracer.span("child") as child:
+            assert root is None and child is None
+    assert tracer.recent() == []
+
+    tracer.sample_rate = 1.0
+    with tracer.span("tool"):
+        context = contextvars.copy_context()
+
+        def work() -> None:
+            with tracer.span("worker"):
+                pass
+
+        thread = threading.Thread(target=context.run, args=(work,))
+        thread.start()
+        thread.join()
+    [trace] = tracer.recent()
+    assert [span["name"] for span in trace] == ["tool", "worker"]
+    assert trace[1]["parent_id"] == trace[0]["span_id"]
@@ -0,0 +1,83 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import dataclasses
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+from aios_cofounder_mcp.web import cache as web_cache
+from aios_cofounder_mcp.web import fetch as web_fetch
+
+init_db(settings.db_url)
+
+PAGE = "<html><head><title>{path}</title></head><body><p>{body}</p></body></html>"
+CACHE_HEADERS = {
+    "/fresh": {"Cache-Control": "max-age=600"},
+    "/etag": {"Cache-Control": "no-cache", "ETag": '"v1"'},
+    "/nostore": {"Cache-Control": "no-store", "ETag": '"v1"'},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: list[tuple[str, int]] = []
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        headers = CACHE_HEADERS.get(path, {"Cache-Control": "max-age=600"})
+        if headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+            self.hits.append((path, 304))
+            self.send_response(304)
+            self.send_header("ETag", headers["ETag"])
+            self.end_headers()
+            return
+        self.hits.append((path, 200))
+        body = PAGE.format(path=path, body="x" * 2000).encode("utf-8")
+        self.send_response(200)
+        for name, value in {**headers, "Content-Type": "text/html"}.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_fetch_honors_freshness_validators_and_size_cap() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    repo = Repository(settings.db_url)
+    try:
+        first = web_fetch.fetch(settings, repo, f"{base}/fresh?b=2&a=1")
+        again = web_fetch.fetch(settings, repo, f"HTTP://127.0.0.1:{server.server_port}/fresh?a=1&b=2#top")
+        assert (first["from_cache"], again["from_cache"]) == (False, True)
+        assert again["title"] == "/fresh" and again["text"] == first["text"]
+
+        assert [web_fetch.fetch(settings, repo, f"{base}/etag")["from_cache"] for _ in range(2)] == [False, True]
+        assert [web_fetch.fetch(settings, repo, f"{base}/nostore")["from_cache"] for _ in range(2)] == [False, False]
+        assert _Handler.hits == [("/fresh", 200), ("/etag", 200), ("/etag", 304), ("/nostore", 200), ("/nostore", 200)]
+
+        # each entry is a few hundred bytes compressed; a small cap keeps only the most recent ones
+        small = dataclasses.replace(settings, web_cache_max_bytes=5000)
+        for page in range(20):
+            web_fetch.fetch(small, repo, f"{base}/page{page}")
+        assert repo.get_web_cache(web_cache.normalize_url(f"{base}/page19"), 0) is not None
+        assert repo.get_web_cache(web_cache.normalize_url(f"{base}/page0"), 0) is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_freshness_rules() -> None:
+    now = 1_000_000.0
+    assert web_cache.fresh_until({"cache-control": "max-age=60", "age": "20"}, now) == now + 40
+    assert web_cache.fresh_until({"cache-control": "private, no-cache", "etag": '"a"'}, now) == now
+    assert web_cache.fresh_until({"cache-control": "no-cache"}, now) is None
+    assert web_cache.fresh_until({"etag": '"a"', "vary": "*"}, now) is None
+    assert web_cache.fresh_until({"expires": "0", "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, now) == now
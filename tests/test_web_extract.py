@@ -0,0 +1,88 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+import dataclasses
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+from aios_cofounder_mcp.web import fetch as web_fetch
+from aios_cofounder_mcp.web.extract import TextExtractor, extract
+
+init_db(settings.db_url)
+
+PAGE = """<!doctype html><html><head><title> Acme &amp; Co </title><script>var p = "<p>no</p>";</script></head>
+<body><nav><ul><li>Home</li><li>Pricing</li></ul></nav>
+<div class="cookie" role="dialog"><p>We use cookies</p></div>
+<article><h1>Quarterly   update</h1><p>Revenue grew <b>40%</b>.<p>Hiring<br>continues.</p>
+<input hidden><ul><li>Two new offices</li></ul></article>
+<footer><p>Copyright</p></footer></body></html>"""
+
+
+def test_extractor_keeps_content_blocks_and_drops_boilerplate() -> None:
+    assert extract(PAGE) == ("Acme & Co", "Quarterly update Revenue grew 40%. Hiring continues. Two new offices")
+
+    # chunk boundaries inside tags and entities do not change the result
+    parser = TextExtractor()
+    for start in range(0, len(PAGE), 7):
+        parser.feed(PAGE[start : start + 7])
+    parser.close()
+    assert parser.result() == extract(PAGE)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    user_agents: list[str] = []
+
+    def do_GET(self) -> None:
+        self.user_agents.append(self.headers.get("User-Agent", ""))
+        if self.path == "/report.pdf":
+            body, content_type = b"%PDF-1.7", "application/pdf"
+        else:
+            body, content_type = ("<p>" + "word " * 50_000 + "</p>").encode("utf-8"), "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", "max-age=600")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_fetch_caps_body_and_refuses_binary_types() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    repo = Repository(settings.db_url)
+    capped = dataclasses.replace(settings, web_fetch_max_bytes=10_000, web_user_agent="capped-agent/1.0")
+    try:
+        result = web_fetch.fetch(capped, repo, f"{base}/long")
+        assert result["truncated"] and len(result["text"]) < 10_000
+        # a truncated page is refetched rather than served from the cache
+        assert web_fetch.fetch(capped, repo, f"{base}/long")["from_cache"] is False
+        # the passed settings, not the shared client's defaults, pick the user agent
+        assert _Handler.user_agents == ["capped-agent/1.0"] * 2
+
+        with pytest.raises(RuntimeError, match="unsupported_content_type:application/pdf"):
+            web_fetch.fetch(settings, repo, f"{base}/report.pdf")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize(
+    ("html", "text"),
+    [
+        ("<ul><li hidden>menu<li>item</ul><p>Main article text.</p>", "item Main article text."),
+        ("<p hidden>x<p>Visible one.<p>Visible two.", "Visible one. Visible two."),
+        ("<div><nav><ul><li>Home<li>About</nav><p>Body</div><p>Tail", "Body Tail"),
+    ],
+)
+def test_implied_end_tags_close_skipped_elements(html: str, text: str) -> None:
+    assert extract(html) == (None, text)
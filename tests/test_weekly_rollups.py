@@ -0,0 +1,98 @@
+import os
+
+os.environ["DB_URL"] = "sqlite:///:memory:"
+
+from datetime import datetime, timedelta, timezone
+
+from aios_cofounder_mcp import rollups
+from aios_cofounder_mcp.settings import settings
+from aios_cofounder_mcp.storage.db import init_db
+from aios_cofounder_mcp.storage.repo import Repository
+
+init_db(settings.db_url)
+
+DAY = "2026-03-02"
+
+
+def _event(event_id: str, start: str, end: str, updated: str, attendees: list[str]) -> dict:
+    return {
+        "id": event_id,
+        "updated": updated,
+        "start": {"dateTime": f"{DAY}T{start}:00-05:00"},
+        "end": {"dateTime": f"{DAY}T{end}:00-05:00"},
+        "attendees": [{"email": "me@example.com", "self": True}] + [{"email": email} for email in attendees],
+    }
+
+
+def test_meeting_rollups_follow_synced_events() -> None:
+    repo = Repository(settings.db_url)
+    window = (f"{DAY}T00:00:00-05:00", f"{DAY}T23:59:00-05:00")
+    sync = [
+        _event("ev-1", "09:00", "10:00", "u1", ["Ann@x.com", "bob@x.com"]),
+        _event("ev-2", "13:00", "13:30", "u1", ["ann@x.com"]),
+    ]
+    rollups.record_events(repo, "roll-cal", sync, window)
+    rollups.record_events(repo, "roll-cal", sync, window)  # unchanged events are not counted twice
+    meetings = repo.weekly_rollups(DAY, DAY)["meetings"]
+    assert (meetings["total"], meetings["hours"]) == (2, 1.5)
+    assert meetings["top_attendees"][0] == {"attendee": "ann@x.com", "meetings": 2, "hours": 1.5}
+
+    # ev-1 moved to two hours; ev-2 disappeared from the next full listing
+    rollups.record_events(repo, "roll-cal", [_event("ev-1", "09:00", "11:00", "u2", ["bob@x.com"])], window)
+    meetings = repo.weekly_rollups(DAY, DAY)["meetings"]
+    assert (meetings["total"], meetings["hours"]) == (1, 2.0)
+    assert meetings["top_attendees"] == [{"attendee": "bob@x.com", "meetings": 1, "hours": 2.0}]
+
+
+def test_email_approval_and_note_rollups() -> None:
+    repo = Repository(settings.db_url)
+    today = datetime.now(timezone.utc)
+    stamp = str(int(today.timestamp() * 1000))
+    messages = [
+        {"id": "r-1", "internal_date": stamp, "label_ids": ["INBOX"], "headers": {"From": "Ann <ann@x.com>"}},
+        {"id": "s-1", "internal_date": stamp, "label_ids": ["SENT"], "headers": {"To": "ann@x.com, Cy <cy@x.com>"}},
+    ]
+    rollups.record_messages(repo, messages)
+    rollups.record_messages(repo, messages[:1])
+    approval_id = repo.create_approval("rollup_test", {"n": 1})
+    repo.resolve_approval(approval_id, "approved")
+    repo.add_note("rollup:test", "note")
+
+    day = today.date().isoformat()
+    data = repo.weekly_rollups((today - timedelta(days=6)).date().isoformat(), day)
+    assert (data["email"]["sent"], data["email"]["received"]) == (2, 1)
+    assert data["email"]["top_contacts"][0] == {"contact": "ann@x.com", "sent": 1, "received": 1}
+    assert data["approvals"].get("approved", 0) >= 1 and data["notes"]["created"] >= 1
+
+
+class _PagedEvents:
+    def __init__(self, pages: list[list[dict]]) -> None:
+        self.pages = pages
+
+    def list(self, pageToken=None, **params):
+        index = int(pageToken or 0)
+        page = {"items": self.pages[index]}
+        if index + 1 < len(self.pages):
+            page["nextPageToken"] = str(index + 1)
+        return type("Request", (), {"execute": lambda request: page})()
+
+
+def test_list_events_follows_every_page_before_pruning_the_window(monkeypatch) -> None:
+    from aios_cofounder_mcp.google import calendar
+
+    repo = Repository(settings.db_url)
+    window = (f"{DAY}T00:00:00-05:00", f"{DAY}T23:59:00-05:00")
+    pages = [[_event("pg-1", "09:00", "10:00", "u1", [])], [_event("pg-2", "11:00", "12:00", "u1", [])]]
+    service = type("Service", (), {"events": lambda service: _PagedEvents(pages)})()
+    monkeypatch.setattr(calendar, "_get_service", lambda settings, repo: service)
+
+    assert [event["id"] for event in calendar.list_events(settings, repo, *window, calendar_id="paged-cal")] == ["pg-1", "pg-2"]
+    facts = repo._conn().execute("SELECT event_id FROM calendar_event_facts WHERE calendar_id = 'paged-cal'").fetchall()
+    assert sorted(row["event_id"] for row in facts) == ["pg-1", "pg-2"]
+
+
+def test_weekly_review_data_is_not_treated_as_read_only() -> None:
+    from aios_cofounder_mcp.tools import assistant_tools, registry  # noqa: F401 - importing registers the tools
+
+    # refresh=true writes rollups and search rows, so batch_execute must not run it alongside other calls
+    assert registry["weekly_review_data"].read_only is False